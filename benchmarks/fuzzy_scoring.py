@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch fuzzy filename scoring against the per-file scoring loop
+
+Usage:
+    PYTHONPATH=. python benchmarks/fuzzy_scoring.py
+"""
+
+import random
+import string
+import timeit
+
+from fuzzywuzzy import fuzz
+
+from resume_mcp.utils.fuzzy import rank_filenames
+
+SIZES = [1_000, 10_000, 100_000]
+SEARCH_TERM = "Senior ML Engineer"
+MIN_SCORE = 60
+LIMIT = 10
+
+WORDS = ["engineer", "senior", "ml", "data", "meeting", "notes", "project",
+         "acme", "globex", "interview", "python", "backend", "review", "plan"]
+
+
+def make_stems(n: int) -> list:
+    """Generate n note names that look like a real vault"""
+    rng = random.Random(42)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(1, 4))) + " " +
+            "".join(rng.choices(string.ascii_lowercase, k=4))
+            for _ in range(n)]
+
+
+def loop_scoring(stems: list) -> list:
+    """The original approach: two fuzzywuzzy calls per file, then a full sort"""
+    scores = [
+        max(fuzz.ratio(SEARCH_TERM.lower(), stem.lower()),
+            fuzz.partial_ratio(SEARCH_TERM.lower(), stem.lower()))
+        for stem in stems
+    ]
+    matches = [(i, score) for i, score in enumerate(scores) if score > MIN_SCORE]
+    matches.sort(key=lambda x: x[1], reverse=True)
+    return matches[:LIMIT]
+
+
+def batch_scoring(stems_lower: list) -> list:
+    return rank_filenames(SEARCH_TERM.lower(), stems_lower,
+                          min_score=MIN_SCORE, limit=LIMIT)
+
+
+def main():
+    print(f"{'files':>8} {'loop (ms)':>12} {'batch (ms)':>12} {'speedup':>8}")
+    for n in SIZES:
+        stems = make_stems(n)
+        stems_lower = [stem.lower() for stem in stems]
+        repeat = max(1, 10_000 // n)
+
+        loop = min(timeit.repeat(lambda: loop_scoring(stems),
+                                 number=repeat, repeat=3)) / repeat
+        batch = min(timeit.repeat(lambda: batch_scoring(stems_lower),
+                                  number=repeat, repeat=3)) / repeat
+        print(f"{n:>8} {loop * 1000:>12.2f} {batch * 1000:>12.2f} {loop / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 Configuration settings for the Resume Tailoring MCP Server
 """
 
+import hashlib
 import os
 from pathlib import Path
 
@@ -25,10 +26,76 @@ OUTPUT_DIRECTORY = os.getenv(
 # Obsidian vault configuration
 OBSIDIAN_VAULT = os.getenv("OBSIDIAN_VAULT", "./obsidian_vault")
 
+# How the vault index follows file changes: auto, inotify, poll or off
+VAULT_WATCH_MODE = os.getenv("VAULT_WATCH_MODE", "auto")
+VAULT_POLL_INTERVAL = float(os.getenv("VAULT_POLL_INTERVAL", "2.0"))
+
+# Directories and files left out when walking the vault (.gitignore syntax,
+# comma-separated; the vault's own .gitignore applies too), and the threads
+# listing directories in parallel
+VAULT_IGNORE = [pattern.strip() for pattern in os.getenv(
+    "VAULT_IGNORE", ".obsidian,.trash,.git,.resume_mcp").split(",") if pattern.strip()]
+VAULT_WALK_WORKERS = int(os.getenv("VAULT_WALK_WORKERS", "8"))
+
+# Parallel fuzzy filename search: worker processes (0 disables the pool) and
+# number of filenames scored per worker task
+FUZZY_WORKERS = int(os.getenv("FUZZY_WORKERS", "0"))
+FUZZY_SHARD_SIZE = int(os.getenv("FUZZY_SHARD_SIZE", "25000"))
+
+# Size budget of the in-memory cache of note contents
+CONTENT_CACHE_BYTES = int(
+    os.getenv("CONTENT_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+# Threads doing vault file I/O for the (async) vault tools
+VAULT_IO_WORKERS = int(os.getenv("VAULT_IO_WORKERS", "8"))
+
+# Memoized fuzzy filename searches
+QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", "60"))
+QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "256"))
+
+# Where the indexes and caches of this vault are kept: next to the vault in
+# the user cache directory rather than in it, so that sync services don't
+# upload (and possibly corrupt) databases and PDFs. One folder per vault
+RESUME_MCP_CACHE_DIR = os.getenv("RESUME_MCP_CACHE_DIR", os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "resume_mcp",
+    hashlib.sha256(os.path.realpath(OBSIDIAN_VAULT).encode("utf-8")).hexdigest()[:16]))
+
+# SQLite full-text index persisted across restarts; set to "" to keep the
+# index in memory only
+VAULT_INDEX_DB = os.getenv(
+    "VAULT_INDEX_DB", os.path.join(RESUME_MCP_CACHE_DIR, "vault_index.db"))
+
+# Semantic (embedding) index of heading-level chunks; set to "" to disable
+SEMANTIC_INDEX_DIR = os.getenv(
+    "SEMANTIC_INDEX_DIR", os.path.join(RESUME_MCP_CACHE_DIR, "semantic"))
+SEMANTIC_DIM = int(os.getenv("SEMANTIC_DIM", "2048"))
+
 # LaTeX configuration
 LATEX_SERVER_URL = os.getenv("LATEX_SERVER_URL", "http://localhost:7474")
 LATEX_OUTPUT_DIR = os.getenv("LATEX_OUTPUT_DIR", "./templates/latex_output")
 
+# HTTP client of the LaTeX server: kept-alive connections per pool, and
+# timeouts in seconds for connecting, health checks and compiles
+LATEX_POOL_SIZE = int(os.getenv("LATEX_POOL_SIZE", "10"))
+LATEX_CONNECT_TIMEOUT = float(os.getenv("LATEX_CONNECT_TIMEOUT", "5"))
+LATEX_HEALTH_TIMEOUT = float(os.getenv("LATEX_HEALTH_TIMEOUT", "5"))
+LATEX_COMPILE_TIMEOUT = float(os.getenv("LATEX_COMPILE_TIMEOUT", "60"))
+
+# LaTeX server health: seconds a health probe stays current (and between
+# background probes), and the consecutive failures that make compiles fail
+# fast for LATEX_BREAKER_RESET seconds
+LATEX_HEALTH_TTL = float(os.getenv("LATEX_HEALTH_TTL", "30"))
+LATEX_BREAKER_THRESHOLD = int(os.getenv("LATEX_BREAKER_THRESHOLD", "3"))
+LATEX_BREAKER_RESET = float(os.getenv("LATEX_BREAKER_RESET", "30"))
+# Compiles of one compile_latex_batch call sent to the server at once
+LATEX_BATCH_CONCURRENCY = int(os.getenv("LATEX_BATCH_CONCURRENCY", "4"))
+# Compiled PDFs reused for identical LaTeX source (LRU, bounded to
+# LATEX_CACHE_BYTES); set to "" to always compile
+LATEX_CACHE_DIR = os.getenv(
+    "LATEX_CACHE_DIR", os.path.join(RESUME_MCP_CACHE_DIR, "pdf_cache"))
+LATEX_CACHE_BYTES = int(os.getenv("LATEX_CACHE_BYTES", str(256 * 1024 * 1024)))
+
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
@@ -60,7 +127,32 @@ __all__ = [
     'OUTPUT_DIRECTORY',
     'LATEX_COMPILER',
     'LATEX_OUTPUT_DIR',
+    'LATEX_SERVER_URL',
+    'LATEX_POOL_SIZE',
+    'LATEX_CONNECT_TIMEOUT',
+    'LATEX_HEALTH_TIMEOUT',
+    'LATEX_COMPILE_TIMEOUT',
+    'LATEX_HEALTH_TTL',
+    'LATEX_BREAKER_THRESHOLD',
+    'LATEX_BREAKER_RESET',
+    'LATEX_BATCH_CONCURRENCY',
+    'LATEX_CACHE_DIR',
+    'LATEX_CACHE_BYTES',
     'OBSIDIAN_VAULT',
+    'VAULT_WATCH_MODE',
+    'VAULT_POLL_INTERVAL',
+    'RESUME_MCP_CACHE_DIR',
+    'VAULT_INDEX_DB',
+    'VAULT_IGNORE',
+    'VAULT_WALK_WORKERS',
+    'FUZZY_WORKERS',
+    'FUZZY_SHARD_SIZE',
+    'CONTENT_CACHE_BYTES',
+    'VAULT_IO_WORKERS',
+    'QUERY_CACHE_TTL',
+    'QUERY_CACHE_SIZE',
+    'SEMANTIC_INDEX_DIR',
+    'SEMANTIC_DIM',
     'LOG_LEVEL',
     'validate_paths'
 ]
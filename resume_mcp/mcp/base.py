@@ -3,24 +3,62 @@ Base MCP Server Configuration and Lifespan Management
 """
 
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import cast
+from typing import Optional, Union, cast
 
 from mcp.server.fastmcp import FastMCP
 
 from ..config import (
     BASELINE_RESUME_PATH,
+    CONTENT_CACHE_BYTES,
+    FUZZY_SHARD_SIZE,
+    FUZZY_WORKERS,
     PROMPT_TEMPLATE_PATH,
+    QUERY_CACHE_SIZE,
+    QUERY_CACHE_TTL,
+    LATEX_BREAKER_RESET,
+    LATEX_BREAKER_THRESHOLD,
+    LATEX_CACHE_BYTES,
+    LATEX_CACHE_DIR,
+    LATEX_HEALTH_TTL,
     LATEX_TEMPLATE_PATH,
     OUTPUT_DIRECTORY,
     LATEX_OUTPUT_DIR,
-    SERVER_NAME
+    OBSIDIAN_VAULT,
+    SEMANTIC_DIM,
+    SEMANTIC_INDEX_DIR,
+    SERVER_NAME,
+    VAULT_IGNORE,
+    VAULT_INDEX_DB,
+    VAULT_IO_WORKERS,
+    VAULT_WALK_WORKERS,
+    VAULT_POLL_INTERVAL,
+    VAULT_WATCH_MODE
 )
+from ..utils.content_index import ContentIndex
+from ..utils.file_cache import ContentCache
+from ..utils.io_pool import offload
+from ..utils.latex import AsyncLatexClient, LatexClient
+from ..utils.latex_health import LatexHealthMonitor
+from ..utils.link_graph import LinkGraph
+from ..utils.note_metadata import MetadataIndex
+from ..utils.pdf_cache import PdfCache
 from ..utils.prompt_manager import PromptTemplateManager
+from ..utils.query_cache import QueryCache
+from ..utils.result_sets import ResultSetCache
 from ..utils.resume_manager import ResumeManager
+from ..utils.semantic import SemanticIndex
+from ..utils.vault_index import VaultIndex
+from ..utils.vault_listing import VaultListing
+from ..utils.vault_store import VaultStore, fts5_available
+from ..utils.vault_walk import VaultWalker
+from ..utils.vault_watcher import VaultWatcher
+from ..utils.vault_writer import VaultWriter
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -32,6 +70,22 @@ class AppContext:
     prompt_manager: PromptTemplateManager
     resume_manager: ResumeManager
     output_directory: Path
+    vault_index: Optional[VaultIndex] = None
+    content_index: Optional[Union[ContentIndex, VaultStore]] = None
+    metadata_index: Optional[MetadataIndex] = None
+    link_graph: Optional[LinkGraph] = None
+    fuzzy_pool: Optional[ProcessPoolExecutor] = None
+    io_pool: Optional[ThreadPoolExecutor] = None
+    content_cache: ContentCache = field(default_factory=ContentCache)
+    semantic_index: Optional[SemanticIndex] = None
+    result_sets: ResultSetCache = field(default_factory=ResultSetCache)
+    query_cache: QueryCache = field(default_factory=QueryCache)
+    vault_writer: Optional[VaultWriter] = None
+    vault_listing: Optional[VaultListing] = None
+    latex_client: Optional[LatexClient] = None
+    latex_async_client: Optional[AsyncLatexClient] = None
+    latex_health: Optional[LatexHealthMonitor] = None
+    pdf_cache: Optional[PdfCache] = None
 
 
 @asynccontextmanager
@@ -59,14 +113,128 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     else:
         logger.warning(f"LaTeX template validation: ⚠️ {message}")
 
+    # Keep-alive connections to the LaTeX server, shared by all compiles
+    latex_client = LatexClient()
+    # The same for coroutines, so compiles don't block the event loop
+    latex_async_client = AsyncLatexClient()
+    # Server health, probed in the background so compiles needn't check first
+    latex_health = LatexHealthMonitor(
+        latex_client, ttl=LATEX_HEALTH_TTL, failure_threshold=LATEX_BREAKER_THRESHOLD,
+        reset_timeout=LATEX_BREAKER_RESET).start()
+    # PDFs of earlier compiles, so identical source isn't compiled twice
+    pdf_cache = None
+    if LATEX_CACHE_DIR:
+        try:
+            pdf_cache = PdfCache(LATEX_CACHE_DIR, LATEX_CACHE_BYTES)
+        except OSError as e:
+            logger.warning(f"Cannot open PDF cache in {LATEX_CACHE_DIR}: {e}")
+
+    # Worker processes for fuzzy search on very large vaults. Spawned rather
+    # than forked, since the vault watcher runs in a thread
+    fuzzy_pool = None
+    if FUZZY_WORKERS > 0:
+        fuzzy_pool = ProcessPoolExecutor(
+            max_workers=FUZZY_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        logger.info(f"Fuzzy search pool started with {FUZZY_WORKERS} workers")
+
+    # Threads the async vault tools run their file I/O on
+    io_pool = ThreadPoolExecutor(
+        max_workers=VAULT_IO_WORKERS, thread_name_prefix="vault-io")
+
+    # Index the vault once so searches don't walk it on every call; the
+    # walker skips ignored directories and is shared by every vault listing
+    vault_walker = VaultWalker(
+        OBSIDIAN_VAULT, VAULT_IGNORE, workers=VAULT_WALK_WORKERS)
+    vault_index = VaultIndex(
+        OBSIDIAN_VAULT, executor=fuzzy_pool, shard_size=FUZZY_SHARD_SIZE,
+        walker=vault_walker).build()
+
+    # Full-text index: persisted in SQLite when possible so a restart only
+    # re-reads the notes that changed, in memory otherwise
+    content_index = None
+    if VAULT_INDEX_DB and vault_index.vault_path.is_dir() and fts5_available():
+        try:
+            content_index = VaultStore(
+                VAULT_INDEX_DB, OBSIDIAN_VAULT).build(vault_index)
+        except Exception as e:
+            logger.warning(
+                f"Cannot open vault index database {VAULT_INDEX_DB}: {e}")
+    if content_index is None:
+        content_index = ContentIndex(OBSIDIAN_VAULT).build(vault_index)
+
+    # Frontmatter properties, tags and wikilinks, for filtered searches;
+    # loaded from the vault store when there is one, so it subscribes after
+    metadata_index = MetadataIndex(
+        OBSIDIAN_VAULT,
+        store=content_index if isinstance(content_index, VaultStore) else None).build(vault_index)
+    link_graph = LinkGraph(OBSIDIAN_VAULT, metadata_index).build(vault_index)
+
+    # Directory listing behind the obsidian://vault_index resources
+    vault_listing = VaultListing(OBSIDIAN_VAULT).build(vault_index)
+
+    # Saves happen atomically on a background thread; saved notes are
+    # indexed as soon as they are on disk
+    vault_writer = VaultWriter(on_written=vault_index.add_file)
+
+    # Embeddings of heading-level chunks; only changed notes are re-embedded
+    semantic_index = None
+    if SEMANTIC_INDEX_DIR and vault_index.vault_path.is_dir():
+        try:
+            semantic_index = SemanticIndex(
+                SEMANTIC_INDEX_DIR, OBSIDIAN_VAULT, dim=SEMANTIC_DIM).build(vault_index)
+        except Exception as e:
+            logger.warning(
+                f"Cannot open semantic index in {SEMANTIC_INDEX_DIR}: {e}")
+
+    # Notes read by the tools, shared across requests
+    content_cache = ContentCache(CONTENT_CACHE_BYTES)
+    query_cache = QueryCache(QUERY_CACHE_TTL, QUERY_CACHE_SIZE)
+
+    # Keep the index current as notes are added, renamed or deleted
+    vault_watcher = None
+    if VAULT_WATCH_MODE != "off" and vault_index.vault_path.is_dir():
+        vault_watcher = VaultWatcher(
+            vault_index, mode=VAULT_WATCH_MODE, poll_interval=VAULT_POLL_INTERVAL).start()
+
     try:
         yield AppContext(
             prompt_manager=prompt_manager,
             resume_manager=resume_manager,
-            output_directory=output_directory
+            output_directory=output_directory,
+            vault_index=vault_index,
+            content_index=content_index,
+            metadata_index=metadata_index,
+            link_graph=link_graph,
+            fuzzy_pool=fuzzy_pool,
+            io_pool=io_pool,
+            content_cache=content_cache,
+            query_cache=query_cache,
+            semantic_index=semantic_index,
+            vault_writer=vault_writer,
+            vault_listing=vault_listing,
+            latex_client=latex_client,
+            latex_async_client=latex_async_client,
+            latex_health=latex_health,
+            pdf_cache=pdf_cache
         )
     finally:
         logger.info("Shutting down Resume Tailoring MCP Server...")
+        if vault_watcher is not None:
+            vault_watcher.stop()
+        io_pool.shutdown(cancel_futures=True)
+        # After the tools have stopped, so nothing they queued is lost
+        vault_writer.close()
+        # Only now: flushed writes still update the indexes through vault_index
+        if isinstance(content_index, VaultStore):
+            content_index.close()
+        if semantic_index is not None:
+            semantic_index.close()
+        vault_walker.close()
+        latex_health.stop(timeout=1)
+        latex_client.close()
+        await latex_async_client.aclose()
+        if fuzzy_pool is not None:
+            fuzzy_pool.shutdown(cancel_futures=True)
 
 # Create the FastMCP server instance - THIS IS THE KEY!
 mcp = FastMCP(SERVER_NAME, lifespan=app_lifespan)
@@ -81,3 +249,7 @@ def get_app_context() -> AppContext:
     """Get the application context from the MCP server"""
     ctx = mcp.get_context()
     return cast(AppContext, ctx.request_context.lifespan_context)
+
+
+# Decorator for tools whose blocking body should run on the vault I/O pool
+vault_io = offload(lambda: get_app_context().io_pool)
@@ -37,37 +37,46 @@ def list_vault_files() -> str:
         return f"❌ Obsidian vault not found at: {OBSIDIAN_VAULT}"
 
     try:
-        md_files = []
-        for file_path in vault_path.rglob("*.md"):
-            relative_path = file_path.relative_to(vault_path)
-            md_files.append(str(relative_path))
+        ctx = mcp.get_context()
+        app_ctx = cast(AppContext, ctx.request_context.lifespan_context)
+        listing = app_ctx.vault_listing
 
-        md_files.sort()
-
-        if not md_files:
+        if not len(listing):
             return f"No markdown files found in vault: {OBSIDIAN_VAULT}"
 
-        files_by_dir = {}
-        for file_path in md_files:
-            dir_name = str(Path(file_path).parent) if Path(
-                file_path).parent != Path('.') else "Root"
-            if dir_name not in files_by_dir:
-                files_by_dir[dir_name] = []
-            files_by_dir[dir_name].append(Path(file_path).name)
+        # Kept up to date by the vault index and cached until files come or go
+        return listing.render()
 
-        result = f"""# Obsidian Vault File List
+    except Exception as e:
+        logger.error(f"Error listing vault files: {e}")
+        return f"❌ Error listing files: {str(e)}"
 
-**Vault Path:** {vault_path}
-**Total Files:** {len(md_files)}
 
-"""
+@mcp.resource("obsidian://vault_index/{page}", name="Obsidian Vault File Index (paged)")
+def list_vault_files_page(page: str) -> str:
+    """
+    List one page of the markdown files in the Obsidian vault.
 
-        for dir_name, files in sorted(files_by_dir.items()):
-            result += f"\n## {dir_name}\n"
-            for file in sorted(files):
-                result += f"- {file}\n"
+    Args:
+        page (str): The page number, starting at 1.
 
-        return result
+    Returns:
+        The files on the page, grouped by directory
+    """
+    vault_path = Path(OBSIDIAN_VAULT)
+
+    if not vault_path.exists():
+        return f"❌ Obsidian vault not found at: {OBSIDIAN_VAULT}"
+
+    try:
+        ctx = mcp.get_context()
+        app_ctx = cast(AppContext, ctx.request_context.lifespan_context)
+        listing = app_ctx.vault_listing
+
+        text = listing.render_page(int(page)) if page.isdigit() else None
+        if text is None:
+            return f"❌ No page '{page}': the vault index has pages 1 to {listing.page_count}"
+        return text
 
     except Exception as e:
         logger.error(f"Error listing vault files: {e}")
@@ -1,16 +1,18 @@
 
+import asyncio
 import os
 from typing import Optional
 
 from resume_mcp.config import OBSIDIAN_VAULT
 from resume_mcp.utils.cv import autogenerate_cv, generate_cv_tailoring_prompt as gen_cv_prompt
+from resume_mcp.utils.vault_writer import write_file
 from ..base import get_app_context, mcp
 
 
 @mcp.tool(
     name="generate_cv_prompt",
     description="Generates and saves a CV tailoring prompt in the Obsidian Vault")
-def generate_cv_tailoring_prompt(
+async def generate_cv_tailoring_prompt(
         job_description: str,
         company: str,
         position: str,
@@ -35,7 +37,7 @@ def generate_cv_tailoring_prompt(
     Returns
     -------
     str
-        A success message confirming where the prompt was saved
+        A message confirming where the prompt was saved, or why saving failed
 
     Notes
     -----
@@ -54,8 +56,11 @@ def generate_cv_tailoring_prompt(
         raise Exception(
             f"Prompt directory '{prompt_dir}' does not exist, please create it before using this tool.")
     output_file = os.path.join(OBSIDIAN_VAULT, "prompts", f"{prompt_name}.md")
-    with open(output_file, mode='+w') as f:
-        f.write(tailored_prompt)
+    # Written atomically by the background writer; wait for it to land
+    try:
+        await asyncio.wrap_future(write_file(output_file, tailored_prompt, app_ctx.vault_writer))
+    except OSError as e:
+        return f"❌ Failed to save prompt to '{output_file}': {e}"
     return f"✅ Prompt successfully saved prompt to '{output_file}'"
 
 
@@ -1,31 +1,28 @@
 import logging
 import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from resume_mcp import mcp
-from resume_mcp.config import OBSIDIAN_VAULT
-from resume_mcp.utils.latex import compile_latex, check_latex_server
-from resume_mcp.mcp.base import mcp
+from resume_mcp.config import LATEX_BATCH_CONCURRENCY, OBSIDIAN_VAULT
+from resume_mcp.utils.latex import compile_latex_async, compile_latex_batch
+from resume_mcp.mcp.base import get_app_context, mcp
 
 logger = logging.getLogger(__name__)
 
 
-@mcp.tool(
-    name="compile_latex",
-    description="Compiles LaTeX content and saves it into the user's vault in pdf format using a Docker-based LaTeX server."
-)
-def compile_latex_tool(content: str, filename: str, vault_dir: Optional[str], replace: bool = True) -> str:
+def _pdf_destination(filename: str, vault_dir: Optional[str], replace: bool) -> Tuple[str, Optional[str]]:
     """
-    Compiles LaTeX content into a PDF and saves it in the Obsidian vault.
-    Uses a local Docker-based LaTeX compilation server for processing.
+    Resolve where in the vault a compiled PDF goes.
 
     Args:
-        content (str): The CV content in LaTeX format
-        filename (str): The name of the file to save (file extension will be forced to .pdf) 
-        vault_dir (str): Directory within the Obsidian vault to save the PDF
-        replace (bool): Whether to replace existing file, defaults to True
+        filename (str): The file name (its extension is forced to .pdf)
+        vault_dir (str, optional): Directory within the Obsidian vault
+        replace (bool): Whether an existing file may be replaced
+
     Returns:
-        str: Status message indicating success or failure
+        Tuple[str, Optional[str]]: The full path, and an error message if the
+            PDF can't be saved there.
     """
     vault_path = Path(OBSIDIAN_VAULT)
 
@@ -41,23 +38,49 @@ def compile_latex_tool(content: str, filename: str, vault_dir: Optional[str], re
 
     # Check if file exists and replace flag
     if os.path.exists(full_path) and not replace:
-        return f"❌ File {pdf_filename} already exists and replace=False."
+        return full_path, f"File {pdf_filename} already exists and replace=False."
 
     # Check that the output directory exists
     if not os.path.exists(output_dir):
-        return f"❌ Output directory '{output_dir}' does not exist. Create it first, and try again."
+        return full_path, f"Output directory '{output_dir}' does not exist. Create it first, and try again."
+
+    return full_path, None
+
+
+@mcp.tool(
+    name="compile_latex",
+    description="Compiles LaTeX content and saves it into the user's vault in pdf format using a Docker-based LaTeX server."
+)
+async def compile_latex_tool(content: str, filename: str, vault_dir: Optional[str], replace: bool = True) -> str:
+    """
+    Compiles LaTeX content into a PDF and saves it in the Obsidian vault.
+    Uses a local Docker-based LaTeX compilation server for processing. The
+    compile is awaited, so other requests are served while it runs, and
+    source compiled before is served from the PDF cache, even while the
+    server is down.
+
+    Args:
+        content (str): The CV content in LaTeX format
+        filename (str): The name of the file to save (file extension will be forced to .pdf) 
+        vault_dir (str): Directory within the Obsidian vault to save the PDF
+        replace (bool): Whether to replace existing file, defaults to True
+    Returns:
+        str: Status message indicating success or failure
+    """
+    full_path, error = _pdf_destination(filename, vault_dir, replace)
+    if error:
+        return f"❌ {error}"
 
-    # Quick server health check before attempting compilation
-    server_status = check_latex_server()
-    if not server_status["available"]:
-        return f"❌ LaTeX Server Error: {server_status['message']}\n💡 Start the server with: docker-compose up -d"
+    app_ctx = get_app_context()
 
     # Log compilation attempt
     logger.info(
         f"Calling `compile_latex` via HTTP server to destination '{full_path}'")
 
     # Compile LaTeX using HTTP server
-    result = compile_latex(content=content, dest=full_path)
+    result = await compile_latex_async(
+        content=content, dest=full_path, client=app_ctx.latex_async_client,
+        monitor=app_ctx.latex_health, cache=app_ctx.pdf_cache)
 
     # Process result
     if "error" in result:
@@ -67,6 +90,72 @@ def compile_latex_tool(content: str, filename: str, vault_dir: Optional[str], re
     return f"❓ Unexpected result from LaTeX compilation: {result}"
 
 
+@mcp.tool(
+    name="compile_latex_batch",
+    description="Compiles several LaTeX documents concurrently and saves them into the user's vault in pdf format."
+)
+async def compile_latex_batch_tool(
+        documents: List[Dict[str, str]],
+        replace: bool = True,
+        max_concurrency: Optional[int] = None) -> str:
+    """
+    Compiles many LaTeX documents into PDFs in the Obsidian vault at once.
+
+    Up to max_concurrency compiles are sent to the LaTeX server at the same
+    time, so the batch takes about as long as its slowest document instead
+    of the sum of all of them. Progress is reported as each one finishes.
+
+    Args:
+        documents (List[Dict[str, str]]): One {"content", "filename", "vault_dir"}
+            dict per PDF, as for compile_latex ("vault_dir" is optional)
+        replace (bool): Whether to replace existing files, defaults to True
+        max_concurrency (int, optional): Compiles in flight at once, defaults
+            to LATEX_BATCH_CONCURRENCY
+    Returns:
+        str: One status line per document, in the order they finished
+    """
+    if not documents:
+        return "❌ No documents to compile."
+
+    app_ctx = get_app_context()
+    ctx = mcp.get_context()
+    lines: List[Optional[str]] = [None] * len(documents)
+    items, positions = [], []
+    for position, document in enumerate(documents):
+        if not document.get("content") or not document.get("filename"):
+            lines[position] = f"❌ [{position + 1}] Missing 'content' or 'filename'"
+            continue
+        full_path, error = _pdf_destination(
+            document["filename"], document.get("vault_dir"), replace)
+        if error:
+            lines[position] = f"❌ [{position + 1}] {error}"
+            continue
+        items.append((document["content"], full_path))
+        positions.append(position)
+
+    logger.info(f"Compiling a batch of {len(items)} LaTeX documents")
+    finished = []
+    compiled = 0
+    start = time.perf_counter()
+    async for index, result in compile_latex_batch(
+            items, app_ctx.latex_async_client,
+            max_concurrency=max_concurrency or LATEX_BATCH_CONCURRENCY,
+            monitor=app_ctx.latex_health, cache=app_ctx.pdf_cache):
+        elapsed = time.perf_counter() - start
+        position = positions[index]
+        if "success" in result:
+            compiled += 1
+            finished.append(
+                f"✅ [{position + 1}] {result['success']['dest']} ({elapsed:.1f}s)")
+        else:
+            finished.append(f"❌ [{position + 1}] {result['error']} ({elapsed:.1f}s)")
+        await ctx.report_progress(len(finished), len(items))
+
+    summary = (f"{'✅' if compiled == len(documents) else '❌'} Compiled {compiled} of "
+               f"{len(documents)} PDFs in {time.perf_counter() - start:.1f}s")
+    return "\n".join([summary] + [line for line in lines if line] + finished)
+
+
 @mcp.tool(
     name="check_latex_server_status",
     description="Check if the LaTeX compilation server is running and healthy."
@@ -75,10 +164,17 @@ def check_latex_server_tool() -> str:
     """
     Check the status of the LaTeX compilation server.
 
+    Reports the cached result of the last health probe (refreshed in the
+    background), its latency and the state of the circuit breaker.
+
     Returns:
         str: Status message about the server health and capabilities
     """
-    status = check_latex_server()
+    app_ctx = get_app_context()
+    status = app_ctx.latex_health.snapshot()
+    endpoint = app_ctx.latex_client.base_url
+    probe_info = (f"⏱️ Last Probe: {status['latency_ms']} ms, {status['age_seconds']}s ago\n"
+                  f"🔌 Circuit: {status['circuit']} ({status['consecutive_failures']} consecutive failures)\n")
 
     if status["available"]:
         details = status["details"]
@@ -89,15 +185,40 @@ def check_latex_server_tool() -> str:
         return (f"✅ LaTeX Server Status: {status['message']}\n"
                 f"🔧 Server Health: {server_status}\n"
                 f"📦 pdflatex: {pdflatex_status}\n"
-                f"🌐 Endpoint: http://localhost:7474")
+                f"{probe_info}"
+                f"🌐 Endpoint: {endpoint}")
     else:
         error_info = status["details"].get("error", "Unknown error")
         return (f"❌ LaTeX Server Status: {status['message']}\n"
                 f"🔍 Error Details: {error_info}\n"
+                f"{probe_info}"
                 f"💡 To start the server:\n"
                 f"   1. Navigate to your latex-server directory\n"
                 f"   2. Run: docker-compose up -d\n"
-                f"   3. Verify with: curl http://localhost:7474/health")
+                f"   3. Verify with: curl {endpoint}/health")
+
+
+@mcp.tool(
+    name="latex_cache_stats",
+    description="Show hit/miss statistics of the compiled PDF cache."
+)
+def latex_cache_stats() -> str:
+    """
+    Report how often compiles were served from the PDF cache.
+
+    Returns:
+        str: Hits, misses, bytes saved and the size of the cache
+    """
+    cache = get_app_context().pdf_cache
+    if cache is None:
+        return "❌ The PDF cache is disabled. Set LATEX_CACHE_DIR to enable it."
+
+    stats = cache.stats()
+    return (f"✅ PDF Cache: {cache.directory}\n"
+            f"🎯 Hits / Misses: {stats['hits']} / {stats['misses']} ({stats['hit_ratio']:.0%} hit ratio)\n"
+            f"💾 Bytes saved: {stats['bytes_saved']}\n"
+            f"📦 Cached PDFs: {stats['entries']} ({stats['bytes']} of {stats['max_bytes']} bytes)\n"
+            f"🗑️ Stored / Evicted: {stats['stores']} / {stats['evictions']}")
 
 
 @mcp.tool(
@@ -60,7 +60,8 @@ def get_server_status() -> str:
         baseline_length = len(app_ctx.resume_manager.get_baseline_content())
         latex_template_length = len(
             app_ctx.prompt_manager.get_latex_template() or "")
-        pdflatex_available = check_pdflatex()
+        latex_status = app_ctx.latex_health.snapshot()
+        pdflatex_available = check_pdflatex(app_ctx.latex_client, app_ctx.latex_health)
 
         return f"""# Resume Tailoring Server Status
 
@@ -72,6 +73,7 @@ def get_server_status() -> str:
 - **Output Directory:** {app_ctx.output_directory}
 - **LaTeX Output Directory:** {LATEX_OUTPUT_DIR}
 - **pdflatex available:** {'✅' if pdflatex_available else '❌'}
+- **LaTeX server:** {latex_status['message']} (last probe {latex_status['latency_ms']} ms, {latex_status['age_seconds']}s ago; circuit {latex_status['circuit']})
 
 ## File Status
 - **Baseline Resume:** {'✅ Found' if resume_exists else '❌ Not Found'}
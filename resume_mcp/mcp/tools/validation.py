@@ -114,11 +114,11 @@ def debug_resources() -> str:
 """
 
         if vault_path.exists() and vault_path.is_dir():
-            # Count markdown files
-            md_files = list(vault_path.rglob("*.md"))
+            # Count the indexed markdown files, which leave out ignored directories
+            md_files = get_app_context().vault_index.relative_paths()
             debug_info += f"""## Vault Contents
 - **Total .md files:** {len(md_files)}
-- **Sample files:** {', '.join([f.name for f in md_files[:5]])}
+- **Sample files:** {', '.join([Path(f).name for f in md_files[:5]])}
 """
 
         # Try to access the MCP server context to see registered resources
@@ -128,6 +128,20 @@ def debug_resources() -> str:
 ## MCP Context
 - **Context Available:** ✅ Yes
 - **Request Context:** {hasattr(ctx, 'request_context')}
+"""
+            app_ctx = get_app_context()
+            cache_stats = app_ctx.content_cache.stats()
+            query_stats = app_ctx.query_cache.stats()
+            debug_info += f"""
+## Content Cache
+- **Hits / Misses:** {cache_stats['hits']} / {cache_stats['misses']} ({cache_stats['hit_ratio']:.0%} hit ratio)
+- **Evictions:** {cache_stats['evictions']}
+- **Cached files:** {cache_stats['entries']} ({cache_stats['bytes']} of {cache_stats['max_bytes']} bytes)
+
+## Query Cache
+- **Hits / Misses:** {query_stats['hits']} / {query_stats['misses']} ({query_stats['hit_ratio']:.0%} hit ratio)
+- **Evictions / Expirations:** {query_stats['evictions']} / {query_stats['expirations']}
+- **Cached searches:** {query_stats['entries']}
 """
         except Exception as e:
             debug_info += f"""
@@ -156,8 +170,20 @@ To test your Obsidian resources, try:
 
 
 @mcp.tool(name="check_pdflatex", description="Checks whether pdflatex is installed on the user's system")
-def check_pdflatex_tool() -> bool:
-    return check_pdflatex()
+def check_pdflatex_tool() -> dict:
+    """
+    Check whether pdflatex is available on the LaTeX server, from the cached health status.
+
+    Returns:
+        Dictionary with "pdflatex_available" and the server status snapshot,
+        including the latency of the last health probe
+    """
+    app_ctx = get_app_context()
+    status = app_ctx.latex_health.snapshot()
+    return {
+        "pdflatex_available": check_pdflatex(app_ctx.latex_client, app_ctx.latex_health),
+        **status
+    }
 
 
 @mcp.tool(name="check_latex_server", description="Checks if the LaTeX compilation server is available")
@@ -170,6 +196,7 @@ def check_latex_server_tool():
         - available: whether the server is running
         - message: status message
         - details: additional server information (if available)
+        - latency_ms, age_seconds: latency and age of the last health probe
+        - circuit: "closed", "open" (compiles fail fast) or "half-open"
     """
-    from resume_mcp.utils.latex import check_latex_server
-    return check_latex_server()
+    return get_app_context().latex_health.snapshot()
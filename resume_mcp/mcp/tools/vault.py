@@ -5,51 +5,125 @@ Obsidian Vault Tools (not Resources)
 import os
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set, Union
 
+from resume_mcp.utils.chunks import Chunk, rank_chunks, read_chunk, split_chunks
+from resume_mcp.utils.io_pool import check_cancelled
 from resume_mcp.utils.latex import compile_latex
-from resume_mcp.utils.vault import fuzzy_search_vault_files
+from resume_mcp.utils.note_metadata import parse_filter_list
+from resume_mcp.utils.result_sets import decode_cursor, encode_cursor
+from resume_mcp.utils.vault import fuzzy_search_vault_files, read_vault_files as read_files
+from resume_mcp.utils.vault_index import subdir_prefix
+from resume_mcp.utils.vault_writer import write_file
 
 from ...config import OBSIDIAN_VAULT
-from ..base import mcp
+from ..base import get_app_context, mcp, vault_io
 
 logger = logging.getLogger(__name__)
 
+# How much of each note fuzzy_search_vault shows when include_content is set
+PREVIEW_BYTES = 1000
 
-@mcp.tool(
-    name="search_job_description",
-    description="Search through the user's vault for notes matching a job description or term")
-def search_job_description(search_param: str, limit=10) -> str:
+# How much of each chunk semantic_search_vault shows
+CHUNK_CHARS = 1500
+
+# Largest page search_job_description returns in one call
+MAX_PAGE_SIZE = 20
+
+
+def _metadata_filter(app_ctx, tag: str, property: str) -> Optional[Set[str]]:
     """
-    Search through the user's vault for notes matching the job description.
+    Resolve the tag and property arguments of a search tool.
 
     Args:
-        job_description: Search term to match against filenames
+        app_ctx (AppContext): The application context.
+        tag (str): Comma-separated tags the notes must all carry.
+        property (str): Comma-separated `key`, `key=value` or `key=prefix*` conditions.
 
     Returns:
-        Content of matching notes or list of available files if no matches
+        Optional[Set[str]]: Vault-relative paths of the matching notes, or None
+            if no filter was given.
     """
+    tags, properties = parse_filter_list(tag), parse_filter_list(property)
+    if not tags and not properties:
+        return None
+    return app_ctx.metadata_index.filter(tags=tags, properties=properties)
 
-    if not search_param.strip():
-        return "❌ Job description parameter cannot be empty"
-
-    vault_path = Path(OBSIDIAN_VAULT)
 
-    # Check if vault exists
-    if not vault_path.exists():
-        return f"❌ Obsidian vault not found at: {OBSIDIAN_VAULT}\nSet OBSIDIAN_VAULT environment variable to your vault path"
+@mcp.tool(
+    name="search_job_description",
+    description="Search through the user's vault for notes matching a job description or term. "
+    "Results are paged; pass the returned cursor to get the next page.")
+@vault_io
+def search_job_description(
+        search_param: str = "",
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        page_size: int = 5,
+        tag: str = "",
+        property: str = "",
+        expand_hops: int = 0,
+        expand_bytes: int = 200_000,
+        max_chars: int = 0,
+        query: str = "") -> str:
+    """
+    Search through the user's vault for notes matching the job description.
 
-    if not vault_path.is_dir():
-        return f"❌ Obsidian vault path is not a directory: {OBSIDIAN_VAULT}"
+    The matches are resolved once and kept for a few minutes, so asking for
+    the next page with the returned cursor doesn't search again. Only the
+    notes on the requested page are read.
 
-    results = fuzzy_search_vault_files(
-        search_param, min_score=50, limit=20)
+    Args:
+        search_param: Search term to match against filenames
+        limit: Maximum number of matching notes to page through
+        cursor: Cursor from a previous page; search_param is ignored when given
+        page_size: Number of notes to show per page
+        tag: Comma-separated tags the notes must carry, e.g. "applied,remote"
+        property: Comma-separated frontmatter conditions, e.g. "status=applied,date=2026*"
+        expand_hops: Also include notes up to this many [[wikilinks]] away from
+            the notes on the page, in either direction
+        expand_bytes: Size budget of the included linked notes
+        max_chars: If set, return only the heading sections of the page's notes
+            that best match query, up to this many characters, instead of whole notes
+        query: Text to rank sections by, e.g. the job description. Defaults to search_param
 
-    if not results:
-        files_list = [str(filename)
-                      for filename in vault_path.rglob("*.md")]
-        files_list_str = "\n\t- ".join(files_list)
-        return f"""❌ No files matched '{search_param}'
+    Returns:
+        Content of matching notes or list of available files if no matches
+    """
+    app_ctx = get_app_context()
+    vault_path = Path(OBSIDIAN_VAULT)
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+    if cursor:
+        decoded = decode_cursor(cursor)
+        if decoded is None:
+            return "❌ Invalid cursor. Run the search again without a cursor."
+        set_id, offset = decoded
+        result_set = app_ctx.result_sets.get(set_id)
+        if result_set is None:
+            return "❌ Cursor has expired. Run the search again without a cursor."
+        search_param, results = result_set.query, result_set.matches
+    else:
+        if not search_param.strip():
+            return "❌ Job description parameter cannot be empty"
+
+        # Check if vault exists
+        if not vault_path.exists():
+            return f"❌ Obsidian vault not found at: {OBSIDIAN_VAULT}\nSet OBSIDIAN_VAULT environment variable to your vault path"
+
+        if not vault_path.is_dir():
+            return f"❌ Obsidian vault path is not a directory: {OBSIDIAN_VAULT}"
+
+        results = fuzzy_search_vault_files(
+            search_param, min_score=50, limit=limit,
+            index=app_ctx.vault_index, cache=app_ctx.query_cache,
+            only=_metadata_filter(app_ctx, tag, property))
+
+        if not results:
+            files_list = [str(vault_path / relative_path)
+                          for relative_path in app_ctx.vault_index.relative_paths()]
+            files_list_str = "\n\t- ".join(files_list)
+            return f"""❌ No files matched '{search_param}'
 ## Available files in vault:
 {files_list_str}
 
@@ -57,25 +131,45 @@ def search_job_description(search_param: str, limit=10) -> str:
 - Try partial matches (e.g., 'ml', 'engineer', 'python')
 - File search is case-insensitive
 - Only searches .md files in the vault
+- Use `search_vault_content` to search inside notes instead of their names
 """
 
-    # Read and combine content from matched files
+        set_id, offset = app_ctx.result_sets.put(search_param, results), 0
+
+    page = results[offset:offset + page_size]
+    if not page:
+        return f"❌ No more results for '{search_param}' ({len(results)} matches in total)"
+
+    # Read and combine content from the matched files on this page
     combined_content = []
 
-    for match in results[:limit]:
-        file_path = match["path"]
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+    if max_chars > 0:
+        notes = []
+        for match in page:
+            check_cancelled()
+            relative_path = Path(os.path.relpath(match["path"], vault_path)).as_posix()
+            try:
+                notes.append((relative_path, match["path"],
+                              _note_chunks(app_ctx, relative_path, match["path"])))
+            except OSError as e:
+                logger.error(f"Error reading file {match['path']}: {e}")
+        chunks = rank_chunks(notes, query or search_param, max_chars)
+        combined_content.append(_format_chunks(chunks) if chunks else "No sections found.\n")
+    else:
+        for match in page:
+            check_cancelled()
+            file_path = match["path"]
+            try:
+                content = app_ctx.content_cache.read(file_path)
 
-            combined_content.append(f"""# {match['filename']}
+                combined_content.append(f"""# {match['filename']}
 **Path:** {match['relative_path']}
 
 {content}
 """)
-        except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
-            combined_content.append(f"""# {match['filename']}
+            except Exception as e:
+                logger.error(f"Error reading file {file_path}: {e}")
+                combined_content.append(f"""# {match['filename']}
 **Path:** {match['relative_path']}
 
 ❌ Error reading file: {str(e)}
@@ -85,27 +179,93 @@ def search_job_description(search_param: str, limit=10) -> str:
 
 **Search term:** {search_param}
 **Matches found:** {len(results)}
-**Showing:** {len(combined_content)} files
+**Showing:** {offset + 1}-{offset + len(page)} of {len(results)}
 
 {"="*50}
 
 """ + "\n\n" + ("="*50 + "\n\n").join(combined_content)
 
-    if len(results) > 5:
-        result += f"\n\n**Note:** {len(results) - 5} additional matches not shown. Use more specific search terms."
+    if expand_hops > 0 and app_ctx.link_graph is not None:
+        page_paths = [Path(os.path.relpath(match["path"], vault_path)).as_posix()
+                      for match in page]
+        related, skipped = app_ctx.link_graph.expand(
+            page_paths, hops=expand_hops, max_bytes=expand_bytes)
+        result += _format_related(app_ctx, related, skipped)
+
+    next_offset = offset + len(page)
+    if next_offset < len(results):
+        result += f"""
+
+**Next cursor:** `{encode_cursor(set_id, next_offset)}`
+{len(results) - next_offset} more matches. Call search_job_description with this cursor to see them."""
 
     logger.info(
-        f"Found {len(results)} matches for '{search_param}'")
+        f"Showing matches {offset + 1}-{next_offset} of {len(results)} for '{search_param}'")
     return result
 
 
-@mcp.tool("read_vault_file", description="Read content of a specific file from the user's vault")
-def read_vault_file(file_path: str) -> str:
+def _note_chunks(app_ctx, relative_path: str, path: str) -> List[Chunk]:
+    """Get the heading chunks of a note from the metadata index, or by splitting it"""
+    chunks = app_ctx.metadata_index.chunks(relative_path) if app_ctx.metadata_index else None
+    if chunks is None:
+        with open(path, 'rb') as f:
+            chunks = split_chunks(f.read())
+    return chunks
+
+
+def _format_chunks(chunks: List[dict]) -> str:
+    """Render the chunks picked by rank_chunks"""
+    blocks = []
+    for chunk in chunks:
+        heading = f" › {chunk['heading']}" if chunk['heading'] else ""
+        text = chunk['text'] + ("\n...(truncated)..." if chunk['truncated'] else "")
+        blocks.append(f"""# {chunk['filename']}{heading} (Score: {chunk['score']})
+**Path:** {chunk['relative_path']}
+
+{text}
+""")
+    return ("="*50 + "\n\n").join(blocks)
+
+
+def _format_related(app_ctx, related, skipped: int) -> str:
+    """Render the linked notes gathered for a page of search results"""
+    if not related:
+        return "\n\n## Linked notes\nNo linked notes found."
+
+    blocks = []
+    for note in related:
+        check_cancelled()
+        arrow = "linked from" if note["direction"] == "forward" else "links to"
+        try:
+            content = app_ctx.content_cache.read(note["path"])
+        except Exception as e:
+            logger.error(f"Error reading file {note['path']}: {e}")
+            content = f"❌ Error reading file: {str(e)}"
+        blocks.append(f"""# {note['filename']}
+**Path:** {note['relative_path']}
+**Related:** {arrow} {note['via']} ({note['hops']} hop{"s" if note['hops'] > 1 else ""})
+
+{content}
+""")
+
+    section = f"\n\n## Linked notes ({len(related)})\n\n" + ("="*50 + "\n\n").join(blocks)
+    if skipped:
+        section += f"\n**Note:** {skipped} more linked notes left out to stay within expand_bytes."
+    return section
+
+
+@mcp.tool("read_vault_file", description="Read content of a specific file from the user's vault, "
+          "or only one heading section of it, or its sections that best match a query")
+@vault_io
+def read_vault_file(file_path: str, heading: str = "", query: str = "", max_chars: int = 0) -> str:
     """
     Get content of a specific file from the Obsidian vault.
 
     Args:
         file_path: Path to the file within the vault (with or without .md extension)
+        heading: Only return the section(s) under this heading (case-insensitive)
+        query: Only return the sections that best match this text, up to max_chars
+        max_chars: Character budget for query; defaults to 4000 when query is given
 
     Returns:
         Content of the specified file
@@ -128,8 +288,25 @@ def read_vault_file(file_path: str) -> str:
         if not os.path.exists(full_path):
             return f"❌ File not found: {file_path}\n\nUse list_obsidian_files tool to see available files"
 
-        with open(full_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        app_ctx = get_app_context()
+        if heading.strip() or query.strip():
+            relative_path = Path(os.path.relpath(full_path, vault_path)).as_posix()
+            chunks = _note_chunks(app_ctx, relative_path, full_path)
+
+            if heading.strip():
+                wanted = heading.strip().lstrip("#").strip().lower()
+                sections = [read_chunk(full_path, chunk) for chunk in chunks
+                            if chunk.heading.lower() == wanted]
+                if not sections:
+                    headings = "\n".join(f"- {'#' * chunk.level} {chunk.heading}"
+                                          for chunk in chunks if chunk.heading)
+                    return f"❌ Heading '{heading}' not found in {file_path}\n\n## Headings:\n{headings or 'None'}"
+                content = "\n".join(sections)
+            else:
+                content = _format_chunks(
+                    rank_chunks([(relative_path, full_path, chunks)], query, max_chars or 4000))
+        else:
+            content = app_ctx.content_cache.read(full_path)
 
         return f"""# {full_path}
 **Path:** {file_path}
@@ -145,42 +322,126 @@ def read_vault_file(file_path: str) -> str:
         return f"❌ Error reading file: {str(e)}"
 
 
+@mcp.tool(
+    name="read_vault_files",
+    description="Read several files from the user's vault in one call. Accepts vault-relative "
+    "paths and glob patterns such as 'Experience/*.md'")
+async def read_vault_files(
+        paths: Union[List[str], str],
+        max_bytes: int = 500_000,
+        max_files: int = 50) -> str:
+    """
+    Read many files from the Obsidian vault concurrently.
+
+    Args:
+        paths: Vault-relative paths (with or without .md) and/or glob patterns,
+            as a list or a comma-separated string
+        max_bytes: Total number of bytes to return across all files; files asked
+            for first are read in full, later ones may be truncated or skipped
+        max_files: Maximum number of files to read
+
+    Returns:
+        The contents of every file, with per-file errors and truncation noted
+    """
+    if isinstance(paths, str):
+        paths = paths.split(",")
+    if not any(p.strip() for p in paths):
+        return "❌ Paths parameter cannot be empty"
+
+    vault_path = Path(OBSIDIAN_VAULT)
+    if not vault_path.is_dir():
+        return f"❌ Obsidian vault not found at: {OBSIDIAN_VAULT}"
+
+    app_ctx = get_app_context()
+    entries = await read_files(
+        paths, max_bytes=max_bytes, max_files=max_files,
+        executor=app_ctx.io_pool, cache=app_ctx.content_cache, index=app_ctx.vault_index)
+
+    blocks = []
+    for entry in entries:
+        if entry["error"] is not None:
+            status = f"❌ {entry['error']}"
+        elif entry["truncated"]:
+            status = f"⚠️ Truncated ({len(entry['content'].encode('utf-8'))} of {entry['size']} bytes)"
+        else:
+            status = f"✅ Complete ({entry['size']} bytes)"
+        block = f"""## {entry['relative_path']}
+**Status:** {status}
+"""
+        if entry["content"]:
+            block += f"\n{entry['content']}\n"
+        blocks.append(block)
+
+    succeeded = sum(1 for entry in entries if entry["error"] is None)
+    truncated = sum(1 for entry in entries if entry["truncated"])
+    return f"""# Obsidian Vault Files
+
+**Requested:** {", ".join(p.strip() for p in paths if p.strip())}
+**Files read:** {succeeded} of {len(entries)}{f" ({truncated} truncated)" if truncated else ""}
+
+""" + "\n---\n\n".join(blocks)
+
+
 @mcp.tool(
     name="save_file_to_vault",
-    description="Saves the provided content into file into the user's vault"
+    description="Saves the provided content into file into the user's vault. By default the file is written in the background and a failed write is only logged; pass wait=True to get a confirmed save or the write error."
 )
-def save_file_to_vault(content: str, filename: str, vault_dir: str,  replace: bool = True) -> str:
+@vault_io
+def save_file_to_vault(
+        content: str,
+        filename: str,
+        vault_dir: str,
+        replace: bool = True,
+        wait: bool = False) -> str:
     """
     Saves the content of a file into the user's vault.
 
+    The file is written atomically in the background, so the call returns
+    before slow (e.g. synced) vault storage has caught up. Unless wait is
+    set, a failed background write is only logged, never reported back.
+
     Arguments:
         content (str): The file's content 
         filename (str): The name of the file to save to, including file extension.
+        wait (bool, optional): Only answer once the file is on disk, reporting
+            any write error. Defaults to False.
     """
 
     vault_path = OBSIDIAN_VAULT
 
     full_path = os.path.join(vault_path, vault_dir, filename)
+    writer = get_app_context().vault_writer
 
-    if os.path.exists(full_path) and not replace:
+    if not replace and (os.path.exists(full_path) or (writer and writer.is_pending(full_path))):
         return "This file already exists and the `replace` flat has been set to false."
 
-    with open(full_path, mode='w') as f:
-        f.write(content)
+    handle = write_file(full_path, content, writer)
+    if writer is None or wait:
+        try:
+            handle.result()
+        except OSError as e:
+            return f"❌ Could not save the file to {full_path}: {e}"
+        if writer is None:
+            # Make the note searchable without waiting for the watcher
+            get_app_context().vault_index.add_file(full_path)
+        return f"The file has been successfully saved to {full_path}"
 
-    return f"The file has been successfully saved to {full_path}"
+    return f"The file is being saved to {full_path}"
 
 
 @mcp.tool(
     name="fuzzy_search_vault",
     description="Search user's vault for files with names similar to the search term using fuzzy matching"
 )
+@vault_io
 def fuzzy_search_vault_tool(
     search_term: str,
     min_score: int = 60,
     subdir: str = "",
     limit: int = 10,
-    include_content: bool = True
+    include_content: bool = True,
+    tag: str = "",
+    property: str = ""
 ) -> str:
     """
     Search for files in the user's vault using fuzzy string matching on filenames.
@@ -191,11 +452,14 @@ def fuzzy_search_vault_tool(
         subdir (str, optional): Subdirectory within vault to search. Defaults to "" (whole vault).
         limit (int, optional): Maximum number of results to return. Defaults to 10.
         include_content (bool, optional): Whether to include file contents in results. Defaults to False.
+        tag (str, optional): Comma-separated tags the files must carry, e.g. "applied,remote".
+        property (str, optional): Comma-separated frontmatter conditions, e.g. "status=applied,date=2026*".
 
     Returns:
-        str: Formatted results of the search
+        str: Formatted results of the search. With an empty search term, every
+            file passing the tag and property filters is listed.
     """
-    if not search_term.strip():
+    if not search_term.strip() and not (tag.strip() or property.strip()):
         return "❌ Search term parameter cannot be empty"
 
     vault_path = Path(OBSIDIAN_VAULT)
@@ -208,19 +472,36 @@ def fuzzy_search_vault_tool(
         return f"❌ Obsidian vault path is not a directory: {OBSIDIAN_VAULT}"
 
     # Perform fuzzy search
-    results = fuzzy_search_vault_files(
-        search_term=search_term,
-        min_score=min_score,
-        subdir=subdir,
-        limit=limit
-    )
+    app_ctx = get_app_context()
+    only = _metadata_filter(app_ctx, tag, property)
+    filters = f" tagged '{tag}'" if tag.strip() else ""
+    filters += f" with properties '{property}'" if property.strip() else ""
+    if search_term.strip():
+        results = fuzzy_search_vault_files(
+            search_term=search_term,
+            min_score=min_score,
+            subdir=subdir,
+            limit=limit,
+            index=app_ctx.vault_index,
+            cache=app_ctx.query_cache,
+            only=only
+        )
+    else:
+        # Filter-only query: answered from the metadata index alone
+        prefix = subdir_prefix(subdir)
+        results = [{
+            "score": 100,
+            "path": str(vault_path / relative_path),
+            "filename": Path(relative_path).stem,
+            "relative_path": relative_path[len(prefix):]
+        } for relative_path in sorted(only) if relative_path.startswith(prefix)][:limit]
 
     if not results:
         # If no results, show available files to help user
-        search_path = vault_path / subdir if subdir else vault_path
-        files_list = [f.stem for f in search_path.rglob("*.md")][:20]
+        files_list = [Path(relative_path).stem for relative_path
+                      in app_ctx.vault_index.relative_paths(subdir)][:20]
 
-        return f"""❌ No files matched '{search_term}' with minimum score {min_score}
+        return f"""❌ No files matched '{search_term}'{filters} with minimum score {min_score}
 
 ## Available files in {"subdirectory: " + subdir if subdir else "vault"}:
 - {", ".join(files_list) if files_list else "No files found"}
@@ -229,12 +510,14 @@ def fuzzy_search_vault_tool(
 - Lower the min_score parameter (currently {min_score})
 - Try more general search terms
 - Check if the subdirectory path is correct
+- Check the tag and property filters, if any
 """
 
     # Format results
     formatted_results = []
 
     for match in results:
+        check_cancelled()
         result_block = f"""## {match['filename']} (Score: {match['score']})
 **Path:** {match['relative_path']}
 """
@@ -242,11 +525,11 @@ def fuzzy_search_vault_tool(
         # Add file content if requested
         if include_content:
             try:
-                with open(match['path'], 'r', encoding='utf-8') as f:
-                    content = f.read()
-                result_block += f"\n```markdown\n{content[:1000]}\n```"
+                preview, truncated = app_ctx.vault_index.preview(
+                    match['path'], max_bytes=PREVIEW_BYTES)
+                result_block += f"\n```markdown\n{preview}\n```"
 
-                if len(content) > 1000:
+                if truncated:
                     result_block += "\n...(truncated)...\n"
             except Exception as e:
                 logger.error(f"Error reading file {match['path']}: {e}")
@@ -261,6 +544,7 @@ def fuzzy_search_vault_tool(
 **Minimum score:** {min_score}
 **Results found:** {len(results)}
 **Subdirectory:** {subdir if subdir else "entire vault"}
+**Filters:** {filters.strip() or "none"}
 **Content included:** {"Yes" if include_content else "No"}
 
 """
@@ -270,3 +554,103 @@ def fuzzy_search_vault_tool(
     logger.info(
         f"Fuzzy search found {len(results)} matches for '{search_term}' (min_score: {min_score})")
     return full_results
+
+
+@mcp.tool(
+    name="search_vault_content",
+    description="Full-text search through the contents of the notes in the user's vault, ranked by relevance"
+)
+@vault_io
+def search_vault_content(query: str, limit: int = 10) -> str:
+    """
+    Search the text of the notes in the user's vault.
+
+    Args:
+        query (str): Words to search for in the note contents
+        limit (int, optional): Maximum number of results to return. Defaults to 10.
+
+    Returns:
+        str: Ranked matching notes with a short snippet of each
+    """
+    if not query.strip():
+        return "❌ Query parameter cannot be empty"
+
+    results = get_app_context().content_index.search(query, limit=limit)
+
+    if not results:
+        return f"""❌ No notes contain '{query}'
+
+## Search tips:
+- Search matches whole words, case-insensitively
+- Try fewer or more general words
+- Use `fuzzy_search_vault` to match note names instead
+"""
+
+    formatted_results = [f"""## {match['filename']} (Score: {match['score']})
+**Path:** {match['relative_path']}
+
+> {match['snippet']}
+""" for match in results]
+
+    logger.info(
+        f"Content search found {len(results)} matches for '{query}'")
+    return f"""# Obsidian Content Search Results
+
+**Query:** {query}
+**Results found:** {len(results)}
+
+""" + "\n---\n\n".join(formatted_results)
+
+
+@mcp.tool(
+    name="semantic_search_vault",
+    description="Find the sections of the user's notes most relevant to a pasted job description, "
+    "even when they don't share its exact wording"
+)
+@vault_io
+def semantic_search_vault(job_description: str, limit: int = 5) -> str:
+    """
+    Rank heading-level sections of the vault's notes by similarity to a text.
+
+    Args:
+        job_description (str): The job description or other text to match
+        limit (int, optional): Maximum number of sections to return. Defaults to 5.
+
+    Returns:
+        str: The best matching sections with their notes and scores
+    """
+    if not job_description.strip():
+        return "❌ Job description parameter cannot be empty"
+
+    semantic_index = get_app_context().semantic_index
+    if semantic_index is None:
+        return "❌ Semantic search is disabled. Set SEMANTIC_INDEX_DIR to enable it"
+
+    results = semantic_index.search(job_description, limit=limit)
+
+    if not results:
+        return """❌ No note sections are similar to the job description
+
+## Search tips:
+- Paste the full job description rather than a few words
+- Use `search_vault_content` for exact words
+"""
+
+    formatted_results = []
+    for match in results:
+        text = match['text']
+        if len(text) > CHUNK_CHARS:
+            text = text[:CHUNK_CHARS] + "\n...(truncated)..."
+        heading = f" › {match['heading']}" if match['heading'] else ""
+        formatted_results.append(f"""## {match['filename']}{heading} (Score: {match['score']})
+**Path:** {match['relative_path']}
+
+{text}
+""")
+
+    logger.info(f"Semantic search returned {len(results)} sections")
+    return f"""# Obsidian Semantic Search Results
+
+**Sections found:** {len(results)}
+
+""" + "\n---\n\n".join(formatted_results)
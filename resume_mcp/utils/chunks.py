@@ -0,0 +1,152 @@
+"""
+Heading-delimited chunks of notes, addressed by byte offsets
+"""
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+from resume_mcp.utils.content_index import BM25_B, BM25_K1, tokenize
+from resume_mcp.utils.io_pool import check_cancelled
+
+HEADING_RE = re.compile(rb"^(#{1,6})[ \t]+(.+?)[ \t#]*\r?$", re.MULTILINE)
+FENCE_RE = re.compile(rb"^(```|~~~).*?(?:^\1[^\n]*$|\Z)", re.MULTILINE | re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A heading section of a note; start and end are byte offsets into the file"""
+    heading: str
+    level: int
+    start: int
+    end: int
+
+
+def split_chunks(data: bytes) -> List[Chunk]:
+    """
+    Split a markdown file into one chunk per heading section.
+
+    Bytes before the first heading form a chunk with an empty heading, and
+    lines inside fenced code blocks are never taken for headings. Sections
+    holding nothing but whitespace are left out.
+
+    Args:
+        data (bytes): The raw (UTF-8) file contents.
+
+    Returns:
+        List[Chunk]: The chunks in file order. Each includes its heading line.
+    """
+    fences = [(m.start(), m.end()) for m in FENCE_RE.finditer(data)]
+
+    def in_fence(pos: int) -> bool:
+        return any(start < pos < end for start, end in fences)
+
+    chunks = []
+    heading, level, start = "", 0, 0
+    for match in HEADING_RE.finditer(data):
+        if in_fence(match.start()):
+            continue
+        if match.start() > start and data[start:match.start()].strip():
+            chunks.append(Chunk(heading, level, start, match.start()))
+        heading = match.group(2).decode("utf-8", errors="replace").strip()
+        level, start = len(match.group(1)), match.start()
+    if data[start:].strip():
+        chunks.append(Chunk(heading, level, start, len(data)))
+    return chunks
+
+
+def read_chunk(path: Union[str, os.PathLike], chunk: Chunk) -> str:
+    """
+    Read one chunk of a file with a single seek and read.
+
+    Args:
+        path (str | PathLike): The file the chunk belongs to.
+        chunk (Chunk): The chunk to read.
+
+    Returns:
+        str: The chunk text.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        f.seek(chunk.start)
+        data = f.read(chunk.end - chunk.start)
+    return data.decode("utf-8", errors="replace")
+
+
+def rank_chunks(
+        notes: Sequence[Tuple[str, Union[str, os.PathLike], Sequence[Chunk]]],
+        query: str,
+        max_chars: int) -> List[Dict]:
+    """
+    Pick the chunks of some notes that best match a query, within a size budget.
+
+    Chunks are scored with BM25 against each other, then taken best first
+    while their text fits in max_chars. If not even the best chunk fits, it
+    is cut to the budget so the result is never empty. When nothing matches
+    the query, chunks are taken in note order instead.
+
+    Args:
+        notes (Sequence[Tuple[str, PathLike, Sequence[Chunk]]]): (relative path,
+            path, chunks) of every note to consider.
+        query (str): The text to score chunks against.
+        max_chars (int): Total number of characters of chunk text to return.
+
+    Returns:
+        List[Dict]: Chunks with "score", "path", "filename", "relative_path",
+            "heading", "text" and "truncated", best first.
+    """
+    candidates = []
+    for relative_path, path, chunks in notes:
+        for chunk in chunks:
+            check_cancelled()
+            try:
+                text = read_chunk(path, chunk).strip()
+            except OSError:
+                continue
+            candidates.append((relative_path, path, chunk, text, Counter(tokenize(text))))
+    if not candidates or max_chars <= 0:
+        return []
+
+    terms = set(tokenize(query))
+    avg_length = max(sum(sum(c[4].values()) for c in candidates) / len(candidates), 1.0)
+    df = Counter(term for c in candidates for term in terms if c[4][term])
+
+    scored = []
+    for position, (relative_path, path, chunk, text, counts) in enumerate(candidates):
+        length = sum(counts.values())
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+        score = 0.0
+        for term in terms:
+            tf = counts[term]
+            if tf:
+                idf = math.log(1 + (len(candidates) - df[term] + 0.5) / (df[term] + 0.5))
+                score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        scored.append((score, position, relative_path, path, chunk, text))
+
+    if any(s[0] > 0 for s in scored):
+        scored = [s for s in scored if s[0] > 0]
+        scored.sort(key=lambda s: (-s[0], s[1]))
+
+    results, used = [], 0
+    for score, _, relative_path, path, chunk, text in scored:
+        truncated = False
+        if used + len(text) > max_chars:
+            if results:
+                continue
+            text, truncated = text[:max_chars], True
+        used += len(text)
+        results.append({
+            "score": round(score, 3),
+            "path": str(path),
+            "filename": Path(relative_path).stem,
+            "relative_path": relative_path,
+            "heading": chunk.heading,
+            "text": text,
+            "truncated": truncated
+        })
+    return results
@@ -0,0 +1,291 @@
+"""
+Full-text BM25 index over the contents of the vault's notes
+"""
+import logging
+import math
+import re
+import threading
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from resume_mcp.utils.vault_index import REMOVE, RESET, UPSERT, VaultIndex
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"\w\w+", re.UNICODE)
+
+# Standard Okapi BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SNIPPET_CHARS = 240
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercased word tokens of two or more characters.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        List[str]: The tokens in order of appearance.
+    """
+    return TOKEN_RE.findall(text.lower())
+
+
+def make_snippet(text: str, terms: List[str], width: int = SNIPPET_CHARS) -> str:
+    """
+    Cut a short single-line excerpt of text around the first query term it contains.
+
+    Args:
+        text (str): The full note text.
+        terms (List[str]): Lowercased query terms.
+        width (int, optional): Approximate length of the snippet in characters.
+
+    Returns:
+        str: The snippet, with "..." marking cut-off ends.
+    """
+    start = 0
+    if terms:
+        pattern = re.compile(
+            r"\b(" + "|".join(re.escape(t) for t in terms) + r")\b", re.IGNORECASE)
+        match = pattern.search(text)
+        if match:
+            start = max(0, match.start() - width // 3)
+
+    end = min(len(text), start + width)
+    snippet = " ".join(text[start:end].split())
+    if start > 0:
+        snippet = "..." + snippet
+    if end < len(text):
+        snippet += "..."
+    return snippet
+
+
+class ContentIndex:
+    """
+    Inverted index over note bodies, ranked with BM25.
+
+    Each term maps to two compact unsigned-int arrays holding the ids of the
+    documents containing it and the term frequency in each. Note bodies are
+    kept zlib-compressed in memory so snippets never need a disk read.
+    Replaced and removed documents are tombstoned and purged from the
+    postings once they make up half of all document ids.
+
+    Args:
+        vault_path (str): Root of the vault the relative paths point into.
+    """
+
+    def __init__(self, vault_path: str):
+        self.vault_path = Path(vault_path)
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._doc_ids: Dict[str, int] = {}
+        self._doc_paths: List[Optional[str]] = []
+        self._doc_lengths = array("I")
+        self._alive = bytearray()
+        self._texts: List[Optional[bytes]] = []
+        self._total_length = 0
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def build(self, vault_index: VaultIndex) -> "ContentIndex":
+        """
+        Index the contents of every file in a vault index and follow its changes.
+
+        Args:
+            vault_index (VaultIndex): The filename index of the vault.
+
+        Returns:
+            ContentIndex: The index itself, for chaining.
+        """
+        self._reset(vault_index.relative_paths())
+        vault_index.subscribe(
+            lambda event, relative_path: self.on_vault_event(vault_index, event, relative_path))
+        return self
+
+    def _reset(self, relative_paths: List[str]):
+        with self._lock:
+            self._postings.clear()
+            self._doc_ids.clear()
+            self._doc_paths.clear()
+            self._doc_lengths = array("I")
+            self._alive = bytearray()
+            self._texts.clear()
+            self._total_length = 0
+            self._dead = 0
+            for relative_path in relative_paths:
+                self.update(relative_path)
+        logger.info(f"Indexed the contents of {len(self)} notes")
+
+    def on_vault_event(self, vault_index: VaultIndex, event: str, relative_path: Optional[str]):
+        """Apply a change reported by the vault index"""
+        if event == UPSERT:
+            self.update(relative_path)
+        elif event == REMOVE:
+            self.remove(relative_path)
+        elif event == RESET:
+            self._reset(vault_index.relative_paths())
+
+    def update(self, relative_path: str, text: Optional[str] = None) -> bool:
+        """
+        (Re)index a note.
+
+        Args:
+            relative_path (str): Vault-relative path of the note.
+            text (str, optional): The note's contents. Read from disk when omitted.
+
+        Returns:
+            bool: True if the note was indexed.
+        """
+        if text is None:
+            try:
+                with open(self.vault_path / relative_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Cannot index contents of {relative_path}: {e}")
+                self.remove(relative_path)
+                return False
+
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+
+        with self._lock:
+            self._tombstone(relative_path)
+
+            doc_id = len(self._doc_paths)
+            self._doc_ids[relative_path] = doc_id
+            self._doc_paths.append(relative_path)
+            self._doc_lengths.append(len(tokens))
+            self._alive.append(1)
+            self._texts.append(zlib.compress(text.encode('utf-8')))
+            self._total_length += len(tokens)
+
+            for term, count in counts.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("I"), array("I"))
+                postings[0].append(doc_id)
+                postings[1].append(count)
+
+            self._maybe_compact()
+        return True
+
+    def remove(self, relative_path: str) -> bool:
+        """
+        Drop a note from the index.
+
+        Returns:
+            bool: True if the note was indexed.
+        """
+        with self._lock:
+            removed = self._tombstone(relative_path)
+            self._maybe_compact()
+        return removed
+
+    def _tombstone(self, relative_path: str) -> bool:
+        doc_id = self._doc_ids.pop(relative_path, None)
+        if doc_id is None:
+            return False
+        self._total_length -= self._doc_lengths[doc_id]
+        self._doc_paths[doc_id] = None
+        self._doc_lengths[doc_id] = 0
+        self._alive[doc_id] = 0
+        self._texts[doc_id] = None
+        self._dead += 1
+        return True
+
+    def _maybe_compact(self):
+        """Renumber live documents and purge dead ones from the postings"""
+        if self._dead < 64 or self._dead * 2 < len(self._doc_paths):
+            return
+
+        remap = np.full(len(self._doc_paths), -1, dtype=np.int64)
+        live = [doc_id for doc_id, path in enumerate(self._doc_paths)
+                if path is not None]
+        remap[live] = np.arange(len(live))
+
+        for term, (doc_ids, tfs) in list(self._postings.items()):
+            ids = remap[np.frombuffer(doc_ids, dtype=np.uint32)]
+            keep = ids >= 0
+            if not keep.any():
+                del self._postings[term]
+                continue
+            self._postings[term] = (
+                array("I", ids[keep].astype(np.uint32).tobytes()),
+                array("I", np.frombuffer(tfs, dtype=np.uint32)[keep].tobytes()))
+
+        self._doc_paths = [self._doc_paths[i] for i in live]
+        self._doc_lengths = array("I", [self._doc_lengths[i] for i in live])
+        self._alive = bytearray(b"\x01" * len(live))
+        self._texts = [self._texts[i] for i in live]
+        self._doc_ids = {path: i for i, path in enumerate(self._doc_paths)}
+        self._dead = 0
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Rank notes against a free-text query with BM25.
+
+        Args:
+            query (str): The words to search for.
+            limit (int, optional): Maximum number of results. Defaults to 10.
+
+        Returns:
+            List[Dict]: Hits with "score", "path", "filename", "relative_path"
+                and "snippet", best first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+
+        with self._lock:
+            n_docs = len(self._doc_ids)
+            if n_docs == 0:
+                return []
+
+            # Copy rather than view so the arrays can still grow afterwards
+            doc_lengths = np.array(self._doc_lengths, dtype=np.float64)
+            alive = np.frombuffer(bytes(self._alive), dtype=np.bool_)
+            avg_length = max(self._total_length / n_docs, 1.0)
+            norms = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths / avg_length)
+            scores = np.zeros(len(doc_lengths), dtype=np.float64)
+
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                ids = np.frombuffer(postings[0], dtype=np.uint32)
+                tfs = np.frombuffer(postings[1], dtype=np.uint32)
+                keep = alive[ids]
+                ids, tfs = ids[keep], tfs[keep].astype(np.float64)
+                if len(ids) == 0:
+                    continue
+
+                idf = math.log(1 + (n_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+                scores[ids] += idf * tfs * (BM25_K1 + 1) / (tfs + norms[ids])
+
+            hits = np.flatnonzero(scores)
+            if len(hits) > limit:
+                hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+            hits = hits[np.argsort(-scores[hits], kind="stable")]
+
+            results = []
+            for doc_id in hits:
+                relative_path = self._doc_paths[doc_id]
+                text = zlib.decompress(self._texts[doc_id]).decode('utf-8')
+                results.append({
+                    "score": round(float(scores[doc_id]), 3),
+                    "path": str(self.vault_path / relative_path),
+                    "filename": Path(relative_path).stem,
+                    "relative_path": relative_path,
+                    "snippet": make_snippet(text, terms)
+                })
+        return results
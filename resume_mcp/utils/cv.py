@@ -1,12 +1,14 @@
+import asyncio
 import logging
 import os
 import re
 from typing import Any, Dict
 from resume_mcp.config import OBSIDIAN_VAULT, OUTPUT_DIRECTORY
 from resume_mcp.mcp.base import AppContext
-from resume_mcp.utils.latex import compile_latex
+from resume_mcp.utils.latex import compile_latex_async
 from resume_mcp.utils.llm import call_anthropic
 from resume_mcp.utils.vault import save_file_to_vault
+from resume_mcp.utils.vault_writer import write_file
 
 
 logger = logging.getLogger(__name__)
@@ -171,16 +173,23 @@ async def autogenerate_cv(job_description: str, company: str, position: str, app
         logger.warning("No markdown content found in LLM response")
     else:
         obsidian_filename = os.path.join(OUTPUT_DIRECTORY, f"{cv_name}.md")
-        with open(obsidian_filename, mode="w", encoding="utf-8") as f:
-            f.write(parsed_content["markdown"])
+        # Wait for the CV itself, but not for the debug copy further down
+        try:
+            await asyncio.wrap_future(write_file(
+                obsidian_filename, parsed_content["markdown"], app_ctx.vault_writer))
+        except OSError as e:
+            logger.error(f"Failed to save markdown CV to {obsidian_filename}: {e}")
+            raise
         results["markdown_path"] = obsidian_filename
         results["generated_files"].append(obsidian_filename)
 
     if "latex" in parsed_content:
         pdf_filename = os.path.join(OUTPUT_DIRECTORY, f"{cv_name}.pdf")
         # Save PDF
-        compilation_result = compile_latex(
-            content=parsed_content["latex"], dest=pdf_filename)
+        compilation_result = await compile_latex_async(
+            content=parsed_content["latex"], dest=pdf_filename,
+            client=app_ctx.latex_async_client, monitor=app_ctx.latex_health,
+            cache=app_ctx.pdf_cache)
         if "error" in compilation_result:
             logger.warning(
                 f"Failed to compile PDF, error: {compilation_result['error']}")
@@ -196,7 +205,9 @@ async def autogenerate_cv(job_description: str, company: str, position: str, app
 
     response_filename = save_file_to_vault(
         content=f"# LLM Response for {company} - {position}\n\n```\n{llm_response}\n```",
-        rel_dest=obsidian_filename
+        rel_dest=obsidian_filename,
+        index=app_ctx.vault_index,
+        writer=app_ctx.vault_writer
     )
 
     results["generated_files"].append(response_filename)
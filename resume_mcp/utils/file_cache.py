@@ -0,0 +1,163 @@
+"""
+Shared LRU cache of decoded note contents and bounded file previews
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+def utf8_safe_prefix(data: bytes) -> bytes:
+    """
+    Drop a multi-byte UTF-8 sequence cut off at the end of a byte string.
+
+    Args:
+        data (bytes): UTF-8 bytes that may end part-way through a character.
+
+    Returns:
+        bytes: The data up to the last complete character.
+    """
+    # Walk back over at most three continuation bytes to the lead byte
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 != 0x80:
+            if byte >= 0xF0:
+                needed = 4
+            elif byte >= 0xE0:
+                needed = 3
+            elif byte >= 0xC0:
+                needed = 2
+            else:
+                needed = 1
+            return data if back >= needed else data[:-back]
+    return data
+
+
+def read_preview(path: Union[str, os.PathLike], max_bytes: int = 1000) -> Tuple[str, bool]:
+    """
+    Read the beginning of a text file without reading the whole file.
+
+    At most max_bytes are read. A character cut in half at the end is dropped
+    rather than decoded into garbage.
+
+    Args:
+        path (str | PathLike): The file to preview.
+        max_bytes (int, optional): Maximum number of bytes to read. Defaults to 1000.
+
+    Returns:
+        Tuple[str, bool]: The decoded preview, and whether the file is longer
+            than the preview.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        data = f.read(max_bytes)
+
+    truncated = size > len(data)
+    if truncated:
+        data = utf8_safe_prefix(data)
+    return data.decode('utf-8', errors='replace'), truncated
+
+
+class ContentCache:
+    """
+    Byte-budgeted LRU cache of text files keyed by path.
+
+    Every read costs one os.stat. The cached text is only served while the
+    file's mtime and size still match what was read, so edits made behind
+    the cache's back are picked up on the next read.
+
+    Args:
+        max_bytes (int): Total size of the cached files (on disk) to keep.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def read(self, path: Union[str, os.PathLike], encoding: str = 'utf-8') -> str:
+        """
+        Read a text file, from the cache when it hasn't changed on disk.
+
+        Args:
+            path (str | PathLike): The file to read.
+            encoding (str, optional): Text encoding of the file. Defaults to utf-8.
+
+        Returns:
+            str: The file contents.
+
+        Raises:
+            OSError: If the file cannot be read.
+            UnicodeDecodeError: If the file isn't valid text in the encoding.
+        """
+        key = os.fspath(path)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[:2] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        with open(key, 'r', encoding=encoding) as f:
+            content = f.read()
+
+        if stat.st_size <= self.max_bytes:
+            with self._lock:
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self._bytes -= old[1]
+                self._entries[key] = (*signature, content)
+                self._bytes += stat.st_size
+                while self._bytes > self.max_bytes:
+                    _, (_, size, _) = self._entries.popitem(last=False)
+                    self._bytes -= size
+                    self.evictions += 1
+
+        return content
+
+    def invalidate(self, path: Union[str, os.PathLike]):
+        """Drop a file from the cache"""
+        with self._lock:
+            old = self._entries.pop(os.fspath(path), None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def clear(self):
+        """Drop every cached file"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, float]: "hits", "misses", "evictions", "entries", "bytes",
+                "max_bytes" and "hit_ratio".
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,149 @@
+"""
+Batch fuzzy scoring of filenames against a search term
+"""
+import heapq
+from concurrent.futures import Executor
+from typing import List, Sequence, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+
+def score_batch(term_lower: str, choices_lower: Sequence[str], min_score: int = 0) -> np.ndarray:
+    """
+    Score a lowercased search term against many lowercased strings at once.
+
+    Each score is the best of the full and partial fuzzy ratios (0-100). Both
+    scorers run natively over the whole batch with an early cutoff, so strings
+    that can't beat min_score are abandoned early and come back as 0.
+
+    rapidfuzz's partial ratio searches every alignment, where fuzzywuzzy's
+    only tried those at its matching blocks, so partial scores can be higher
+    than they used to be and cross min_score (e.g. "acme" vs "resume" is 67
+    here, 50 with fuzzywuzzy).
+
+    Args:
+        term_lower (str): The lowercased search term.
+        choices_lower (Sequence[str]): The lowercased strings to score.
+        min_score (int, optional): Scores at or below this are reported as 0.
+
+    Returns:
+        np.ndarray: One int32 score per choice, in input order.
+    """
+    if len(choices_lower) == 0:
+        return np.zeros(0, dtype=np.int32)
+
+    cutoff = min_score + 1
+    queries = [term_lower]
+    full = process.cdist(queries, choices_lower, scorer=fuzz.ratio,
+                         score_cutoff=cutoff, dtype=np.int32)[0]
+    partial = process.cdist(queries, choices_lower, scorer=fuzz.partial_ratio,
+                            score_cutoff=cutoff, dtype=np.int32)[0]
+    return np.maximum(full, partial)
+
+
+def top_k(keys: np.ndarray, k: int) -> np.ndarray:
+    """
+    Get the positions of the k largest keys, largest first.
+
+    Uses a partial selection so only the selected keys are fully sorted.
+
+    Args:
+        keys (np.ndarray): The values to rank.
+        k (int): How many positions to return.
+
+    Returns:
+        np.ndarray: Indices into keys, sorted by descending key.
+    """
+    if k <= 0 or len(keys) == 0:
+        return np.zeros(0, dtype=np.intp)
+    if k < len(keys):
+        selected = np.argpartition(-keys, k - 1)[:k]
+    else:
+        selected = np.arange(len(keys))
+    return selected[np.argsort(-keys[selected], kind="stable")]
+
+
+def rank_filenames(
+        term_lower: str,
+        stems_lower: Sequence[str],
+        min_score: int = 60,
+        limit: int = 10) -> List[Tuple[int, int]]:
+    """
+    Find the best fuzzy matches for a search term among filename stems.
+
+    Args:
+        term_lower (str): The lowercased search term.
+        stems_lower (Sequence[str]): The lowercased filename stems to rank.
+        min_score (int, optional): Only stems scoring above this are returned.
+        limit (int, optional): Maximum number of matches to return.
+
+    Returns:
+        List[Tuple[int, int]]: (position in stems_lower, score) pairs, best
+            first. Equal scores prefer the shorter, i.e. tighter, stem, then
+            the earlier position (fuzzywuzzy-era results kept ties in vault
+            order).
+    """
+    scores = score_batch(term_lower, stems_lower, min_score)
+    matched = np.flatnonzero(scores > min_score)
+    if len(matched) == 0:
+        return []
+
+    lengths = np.fromiter((len(stems_lower[i]) for i in matched),
+                          dtype=np.int64, count=len(matched))
+    # Pack score, length and position into one unique key so that ties are
+    # broken the same way whichever matches the partial selection looks at
+    keys = ((scores[matched].astype(np.int64) * 1024 - np.minimum(lengths, 1023)) << 32) \
+        - matched.astype(np.int64)
+    return [(int(matched[i]), int(scores[matched[i]]))
+            for i in top_k(keys, limit)]
+
+
+def _rank_shard(term_lower: str, stems_lower: List[str], offset: int,
+                min_score: int, limit: int) -> List[Tuple[int, int, int]]:
+    """Rank one shard in a worker process; returns (position, score, length)"""
+    return [(offset + i, score, len(stems_lower[i]))
+            for i, score in rank_filenames(term_lower, stems_lower, min_score, limit)]
+
+
+def rank_filenames_parallel(
+        executor: Executor,
+        term_lower: str,
+        stems_lower: Sequence[str],
+        min_score: int = 60,
+        limit: int = 10,
+        shard_size: int = 25_000) -> List[Tuple[int, int]]:
+    """
+    Like rank_filenames, but shards the stems across a process pool.
+
+    Every worker ranks its own shard down to a local top `limit`, and the
+    shard results are merged here. Inputs no larger than one shard are
+    ranked in-process, where the pickling overhead isn't worth paying.
+
+    Args:
+        executor (Executor): A pool of worker processes.
+        term_lower (str): The lowercased search term.
+        stems_lower (Sequence[str]): The lowercased filename stems to rank.
+        min_score (int, optional): Only stems scoring above this are returned.
+        limit (int, optional): Maximum number of matches to return.
+        shard_size (int, optional): Number of stems sent to each worker task.
+
+    Returns:
+        List[Tuple[int, int]]: (position in stems_lower, score) pairs, best first.
+    """
+    if len(stems_lower) <= shard_size:
+        return rank_filenames(term_lower, stems_lower, min_score, limit)
+
+    futures = [
+        executor.submit(_rank_shard, term_lower, list(stems_lower[start:start + shard_size]),
+                        start, min_score, limit)
+        for start in range(0, len(stems_lower), shard_size)
+    ]
+    shard_results = [future.result() for future in futures]
+
+    # Same order as rank_filenames: score, then shorter stem, then position
+    best = heapq.nsmallest(
+        limit,
+        (match for shard in shard_results for match in shard),
+        key=lambda match: (-match[1], min(match[2], 1023), match[0]))
+    return [(position, score) for position, score, _ in best]
@@ -0,0 +1,89 @@
+"""
+Running blocking filesystem work off the event loop, with cancellation
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional
+
+_local = threading.local()
+
+
+class OperationCancelled(Exception):
+    """Raised inside a worker thread when the call it serves was cancelled"""
+
+
+def check_cancelled():
+    """
+    Stop blocking work early if the call that started it was cancelled.
+
+    Long loops running through run_blocking call this between steps. Outside
+    of run_blocking it does nothing.
+
+    Raises:
+        OperationCancelled: If the calling coroutine has been cancelled.
+    """
+    event = getattr(_local, "cancel_event", None)
+    if event is not None and event.is_set():
+        raise OperationCancelled()
+
+
+async def run_blocking(executor: Optional[Executor], func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking function on a thread pool and await its result.
+
+    The caller's context variables are carried over to the worker thread, so
+    the function can still look up the current MCP request. If the awaiting
+    coroutine is cancelled, work that hasn't started yet never runs, and
+    work already running sees check_cancelled() raise at its next check.
+
+    Args:
+        executor (Executor, optional): The thread pool. None uses the event
+            loop's default executor.
+        func (Callable): The blocking function.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        Any: Whatever func returns.
+    """
+    event = threading.Event()
+    context = contextvars.copy_context()
+
+    def call():
+        _local.cancel_event = event
+        try:
+            return context.run(func, *args, **kwargs)
+        finally:
+            _local.cancel_event = None
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, call)
+    except asyncio.CancelledError:
+        event.set()
+        raise
+
+
+def offload(get_executor: Callable[[], Optional[Executor]]):
+    """
+    Decorator turning a blocking function into a coroutine run through run_blocking.
+
+    The wrapper keeps the function's name, docstring and signature, so it can
+    be registered as an MCP tool in place of the blocking function.
+
+    Args:
+        get_executor (Callable[[], Executor]): Called on every invocation to
+            get the thread pool to run on.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(func: Callable[..., Any]):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await run_blocking(get_executor(), func, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,39 +1,173 @@
+import asyncio
 import logging
 import os
+import threading
 from pathlib import Path
+import httpx
 import requests
-from typing import Dict
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, Optional, Tuple
 
-from resume_mcp.config import LATEX_SERVER_URL
+from resume_mcp.config import (
+    LATEX_BATCH_CONCURRENCY,
+    LATEX_COMPILE_TIMEOUT,
+    LATEX_CONNECT_TIMEOUT,
+    LATEX_HEALTH_TIMEOUT,
+    LATEX_POOL_SIZE,
+    LATEX_SERVER_URL
+)
+from resume_mcp.utils.io_pool import run_blocking
+from resume_mcp.utils.pdf_cache import PdfCache, cache_key
+from resume_mcp.utils.vault_writer import atomic_write
+
+if TYPE_CHECKING:
+    from resume_mcp.utils.latex_health import LatexHealthMonitor
 
 logger = logging.getLogger(__name__)
 
 # Configuration
-LATEX_SERVER_TIMEOUT = 60  # seconds
+LATEX_SERVER_TIMEOUT = LATEX_COMPILE_TIMEOUT  # seconds
+
+
+class LatexClient:
+    """
+    Long-lived HTTP client of the LaTeX compilation server.
 
+    Requests go through one requests.Session, whose connection pool keeps
+    connections to the server alive between calls, so health checks and
+    compiles after the first skip the TCP handshake. The session is
+    thread-safe for this use and shared by every request of the server.
 
-def check_latex_server() -> Dict:
+    Args:
+        base_url (str, optional): URL of the LaTeX server. Defaults to LATEX_SERVER_URL.
+        pool_size (int, optional): Connections kept alive. Defaults to LATEX_POOL_SIZE.
+        connect_timeout (float, optional): Seconds to wait for a connection.
+        health_timeout (float, optional): Seconds to wait for a health check response.
+        compile_timeout (float, optional): Seconds to wait for a compiled PDF.
+    """
+
+    def __init__(
+            self,
+            base_url: str = LATEX_SERVER_URL,
+            pool_size: int = LATEX_POOL_SIZE,
+            connect_timeout: float = LATEX_CONNECT_TIMEOUT,
+            health_timeout: float = LATEX_HEALTH_TIMEOUT,
+            compile_timeout: float = LATEX_COMPILE_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.health_timeout = health_timeout
+        self.compile_timeout = compile_timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self) -> "LatexClient":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Close the pooled connections"""
+        self.session.close()
+
+    def get_health(self) -> requests.Response:
+        """GET the server's /health endpoint"""
+        return self.session.get(
+            f"{self.base_url}/health",
+            timeout=(self.connect_timeout, self.health_timeout))
+
+    def post_compile(self, content: str, filename: str) -> requests.Response:
+        """POST LaTeX source to the server's /compile endpoint"""
+        return self.session.post(
+            f"{self.base_url}/compile",
+            json={"content": content, "filename": filename},
+            timeout=(self.connect_timeout, self.compile_timeout),
+            headers={"Content-Type": "application/json"})
+
+
+class AsyncLatexClient:
+    """
+    Asyncio HTTP client of the LaTeX compilation server.
+
+    The counterpart of LatexClient for coroutines: requests are awaited on
+    the event loop instead of blocking it, so other MCP requests are served
+    while pdflatex runs, and up to pool_size compiles share kept-alive
+    connections. Must be closed with aclose() on the loop it was used on.
+
+    Args:
+        base_url (str, optional): URL of the LaTeX server. Defaults to LATEX_SERVER_URL.
+        pool_size (int, optional): Connections kept alive. Defaults to LATEX_POOL_SIZE.
+        connect_timeout (float, optional): Seconds to wait for a connection.
+        health_timeout (float, optional): Seconds to wait for a health check response.
+        compile_timeout (float, optional): Seconds to wait for a compiled PDF.
+    """
+
+    def __init__(
+            self,
+            base_url: str = LATEX_SERVER_URL,
+            pool_size: int = LATEX_POOL_SIZE,
+            connect_timeout: float = LATEX_CONNECT_TIMEOUT,
+            health_timeout: float = LATEX_HEALTH_TIMEOUT,
+            compile_timeout: float = LATEX_COMPILE_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.health_timeout = health_timeout
+        self.compile_timeout = compile_timeout
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=httpx.Timeout(compile_timeout, connect=connect_timeout))
+
+    async def __aenter__(self) -> "AsyncLatexClient":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the pooled connections"""
+        await self.client.aclose()
+
+    async def get_health(self) -> httpx.Response:
+        """GET the server's /health endpoint"""
+        return await self.client.get(
+            f"{self.base_url}/health",
+            timeout=httpx.Timeout(self.health_timeout, connect=self.connect_timeout))
+
+    async def post_compile(self, content: str, filename: str) -> httpx.Response:
+        """POST LaTeX source to the server's /compile endpoint"""
+        return await self.client.post(
+            f"{self.base_url}/compile",
+            json={"content": content, "filename": filename})
+
+
+_default_client: Optional[LatexClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> LatexClient:
+    """Get the client used when callers don't pass one, created on first use"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = LatexClient()
+        return _default_client
+
+
+def check_latex_server(client: Optional[LatexClient] = None) -> Dict:
     """
     Check if the LaTeX compilation server is running and healthy.
 
+    Args:
+        client (LatexClient, optional): The HTTP client to use. Defaults to a shared one.
+
     Returns:
         Dict: {"available": bool, "message": str, "details": dict}
     """
+    client = client or get_default_client()
     try:
-        response = requests.get(f"{LATEX_SERVER_URL}/health", timeout=5)
-        if response.status_code == 200:
-            health_data = response.json()
-            return {
-                "available": True,
-                "message": "LaTeX server is running and healthy",
-                "details": health_data
-            }
-        else:
-            return {
-                "available": False,
-                "message": f"LaTeX server responded with status {response.status_code}",
-                "details": {}
-            }
+        return _server_status(client.get_health())
     except requests.exceptions.RequestException as e:
         return {
             "available": False,
@@ -42,61 +176,141 @@ def check_latex_server() -> Dict:
         }
 
 
-def compile_latex_http(content: str, dest: str) -> Dict:
+def _server_status(response) -> Dict:
+    """Turn a /health response of either client into check_latex_server()'s result"""
+    if response.status_code == 200:
+        return {
+            "available": True,
+            "message": "LaTeX server is running and healthy",
+            "details": response.json()
+        }
+    return {
+        "available": False,
+        "message": f"LaTeX server responded with status {response.status_code}",
+        "details": {}
+    }
+
+
+def _unavailable_error(server_status: Dict) -> Optional[str]:
+    """The compile error for a server that can't take compiles, or None if it can"""
+    if not server_status["available"]:
+        return f"{server_status['message']}. Please start the LaTeX server with: docker-compose up -d"
+    if not server_status["details"].get("pdflatex_available", False):
+        return "pdflatex is not available on the LaTeX server"
+    return None
+
+
+def _compile_error(response) -> str:
+    """The error message of a failed /compile response of either client"""
+    try:
+        error_detail = response.json().get("detail", "Unknown error")
+    except Exception:
+        error_detail = response.text[:500] if response.text else "Unknown error"
+    return f"LaTeX compilation failed: {error_detail}"
+
+
+def _cache_key(content: str, client) -> str:
+    """Cache key of a compile: the source and the server compiling it"""
+    return cache_key(content, {"server": client.base_url})
+
+
+def _from_cache(cache: Optional[PdfCache], key: str, dest: str) -> bool:
+    """Put a cached PDF at dest; False if there is none (or no cache)"""
+    if cache is None or not cache.get(key, dest):
+        return False
+    logger.info(f"PDF for {dest} served from the compile cache")
+    return True
+
+
+def _save_pdf(data: bytes, dest: str, cache: Optional[PdfCache], key: str):
+    """Write a compiled PDF to dest, replacing it atomically, and cache it"""
+    atomic_write(dest, data, fsync=False)
+    if cache is not None:
+        try:
+            cache.put(key, data)
+        except OSError as e:
+            logger.warning(f"Cannot cache the PDF for {dest}: {e}")
+
+
+async def check_latex_server_async(client: AsyncLatexClient) -> Dict:
+    """
+    Check if the LaTeX compilation server is running and healthy, without blocking.
+
+    Args:
+        client (AsyncLatexClient): The HTTP client to use.
+
+    Returns:
+        Dict: {"available": bool, "message": str, "details": dict}
+    """
+    try:
+        return _server_status(await client.get_health())
+    except httpx.HTTPError as e:
+        return {
+            "available": False,
+            "message": "LaTeX server is not running",
+            "details": {"error": str(e)}
+        }
+
+
+def compile_latex_http(
+        content: str,
+        dest: str,
+        client: Optional[LatexClient] = None,
+        monitor: Optional["LatexHealthMonitor"] = None,
+        cache: Optional[PdfCache] = None) -> Dict:
     """
     Compiles LaTeX content to PDF using the HTTP LaTeX server.
 
     Args:
         content (str): LaTeX source content to compile
         dest (str): Destination path for the output PDF file
+        client (LatexClient, optional): The HTTP client to use. Defaults to a shared one.
+        monitor (LatexHealthMonitor, optional): Cached server health to consult
+            instead of probing /health before every compile.
+        cache (PdfCache, optional): Compiled PDFs to reuse for identical source.
     Returns:
         Dict: {"success": {"dest": path}} or {"error": error_message}
     """
+    client = client or get_default_client()
     dest_path = Path(dest)
     filename = dest_path.stem
 
     try:
-        # Check if server is available first
-        server_status = check_latex_server()
-        if not server_status["available"]:
-            return {"error": f"{server_status['message']}. Please start the LaTeX server with: docker-compose up -d"}
-
-        # Check if pdflatex is available on the server
-        health_data = server_status["details"]
-        if not health_data.get("pdflatex_available", False):
-            return {"error": "pdflatex is not available on the LaTeX server"}
-
-        # Prepare request payload
-        payload = {
-            "content": content,
-            "filename": filename
-        }
+        key = _cache_key(content, client)
+        if _from_cache(cache, key, dest):
+            return {"success": {"dest": dest}}
+
+        if monitor is not None:
+            # Fails fast while the server is known to be down
+            allowed, reason = monitor.allow_request()
+            if not allowed:
+                return {"error": f"{reason}. Please start the LaTeX server with: docker-compose up -d"}
+        else:
+            # Check that the server is up and has pdflatex first
+            error = _unavailable_error(check_latex_server(client))
+            if error:
+                return {"error": error}
 
         # Make compilation request
         logger.info(
-            f"Sending LaTeX compilation request to {LATEX_SERVER_URL}/compile")
-        response = requests.post(
-            f"{LATEX_SERVER_URL}/compile",
-            json=payload,
-            timeout=LATEX_SERVER_TIMEOUT,
-            headers={"Content-Type": "application/json"}
-        )
+            f"Sending LaTeX compilation request to {client.base_url}/compile")
+        try:
+            response = client.post_compile(content, filename)
+        except requests.exceptions.RequestException:
+            if monitor is not None:
+                monitor.record_failure()
+            raise
+        if monitor is not None:
+            monitor.record_success()
 
         if response.status_code == 200:
             # Save the PDF content to destination
-            with open(dest, "wb") as f:
-                f.write(response.content)
+            _save_pdf(response.content, dest, cache, key)
 
             logger.info(f"PDF compiled and saved successfully to {dest}")
             return {"success": {"dest": dest}}
         else:
-            # Handle error response
-            try:
-                error_detail = response.json().get("detail", "Unknown error")
-            except:
-                error_detail = response.text[:500] if response.text else "Unknown error"
-
-            return {"error": f"LaTeX compilation failed: {error_detail}"}
+            return {"error": _compile_error(response)}
 
     except requests.exceptions.Timeout:
         return {"error": "LaTeX compilation timed out (server took too long)"}
@@ -106,7 +320,12 @@ def compile_latex_http(content: str, dest: str) -> Dict:
         return {"error": f"Unexpected error during LaTeX compilation: {str(e)}"}
 
 
-def compile_latex(content: str, dest: str) -> Dict:
+def compile_latex(
+        content: str,
+        dest: str,
+        client: Optional[LatexClient] = None,
+        monitor: Optional["LatexHealthMonitor"] = None,
+        cache: Optional[PdfCache] = None) -> Dict:
     """
     Compiles LaTeX content to a PDF file using the HTTP LaTeX server.
 
@@ -116,6 +335,11 @@ def compile_latex(content: str, dest: str) -> Dict:
     Args:
         content (str): LaTeX source content to compile
         dest (str): Destination path for the output PDF file
+        client (LatexClient, optional): The HTTP client to use. Defaults to a shared one.
+        monitor (LatexHealthMonitor, optional): Cached server health to consult
+            instead of probing the server first.
+        cache (PdfCache, optional): Compiled PDFs to reuse for identical source;
+            a hit is copied to dest without calling the server.
     Returns:
         Dict: A dictionary with one of the following structures:
             - {"success": {"dest": path_to_pdf}} if compilation succeeds
@@ -128,7 +352,7 @@ def compile_latex(content: str, dest: str) -> Dict:
     logger.info(f"Compiling LaTeX content via HTTP server to: {dest}")
 
     # Use HTTP-based compilation
-    result = compile_latex_http(content, dest)
+    result = compile_latex_http(content, dest, client, monitor, cache)
 
     # Log the result
     if "success" in result:
@@ -139,20 +363,152 @@ def compile_latex(content: str, dest: str) -> Dict:
 
     return result
 
+
+async def compile_latex_async(
+        content: str,
+        dest: str,
+        client: AsyncLatexClient,
+        monitor: Optional["LatexHealthMonitor"] = None,
+        cache: Optional[PdfCache] = None) -> Dict:
+    """
+    Compiles LaTeX content to a PDF file without blocking the event loop.
+
+    Same contract as compile_latex(); the request to the server is awaited
+    and the PDF is written on a worker thread, so other requests, compiles
+    and LLM calls proceed while pdflatex runs.
+
+    Args:
+        content (str): LaTeX source content to compile
+        dest (str): Destination path for the output PDF file
+        client (AsyncLatexClient): The HTTP client to use.
+        monitor (LatexHealthMonitor, optional): Cached server health to consult
+            instead of probing the server first.
+        cache (PdfCache, optional): Compiled PDFs to reuse for identical source;
+            a hit is copied to dest without calling the server.
+    Returns:
+        Dict: {"success": {"dest": path_to_pdf}} or {"error": error_message}
+    """
+    logger.info(f"Compiling LaTeX content via HTTP server to: {dest}")
+    result = await _compile_latex_async(content, dest, client, monitor, cache)
+    if "success" in result:
+        logger.info(
+            f"LaTeX compilation successful: {result['success']['dest']}")
+    else:
+        logger.error(f"LaTeX compilation failed: {result['error']}")
+    return result
+
+
+async def _compile_latex_async(
+        content: str,
+        dest: str,
+        client: AsyncLatexClient,
+        monitor: Optional["LatexHealthMonitor"],
+        cache: Optional[PdfCache]) -> Dict:
+    try:
+        key = _cache_key(content, client)
+        if await run_blocking(None, _from_cache, cache, key, dest):
+            return {"success": {"dest": dest}}
+
+        if monitor is not None:
+            # Reads the cache, but may probe if it's out of date
+            allowed, reason = await run_blocking(None, monitor.allow_request)
+            if not allowed:
+                return {"error": f"{reason}. Please start the LaTeX server with: docker-compose up -d"}
+        else:
+            error = _unavailable_error(await check_latex_server_async(client))
+            if error:
+                return {"error": error}
+
+        logger.info(
+            f"Sending LaTeX compilation request to {client.base_url}/compile")
+        try:
+            response = await client.post_compile(content, Path(dest).stem)
+        except httpx.HTTPError:
+            if monitor is not None:
+                monitor.record_failure()
+            raise
+        if monitor is not None:
+            monitor.record_success()
+
+        if response.status_code != 200:
+            return {"error": _compile_error(response)}
+        await run_blocking(None, _save_pdf, response.content, dest, cache, key)
+        logger.info(f"PDF compiled and saved successfully to {dest}")
+        return {"success": {"dest": dest}}
+
+    except httpx.TimeoutException:
+        return {"error": "LaTeX compilation timed out (server took too long)"}
+    except httpx.HTTPError as e:
+        return {"error": f"Network error communicating with LaTeX server: {str(e)}"}
+    except Exception as e:
+        return {"error": f"Unexpected error during LaTeX compilation: {str(e)}"}
+
+
+async def compile_latex_batch(
+        items: Iterable[Tuple[str, str]],
+        client: AsyncLatexClient,
+        max_concurrency: int = LATEX_BATCH_CONCURRENCY,
+        monitor: Optional["LatexHealthMonitor"] = None,
+        cache: Optional[PdfCache] = None) -> AsyncIterator[Tuple[int, Dict]]:
+    """
+    Compiles many LaTeX documents, at most max_concurrency at a time.
+
+    Every compile goes through compile_latex_async() over the same pooled
+    client, so the batch takes about as long as its slowest compile (as
+    long as the server keeps up) rather than the sum of them. Results are
+    yielded as compiles finish, not in input order; leaving the loop early
+    cancels the compiles still pending.
+
+    Args:
+        items (Iterable[Tuple[str, str]]): (content, dest) pairs to compile.
+        client (AsyncLatexClient): The HTTP client to use.
+        max_concurrency (int, optional): Compiles in flight at once.
+            Defaults to LATEX_BATCH_CONCURRENCY.
+        monitor (LatexHealthMonitor, optional): Cached server health to consult.
+        cache (PdfCache, optional): Compiled PDFs to reuse for identical source.
+
+    Yields:
+        Tuple[int, Dict]: The item's position in items and its compile_latex()
+            result, {"success": {"dest": path}} or {"error": error_message}.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(index: int, content: str, dest: str) -> Tuple[int, Dict]:
+        async with semaphore:
+            return index, await compile_latex_async(content, dest, client, monitor, cache)
+
+    tasks = [asyncio.ensure_future(run(index, content, dest))
+             for index, (content, dest) in enumerate(items)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let the cancelled compiles unwind and close their requests
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 # Legacy function for backwards compatibility (now deprecated)
 
 
-def check_pdflatex() -> bool:
+def check_pdflatex(
+        client: Optional[LatexClient] = None,
+        monitor: Optional["LatexHealthMonitor"] = None) -> bool:
     """
     Check if the LaTeX server is available instead of local pdflatex.
 
     This function is kept for backwards compatibility but now checks
     the HTTP LaTeX server instead of local pdflatex installation.
 
+    Args:
+        client (LatexClient, optional): The HTTP client to use. Defaults to a shared one.
+        monitor (LatexHealthMonitor, optional): Cached server health to read
+            instead of probing the server.
+
     Returns:
         bool: True if LaTeX server is available, False otherwise.
     """
     logger.warning(
         "check_pdflatex() is deprecated. Use check_latex_server() instead.")
-    server_status = check_latex_server()
+    server_status = monitor.snapshot() if monitor is not None else check_latex_server(client)
     return server_status["available"] and server_status["details"].get("pdflatex_available", False)
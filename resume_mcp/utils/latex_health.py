@@ -0,0 +1,197 @@
+"""
+Cached health of the LaTeX server, with a circuit breaker
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from resume_mcp.utils import latex
+from resume_mcp.utils.latex import LatexClient
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class LatexHealthMonitor:
+    """
+    Keeps the LaTeX server's health on hand so compiles don't probe it first.
+
+    The result of the last /health probe is cached for ttl seconds. Once
+    start()ed, a background thread refreshes it every ttl/2 seconds, so it
+    never goes stale and reading it never waits on the server. After
+    failure_threshold consecutive failures (failed probes or compiles that
+    couldn't reach the server) the circuit opens and compiles fail fast
+    without a request. After reset_timeout seconds one trial request is let
+    through; if it gets through, or a probe succeeds, the circuit closes.
+
+    Args:
+        client (LatexClient): The client to probe the server with.
+        ttl (float, optional): Seconds a probe result counts as current. Defaults to 30.
+        failure_threshold (int, optional): Consecutive failures that open the
+            circuit. Defaults to 3.
+        reset_timeout (float, optional): Seconds the circuit stays open before
+            a trial request. Defaults to 30.
+    """
+
+    def __init__(
+            self,
+            client: LatexClient,
+            ttl: float = 30.0,
+            failure_threshold: int = 3,
+            reset_timeout: float = 30.0):
+        self.client = client
+        self.ttl = ttl
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._status: Optional[Dict] = None
+        self._checked_at = 0.0
+        self._latency_ms: Optional[float] = None
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_at: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LatexHealthMonitor":
+        """Probe now and then every ttl/2 seconds in a daemon thread"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="latex-health", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the background probes"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.probe()
+            except Exception as e:
+                logger.error(f"LaTeX server health probe failed: {e}")
+            # Well before the result is ttl old
+            self._stop.wait(self.ttl / 2)
+
+    def probe(self) -> Dict:
+        """
+        Check the server's /health endpoint now and cache the result.
+
+        Returns:
+            Dict: The new snapshot, see snapshot().
+        """
+        with self._probe_lock:
+            start = time.perf_counter()
+            status = latex.check_latex_server(self.client)
+            latency_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self._status = status
+                self._checked_at = time.time()
+                self._latency_ms = latency_ms
+                if status["available"]:
+                    self._close()
+                else:
+                    self._fail()
+                return self._snapshot()
+
+    def _close(self):
+        if self._opened_at is not None:
+            logger.info("LaTeX server is reachable again, closing the circuit")
+        self._failures = 0
+        self._opened_at = None
+        self._trial_at = None
+
+    def _fail(self):
+        self._failures += 1
+        if self._failures >= self.failure_threshold and self._opened_at is None:
+            logger.warning(
+                f"LaTeX server failed {self._failures} times in a row, opening the circuit")
+            self._opened_at = time.monotonic()
+        elif self._opened_at is not None and self._trial_at is not None:
+            # The trial request failed: stay open for another reset_timeout
+            self._opened_at = time.monotonic()
+            self._trial_at = None
+
+    def record_success(self):
+        """Report a request that reached the server"""
+        with self._lock:
+            self._close()
+
+    def record_failure(self):
+        """Report a request that couldn't reach the server"""
+        with self._lock:
+            self._fail()
+
+    def _circuit(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def _snapshot(self) -> Dict:
+        status = self._status or {"available": False, "message": "LaTeX server not checked yet", "details": {}}
+        return {
+            **status,
+            "checked_at": self._checked_at or None,
+            "age_seconds": round(time.time() - self._checked_at, 1) if self._checked_at else None,
+            "latency_ms": round(self._latency_ms, 1) if self._latency_ms is not None else None,
+            "circuit": self._circuit(),
+            "consecutive_failures": self._failures
+        }
+
+    def snapshot(self) -> Dict:
+        """
+        Get the cached server status.
+
+        While the background thread runs, this only reads the cache (the
+        thread keeps it current). Otherwise, or before the first probe has
+        finished, it probes if the result is older than ttl.
+
+        Returns:
+            Dict: check_latex_server()'s "available", "message" and "details",
+                plus "checked_at" (epoch seconds), "age_seconds", "latency_ms"
+                of the last probe, "circuit" ("closed", "open" or "half-open")
+                and "consecutive_failures".
+        """
+        with self._lock:
+            if self._status is not None and (
+                    self._thread is not None or time.time() - self._checked_at < self.ttl):
+                return self._snapshot()
+        return self.probe()
+
+    def allow_request(self) -> Tuple[bool, str]:
+        """
+        Decide from the cached state whether a compile should be sent.
+
+        Only an open circuit, or a server that answers but has no pdflatex,
+        refuses it.
+
+        Returns:
+            Tuple[bool, str]: Whether to send it, and the reason if not.
+        """
+        with self._lock:
+            circuit = self._circuit()
+            if circuit == OPEN:
+                retry_in = self.reset_timeout - (time.monotonic() - self._opened_at)
+                return False, (f"LaTeX server is unavailable ({self._failures} failures in a row); "
+                               f"not retrying for {retry_in:.0f}s")
+            if circuit == HALF_OPEN:
+                if self._trial_at is not None:
+                    return False, "LaTeX server is unavailable; a trial request is in flight"
+                self._trial_at = time.monotonic()
+                return True, ""
+        # A closed circuit lets the compile through even after a failed probe;
+        # it counts as one of the failures that open the circuit
+        status = self.snapshot()
+        if status["available"] and not status["details"].get("pdflatex_available", False):
+            return False, "pdflatex is not available on the LaTeX server"
+        return True, ""
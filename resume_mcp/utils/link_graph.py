@@ -0,0 +1,264 @@
+"""
+Forward link and backlink graph of the vault's notes, stored as CSR arrays
+"""
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from resume_mcp.utils.note_metadata import MetadataIndex, normalize_link
+from resume_mcp.utils.vault_index import REMOVE, RESET, UPSERT, VaultIndex
+
+logger = logging.getLogger(__name__)
+
+FORWARD = "forward"
+BACKWARD = "backward"
+BOTH = "both"
+
+
+def build_csr(sources: np.ndarray, targets: np.ndarray, n_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack an edge list into compressed sparse row arrays.
+
+    Args:
+        sources (np.ndarray): Source node of every edge.
+        targets (np.ndarray): Target node of every edge.
+        n_nodes (int): Number of node ids.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: indptr (n_nodes + 1 offsets) and indices,
+            so the targets of node i are indices[indptr[i]:indptr[i + 1]], sorted.
+    """
+    order = np.lexsort((targets, sources))
+    indices = targets[order].astype(np.int32)
+    counts = np.bincount(sources, minlength=n_nodes)
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return indptr, indices
+
+
+class LinkGraph:
+    """
+    Which notes link to which, for expanding search results to related notes.
+
+    The outgoing [[wikilinks]] of every note are taken from the metadata
+    index and updated note by note as the vault changes. Links are resolved
+    like Obsidian does, by vault path or else by note name, and compiled
+    into CSR arrays of forward links and backlinks on the first query after
+    a change, since adding or renaming one note can change what other
+    notes' links point to.
+
+    Args:
+        vault_path (str): Root of the vault the relative paths point into.
+        metadata_index (MetadataIndex): Where the notes' links are parsed.
+    """
+
+    def __init__(self, vault_path: str, metadata_index: MetadataIndex):
+        self.vault_path = Path(vault_path)
+        self.metadata_index = metadata_index
+        self._lock = threading.RLock()
+        self._ids: Dict[str, int] = {}
+        self._paths: List[Optional[str]] = []
+        self._free: List[int] = []
+        # Relative path -> normalized link targets
+        self._links: Dict[str, Set[str]] = {}
+        self._dirty = True
+        self._forward = (np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32))
+        self._backward = self._forward
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def build(self, vault_index: VaultIndex) -> "LinkGraph":
+        """
+        Load the links of every note in a vault index and follow its changes.
+
+        Subscribe after the metadata index, so that it has parsed a change
+        by the time the graph hears about it.
+
+        Args:
+            vault_index (VaultIndex): The filename index of the vault.
+
+        Returns:
+            LinkGraph: The graph itself, for chaining.
+        """
+        self._reset(vault_index.relative_paths())
+        vault_index.subscribe(
+            lambda event, relative_path: self.on_vault_event(vault_index, event, relative_path))
+        return self
+
+    def on_vault_event(self, vault_index: VaultIndex, event: str, relative_path: Optional[str]):
+        """Apply a change reported by the vault index"""
+        if event == UPSERT:
+            self.update(relative_path)
+        elif event == REMOVE:
+            self.remove(relative_path)
+        elif event == RESET:
+            self._reset(vault_index.relative_paths())
+
+    def _reset(self, relative_paths: List[str]):
+        with self._lock:
+            self._ids.clear()
+            self._paths.clear()
+            self._free.clear()
+            self._links.clear()
+            for relative_path in relative_paths:
+                self.update(relative_path)
+            self._dirty = True
+
+    def update(self, relative_path: str):
+        """Take a note's current links from the metadata index"""
+        metadata = self.metadata_index.metadata(relative_path)
+        with self._lock:
+            if relative_path not in self._ids:
+                node = self._free.pop() if self._free else len(self._paths)
+                if node == len(self._paths):
+                    self._paths.append(None)
+                self._ids[relative_path] = node
+                self._paths[node] = relative_path
+            self._links[relative_path] = set(metadata.links) if metadata else set()
+            self._dirty = True
+
+    def remove(self, relative_path: str):
+        """Drop a note and its outgoing links"""
+        with self._lock:
+            node = self._ids.pop(relative_path, None)
+            if node is None:
+                return
+            self._paths[node] = None
+            self._free.append(node)
+            self._links.pop(relative_path, None)
+            self._dirty = True
+
+    def _compile(self):
+        """Resolve every link and rebuild the CSR arrays if anything changed"""
+        if not self._dirty:
+            return
+
+        by_path: Dict[str, int] = {}
+        by_name: Dict[str, Tuple[int, str, int]] = {}
+        for relative_path, node in self._ids.items():
+            key = normalize_link(relative_path)
+            by_path[key] = node
+            name = key.rsplit("/", 1)[-1]
+            # Ambiguous names resolve to the note closest to the vault root
+            rank = (key.count("/"), key, node)
+            if name not in by_name or rank < by_name[name]:
+                by_name[name] = rank
+
+        sources, targets = [], []
+        for relative_path, links in self._links.items():
+            source = self._ids[relative_path]
+            for target in links:
+                node = by_path.get(target)
+                if node is None:
+                    resolved = by_name.get(target.rsplit("/", 1)[-1])
+                    node = resolved[2] if resolved else None
+                if node is not None and node != source:
+                    sources.append(source)
+                    targets.append(node)
+
+        n_nodes = len(self._paths)
+        sources = np.array(sources, dtype=np.int64)
+        targets = np.array(targets, dtype=np.int64)
+        self._forward = build_csr(sources, targets, n_nodes)
+        self._backward = build_csr(targets, sources, n_nodes)
+        self._dirty = False
+        logger.info(f"Link graph compiled: {len(self._ids)} notes, {len(sources)} links")
+
+    def neighbors(self, relative_path: str, direction: str = BOTH) -> List[str]:
+        """
+        Get the notes a note links to, is linked from, or both.
+
+        Args:
+            relative_path (str): Vault-relative path of the note.
+            direction (str, optional): "forward", "backward" or "both". Defaults to "both".
+
+        Returns:
+            List[str]: Vault-relative paths of the neighbouring notes.
+        """
+        with self._lock:
+            self._compile()
+            node = self._ids.get(relative_path)
+            if node is None:
+                return []
+            return sorted({self._paths[other] for other, _ in self._neighbors(node, direction)})
+
+    def _neighbors(self, node: int, direction: str) -> Iterable[Tuple[int, str]]:
+        if direction in (FORWARD, BOTH):
+            indptr, indices = self._forward
+            for other in indices[indptr[node]:indptr[node + 1]]:
+                yield int(other), FORWARD
+        if direction in (BACKWARD, BOTH):
+            indptr, indices = self._backward
+            for other in indices[indptr[node]:indptr[node + 1]]:
+                yield int(other), BACKWARD
+
+    def expand(
+            self,
+            relative_paths: Iterable[str],
+            hops: int = 1,
+            max_bytes: int = 200_000,
+            direction: str = BOTH) -> Tuple[List[Dict], int]:
+        """
+        Collect the notes within a number of links of a set of notes.
+
+        Notes are visited breadth first, so closer notes are preferred, and
+        are kept while their total size on disk fits in max_bytes. Notes the
+        same number of hops away are taken in path order.
+
+        Args:
+            relative_paths (Iterable[str]): The notes to start from.
+            hops (int, optional): How many links away to look. Defaults to 1.
+            max_bytes (int, optional): Size budget of the collected notes. Defaults to 200000.
+            direction (str, optional): Follow "forward" links, "backward" links
+                (backlinks) or "both". Defaults to "both".
+
+        Returns:
+            Tuple[List[Dict], int]: The collected notes, with "path", "filename",
+                "relative_path", "hops", "via" (the note it was reached from),
+                "direction" and "size", closest first; and the number of notes
+                left out because of the budget.
+        """
+        with self._lock:
+            self._compile()
+            seeds = [self._ids[p] for p in relative_paths if p in self._ids]
+            visited = set(seeds)
+            frontier = seeds
+            found = []
+            for hop in range(1, hops + 1):
+                next_frontier = []
+                for node in frontier:
+                    for other, how in self._neighbors(node, direction):
+                        if other not in visited:
+                            visited.add(other)
+                            next_frontier.append(other)
+                            found.append((self._paths[other], hop, self._paths[node], how))
+                if not next_frontier:
+                    break
+                frontier = next_frontier
+            found.sort(key=lambda note: (note[1], note[0]))
+
+        results, used, skipped = [], 0, 0
+        for relative_path, hop, via, how in found:
+            try:
+                size = os.stat(self.vault_path / relative_path).st_size
+            except OSError:
+                continue
+            if used + size > max_bytes:
+                skipped += 1
+                continue
+            used += size
+            results.append({
+                "path": str(self.vault_path / relative_path),
+                "filename": Path(relative_path).stem,
+                "relative_path": relative_path,
+                "hops": hop,
+                "via": via,
+                "direction": how,
+                "size": size
+            })
+        return results, skipped
@@ -0,0 +1,402 @@
+"""
+Index of Obsidian frontmatter properties, #tags and [[wikilinks]]
+"""
+import json
+import logging
+import os
+import re
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from resume_mcp.utils.chunks import Chunk, split_chunks
+from resume_mcp.utils.vault_index import REMOVE, RESET, UPSERT, VaultIndex
+
+if TYPE_CHECKING:
+    from resume_mcp.utils.vault_store import VaultStore
+
+logger = logging.getLogger(__name__)
+
+FRONTMATTER_RE = re.compile(r"\A---[ \t]*\r?\n(.*?)(?:\r?\n)(?:---|\.\.\.)[ \t]*(?:\r?\n|\Z)", re.DOTALL)
+PROPERTY_RE = re.compile(r"^([^\s:#-][^:]*):(?:[ \t]+(.*))?$")
+LIST_ITEM_RE = re.compile(r"^[ \t]+-[ \t]+(.*)$")
+CODE_RE = re.compile(r"```.*?```|`[^`\n]*`", re.DOTALL)
+TAG_RE = re.compile(r"(?<![^\s(\[,])#([\w][\w/-]*)")
+WIKILINK_RE = re.compile(r"!?\[\[([^\]|#^]*)[^\]]*\]\]")
+
+
+@dataclass
+class NoteMetadata:
+    """What a note says about itself besides its body text"""
+    properties: Dict[str, List[str]] = field(default_factory=dict)
+    tags: Set[str] = field(default_factory=set)
+    links: Set[str] = field(default_factory=set)
+    chunks: List[Chunk] = field(default_factory=list)
+
+
+def _scalar(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        value = value[1:-1]
+    return value
+
+
+def _values(value: str) -> List[str]:
+    value = value.strip()
+    if value.startswith("[") and value.endswith("]"):
+        return [_scalar(item) for item in value[1:-1].split(",") if item.strip()]
+    return [_scalar(value)] if value else []
+
+
+def parse_frontmatter(text: str) -> Dict[str, List[str]]:
+    """
+    Parse the flat YAML frontmatter Obsidian uses for note properties.
+
+    Supports `key: value`, inline `[a, b]` lists and indented `- item` lists.
+    Nested mappings are not supported and are skipped.
+
+    Args:
+        text (str): The note text.
+
+    Returns:
+        Dict[str, List[str]]: Lowercased property names mapped to their values.
+    """
+    match = FRONTMATTER_RE.match(text)
+    if not match:
+        return {}
+
+    properties: Dict[str, List[str]] = {}
+    key = None
+    for line in match.group(1).splitlines():
+        item = LIST_ITEM_RE.match(line)
+        if item and key is not None:
+            properties[key].extend(_values(item.group(1)))
+            continue
+        prop = PROPERTY_RE.match(line)
+        if prop:
+            key = prop.group(1).strip().lower()
+            properties[key] = _values(prop.group(2) or "")
+        elif line.strip() and not line[0].isspace():
+            key = None
+    return properties
+
+
+def normalize_tag(tag: str) -> str:
+    """Lowercase a tag and drop its leading '#'"""
+    return tag.strip().lstrip("#").lower()
+
+
+def normalize_link(target: str) -> str:
+    """Reduce a wikilink target to a lowercased vault path without extension"""
+    target = target.strip().replace("\\", "/")
+    if target.lower().endswith(".md"):
+        target = target[:-3]
+    return target.lower()
+
+
+def parse_note(text: str) -> NoteMetadata:
+    """
+    Extract the properties, tags and links of a note.
+
+    Tags come from the `tags` property and from #tags in the body outside
+    code. Purely numeric #words (issue numbers and the like) aren't tags.
+
+    Args:
+        text (str): The note text.
+
+    Returns:
+        NoteMetadata: The parsed metadata.
+    """
+    properties = parse_frontmatter(text)
+    match = FRONTMATTER_RE.match(text)
+    body = CODE_RE.sub(" ", text[match.end():] if match else text)
+
+    tags = set()
+    for key in ("tags", "tag"):
+        for value in properties.get(key, []):
+            tags.update(normalize_tag(_scalar(tag)) for tag in re.split(r"[\s,]+", value)
+                        if _scalar(tag).strip("#"))
+    tags.update(normalize_tag(tag) for tag in TAG_RE.findall(body) if not tag.isdigit())
+
+    links = {normalize_link(target) for target in WIKILINK_RE.findall(text) if target.strip()}
+    return NoteMetadata(properties=properties, tags=tags, links=links)
+
+
+def dump_metadata(metadata: NoteMetadata) -> str:
+    """Serialize parsed metadata, chunks included, to JSON"""
+    return json.dumps({
+        "properties": metadata.properties,
+        "tags": sorted(metadata.tags),
+        "links": sorted(metadata.links),
+        "chunks": [[c.heading, c.level, c.start, c.end] for c in metadata.chunks]
+    }, ensure_ascii=False)
+
+
+def load_metadata(data: str) -> NoteMetadata:
+    """Rebuild metadata serialized by dump_metadata()"""
+    fields = json.loads(data)
+    return NoteMetadata(
+        properties=fields["properties"],
+        tags=set(fields["tags"]),
+        links=set(fields["links"]),
+        chunks=[Chunk(*chunk) for chunk in fields["chunks"]])
+
+
+def expand_tag(tag: str) -> List[str]:
+    """Get a nested tag and its parents, e.g. jobs/applied -> [jobs, jobs/applied]"""
+    parts = tag.split("/")
+    return ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+class MetadataIndex:
+    """
+    Lookup tables from tags, property values and link targets to notes,
+    plus the heading chunks of every note.
+
+    Every note gets a small integer id, and each tag (including the parents
+    of nested tags), property value and link target maps to the set of ids
+    carrying it. A note is only parsed again when its mtime or size change,
+    and filters are answered by intersecting id sets without reading files.
+
+    With a vault store, notes it holds at their current mtime and size are
+    loaded from it instead of parsed, so a restart only reads the notes that
+    changed. The store must be built from the same vault index first, so it
+    has stored a changed note by the time this index hears of it.
+
+    Args:
+        vault_path (str): Root of the vault the relative paths point into.
+        store (VaultStore, optional): Where parsed metadata is persisted.
+    """
+
+    def __init__(self, vault_path: str, store: Optional["VaultStore"] = None):
+        self.vault_path = Path(vault_path)
+        self.store = store
+        self._lock = threading.RLock()
+        self._ids: Dict[str, int] = {}
+        self._paths: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._signatures: List[Optional[Tuple[int, int]]] = []
+        self._metadata: List[Optional[NoteMetadata]] = []
+        self._tags: Dict[str, Set[int]] = {}
+        # Property -> value -> ids
+        self._properties: Dict[str, Dict[str, Set[int]]] = {}
+        self._linked_from: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def build(self, vault_index: VaultIndex) -> "MetadataIndex":
+        """
+        Parse every note in a vault index and follow its changes.
+
+        Args:
+            vault_index (VaultIndex): The filename index of the vault.
+
+        Returns:
+            MetadataIndex: The index itself, for chaining.
+        """
+        self.sync(vault_index.relative_paths())
+        vault_index.subscribe(
+            lambda event, relative_path: self.on_vault_event(vault_index, event, relative_path))
+        return self
+
+    def on_vault_event(self, vault_index: VaultIndex, event: str, relative_path: Optional[str]):
+        """Apply a change reported by the vault index"""
+        if event == UPSERT:
+            self.update(relative_path)
+        elif event == REMOVE:
+            self.remove(relative_path)
+        elif event == RESET:
+            self.sync(vault_index.relative_paths())
+
+    def sync(self, relative_paths: List[str]):
+        """
+        Parse new and changed notes and forget the ones that are gone.
+
+        Args:
+            relative_paths (List[str]): Every note currently in the vault.
+        """
+        stored = self.store.load_metadata() if self.store is not None else {}
+        with self._lock:
+            stale = set(self._ids)
+            for relative_path in relative_paths:
+                stale.discard(relative_path)
+                self.update(relative_path, stored.get(relative_path))
+            for relative_path in stale:
+                self.remove(relative_path)
+        logger.info(f"Indexed the properties, tags and links of {len(self)} notes")
+
+    def update(self, relative_path: str,
+               stored: Optional[Tuple[Tuple[int, int], str]] = None) -> bool:
+        """
+        Parse a note from disk unless it is unchanged since it was last parsed.
+
+        Args:
+            relative_path (str): The note to index.
+            stored (Tuple[Tuple[int, int], str], optional): The note's (mtime_ns,
+                size) and serialized metadata in the store, if already looked up.
+
+        Returns:
+            bool: True if the note is indexed.
+        """
+        path = self.vault_path / relative_path
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            note_id = self._ids.get(relative_path)
+            if note_id is not None and self._signatures[note_id] == signature:
+                return True
+
+            if stored is None and self.store is not None:
+                stored = self.store.note_metadata(relative_path)
+            if stored is not None and stored[0] == signature:
+                metadata = load_metadata(stored[1])
+            else:
+                with open(path, 'rb') as f:
+                    stat = os.fstat(f.fileno())
+                    signature = (stat.st_mtime_ns, stat.st_size)
+                    data = f.read()
+                metadata = parse_note(data.decode('utf-8'))
+                metadata.chunks = split_chunks(data)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cannot parse metadata of {relative_path}: {e}")
+            self.remove(relative_path)
+            return False
+
+        with self._lock:
+            self.remove(relative_path)
+            note_id = self._free.pop() if self._free else len(self._paths)
+            if note_id == len(self._paths):
+                self._paths.append(None)
+                self._signatures.append(None)
+                self._metadata.append(None)
+            self._ids[relative_path] = note_id
+            self._paths[note_id] = relative_path
+            self._signatures[note_id] = signature
+            self._metadata[note_id] = metadata
+
+            for tag in self._expanded_tags(metadata):
+                self._tags.setdefault(tag, set()).add(note_id)
+            for key, values in metadata.properties.items():
+                by_value = self._properties.setdefault(sys.intern(key), {})
+                for value in values or [""]:
+                    by_value.setdefault(sys.intern(value.lower()), set()).add(note_id)
+            for target in metadata.links:
+                self._linked_from.setdefault(target, set()).add(note_id)
+        return True
+
+    def remove(self, relative_path: str) -> bool:
+        """
+        Forget a note.
+
+        Returns:
+            bool: True if the note was indexed.
+        """
+        with self._lock:
+            note_id = self._ids.pop(relative_path, None)
+            if note_id is None:
+                return False
+            metadata = self._metadata[note_id]
+
+            for tag in self._expanded_tags(metadata):
+                self._discard(self._tags, tag, note_id)
+            for key, values in metadata.properties.items():
+                by_value = self._properties[key]
+                for value in values or [""]:
+                    self._discard(by_value, value.lower(), note_id)
+                if not by_value:
+                    del self._properties[key]
+            for target in metadata.links:
+                self._discard(self._linked_from, target, note_id)
+
+            self._paths[note_id] = None
+            self._signatures[note_id] = None
+            self._metadata[note_id] = None
+            self._free.append(note_id)
+        return True
+
+    @staticmethod
+    def _expanded_tags(metadata: NoteMetadata) -> Set[str]:
+        return {sys.intern(part) for tag in metadata.tags for part in expand_tag(tag)}
+
+    @staticmethod
+    def _discard(table: Dict[str, Set[int]], key: str, note_id: int):
+        ids = table.get(key)
+        if ids is not None:
+            ids.discard(note_id)
+            if not ids:
+                del table[key]
+
+    def metadata(self, relative_path: str) -> Optional[NoteMetadata]:
+        """Get the parsed metadata of a note, or None if it isn't indexed"""
+        with self._lock:
+            note_id = self._ids.get(relative_path)
+            return self._metadata[note_id] if note_id is not None else None
+
+    def chunks(self, relative_path: str) -> Optional[List[Chunk]]:
+        """Get the heading chunks of a note, or None if it isn't indexed"""
+        metadata = self.metadata(relative_path)
+        return metadata.chunks if metadata is not None else None
+
+    def tags(self) -> Dict[str, int]:
+        """Get every tag with the number of notes carrying it"""
+        with self._lock:
+            return {tag: len(ids) for tag, ids in sorted(self._tags.items())}
+
+    def linked_from(self, relative_path: str) -> List[str]:
+        """Get the notes with a [[wikilink]] to a note, by full path or by name"""
+        target = normalize_link(relative_path)
+        with self._lock:
+            ids = self._linked_from.get(target, set()) | \
+                self._linked_from.get(target.rsplit("/", 1)[-1], set())
+            return sorted(self._paths[note_id] for note_id in ids)
+
+    def _property_ids(self, condition: str) -> Set[int]:
+        """Ids matching `key`, `key=value` or `key=prefix*`"""
+        key, _, value = condition.partition("=")
+        by_value = self._properties.get(key.strip().lower(), {})
+        value = value.strip().lower()
+        if not value:
+            return set().union(*by_value.values())
+        if value.endswith("*"):
+            prefix = value[:-1]
+            return set().union(*(ids for v, ids in by_value.items() if v.startswith(prefix)))
+        return set(by_value.get(value, ()))
+
+    def filter(self, tags: Iterable[str] = (), properties: Iterable[str] = ()) -> Set[str]:
+        """
+        Find the notes matching every given tag and property condition.
+
+        Args:
+            tags (Iterable[str]): Tags the notes must carry, with or without '#'.
+                A parent tag also matches its nested tags.
+            properties (Iterable[str]): Conditions of the form `key` (property is
+                set), `key=value` (one of its values equals value, ignoring case)
+                or `key=prefix*` (one of its values starts with prefix).
+
+        Returns:
+            Set[str]: Vault-relative paths of the matching notes.
+        """
+        with self._lock:
+            id_sets = [self._tags.get(normalize_tag(tag), set())
+                       for tag in tags if normalize_tag(tag)]
+            id_sets += [self._property_ids(condition)
+                        for condition in properties if condition.strip()]
+            if not id_sets:
+                return {path for path in self._paths if path is not None}
+
+            # Intersect starting from the smallest set
+            id_sets.sort(key=len)
+            ids = set(id_sets[0])
+            for other in id_sets[1:]:
+                ids &= other
+                if not ids:
+                    break
+            return {self._paths[note_id] for note_id in ids}
+
+
+def parse_filter_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated tool argument into its non-empty parts"""
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
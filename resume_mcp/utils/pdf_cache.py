@@ -0,0 +1,224 @@
+"""
+Content-addressed cache of compiled PDFs on disk
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Union
+
+from resume_mcp.utils.vault_writer import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(content: str, settings: Optional[Mapping[str, str]] = None) -> str:
+    """
+    Hash LaTeX source and the settings it is compiled with.
+
+    Args:
+        content (str): The LaTeX source.
+        settings (Mapping[str, str], optional): Anything else that changes the
+            PDF, e.g. the server it is compiled on.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(dict(settings or {}), sort_keys=True).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(content.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class PdfCache:
+    """
+    Size-bounded LRU directory of compiled PDFs, keyed by cache_key().
+
+    Compiling the same source again (a retry, saving it to another folder,
+    regenerating with the same LLM output) copies the cached PDF to its
+    destination instead of running pdflatex. Entries are stored as
+    <directory>/<key[:2]>/<key>.pdf and survive restarts; on start-up they
+    are ordered by modification time, which is bumped on every hit, and the
+    least recently used ones are deleted once the total exceeds max_bytes.
+    Destinations are copies, never hard links, so editing a PDF in the vault
+    can't change the cached one.
+
+    Args:
+        directory (str | PathLike): Where the PDFs are kept. Created if missing.
+        max_bytes (int, optional): Total size of the cached PDFs. Defaults to 256 MiB.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], max_bytes: int = 256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+        self._load()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def _load(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        found = []
+        for path in self.directory.glob("??/*.pdf"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime_ns, path.stem, stat.st_size))
+        with self._lock:
+            for _, key, size in sorted(found):
+                self._entries[key] = size
+                self._bytes += size
+            self._evict()
+        logger.info(f"PDF cache: {len(self._entries)} PDFs ({self._bytes} bytes) in {self.directory}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str, dest: Union[str, os.PathLike]) -> bool:
+        """
+        Put the cached PDF for a key at dest, if there is one.
+
+        The PDF is copied to dest, which is replaced atomically. If the
+        cached PDF can't be copied (say another compile just evicted it),
+        that is a miss.
+
+        Args:
+            key (str): The cache key of the source.
+            dest (str | PathLike): Where the PDF should end up.
+
+        Returns:
+            bool: True on a hit, False if the PDF has to be compiled.
+        """
+        path = self._path(key)
+        with self._lock:
+            size = self._entries.get(key)
+            if size is None:
+                self.misses += 1
+                return False
+            self._entries.move_to_end(key)
+
+        try:
+            if path.stat().st_size == size:
+                _materialize(path, dest)
+                os.utime(path)
+                with self._lock:
+                    self.hits += 1
+                    self.bytes_saved += size
+                return True
+            # Changed behind the cache's back
+            self._drop(key)
+        except OSError as e:
+            logger.debug(f"Cannot serve cached PDF {key} to {dest}: {e}")
+        with self._lock:
+            self.misses += 1
+        return False
+
+    def put(self, key: str, data: bytes):
+        """
+        Store a compiled PDF, evicting the least recently used ones beyond max_bytes.
+
+        Args:
+            key (str): The cache key of the source.
+            data (bytes): The PDF.
+        """
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        # Losing the cache in a crash costs a recompile, not worth an fsync
+        atomic_write(path, data, fsync=False)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old
+            self._entries[key] = len(data)
+            self._bytes += len(data)
+            self.stores += 1
+            self._evict()
+
+    def _drop(self, key: str):
+        with self._lock:
+            size = self._entries.pop(key, None)
+            if size is None:
+                return
+            self._bytes -= size
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            try:
+                os.unlink(self._path(key))
+            except OSError as e:
+                logger.debug(f"Cannot delete cached PDF {key}: {e}")
+
+    def clear(self):
+        """Delete every cached PDF"""
+        with self._lock:
+            for key in self._entries:
+                try:
+                    os.unlink(self._path(key))
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, float]: "hits", "misses", "stores", "evictions", "bytes_saved",
+                "entries", "bytes", "max_bytes" and "hit_ratio".
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "bytes_saved": self.bytes_saved,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+
+
+def _materialize(source: Path, dest: Union[str, os.PathLike]):
+    """Copy a file to dest, replacing dest atomically"""
+    dest = os.fspath(dest)
+    directory, name = os.path.split(dest)
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,163 @@
+"""
+Memoized fuzzy filename searches, keyed on the vault index generation
+"""
+import bisect
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+from resume_mcp.utils.vault_index import VaultIndex, normalize_subdir
+
+# (normalized term, normalized subdir, index generation)
+QueryKey = Tuple[str, str, int]
+
+
+def normalize_term(search_term: str) -> str:
+    """Lowercase a search term and collapse its whitespace"""
+    return " ".join(search_term.lower().split())
+
+
+class QueryCache:
+    """
+    TTL and LRU bounded cache of fuzzy filename search results.
+
+    Each entry holds the best matches of a search scoring above the min_score
+    it was run with, as compact arrays of index slots and scores, up to a
+    window of at least `window` matches. Later searches for the same term and
+    subdir with the same or a stricter min_score are answered by slicing the
+    window, as long as it holds enough matches; a deeper page runs the search
+    again with a wider window. Only the slots are kept, the matches are
+    rebuilt from the index on every hit. Because the key includes the index generation,
+    any change to the vault makes older entries unreachable, and they age out
+    through the TTL and LRU.
+
+    Args:
+        ttl (float): Seconds an entry stays valid.
+        max_entries (int): Maximum number of searches to keep.
+        window (int): Minimum number of matches kept per search.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 256, window: int = 50):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.window = window
+        self._lock = threading.Lock()
+        # Key -> (created, min_score floor, holds every match, slots,
+        # scores negated for bisect)
+        self._entries: "OrderedDict[QueryKey, Tuple[float, int, bool, array, array]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def search(
+            self,
+            index: VaultIndex,
+            search_term: str,
+            min_score: int = 60,
+            subdir: Optional[str] = None,
+            limit: int = 10,
+            only: Optional[Set[str]] = None) -> List[Dict]:
+        """
+        Fuzzy search a vault index, reusing an earlier search when possible.
+
+        A restriction to certain notes is applied to the cached, unrestricted
+        matches, so it doesn't need an entry of its own. If the window runs
+        out before enough of them pass, the restricted search is run directly.
+
+        Args:
+            index (VaultIndex): The vault index to search.
+            search_term (str): The term to search for
+            min_score (int, optional): Minimum fuzzy match score (0-100). Defaults to 60.
+            subdir (str, optional): Only search below this vault subdirectory.
+            limit (int, optional): Maximum number of results to return. Defaults to 10.
+            only (Set[str], optional): Vault-relative paths of the only notes
+                that may match.
+
+        Returns:
+            List[Dict]: The same matches VaultIndex.search would return.
+        """
+        limit = max(limit, 0)
+        term = normalize_term(search_term)
+        subdir_key = normalize_subdir(subdir)
+        key = (term, subdir_key, index.generation)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            results = None
+            if entry is not None and min_score >= entry[1]:
+                results = self._slice(index, key[2], entry, min_score, limit, subdir, only)
+            if results is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return results
+            self.misses += 1
+
+        window = max(limit, self.window)
+        generation, ranked = index.rank(term, min_score=min_score, subdir=subdir, limit=window)
+        entry = (now, min_score, len(ranked) < window,
+                 array("l", (slot for slot, _ in ranked)),
+                 array("b", (-score for _, score in ranked)))
+
+        with self._lock:
+            key = (term, subdir_key, generation)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        results = self._slice(index, generation, entry, min_score, limit, subdir, only)
+        if results is None:
+            # The vault changed in the meantime, or too few matches in the
+            # window pass the restriction
+            return index.search(term, min_score=min_score, subdir=subdir, limit=limit, only=only)
+        return results
+
+    @staticmethod
+    def _slice(index: VaultIndex, generation: int, entry: Tuple[float, int, bool, array, array],
+               min_score: int, limit: int, subdir: Optional[str],
+               only: Optional[Set[str]]) -> Optional[List[Dict]]:
+        _, _, complete, slots, neg_scores = entry
+        # Matches are sorted by descending score, so those above min_score
+        # are a prefix of the window
+        end = bisect.bisect_left(neg_scores, -min_score)
+        ranked = zip(slots[:end], (-score for score in neg_scores[:end]))
+        results = index.resolve(generation, ranked, subdir=subdir, limit=limit, only=only)
+        if results is None:
+            return None
+        if len(results) < limit and not complete and end == len(slots):
+            # There may be more matches past the window
+            return None
+        return results
+
+    def clear(self):
+        """Drop every cached search"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, float]: "hits", "misses", "evictions", "expirations",
+                "entries", and "hit_ratio".
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,122 @@
+"""
+Short-lived cache of search result sets for cursor-based pagination
+"""
+import base64
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class ResultSet:
+    """The resolved matches of one search, kept for paging through them"""
+    query: str
+    matches: List[Dict]
+    created: float
+
+
+def encode_cursor(set_id: str, offset: int) -> str:
+    """
+    Turn a result set id and offset into an opaque cursor.
+
+    Args:
+        set_id (str): Id of the cached result set.
+        offset (int): Position of the first match on the page.
+
+    Returns:
+        str: A URL-safe cursor string.
+    """
+    return base64.urlsafe_b64encode(f"{set_id}:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[str, int]]:
+    """
+    Parse a cursor made by encode_cursor.
+
+    Args:
+        cursor (str): The cursor string.
+
+    Returns:
+        Optional[Tuple[str, int]]: The result set id and offset, or None if the
+            cursor is malformed.
+    """
+    try:
+        padded = cursor.strip() + "=" * (-len(cursor.strip()) % 4)
+        set_id, offset = base64.urlsafe_b64decode(padded).decode().split(":")
+        offset = int(offset)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not set_id or offset < 0:
+        return None
+    return set_id, offset
+
+
+class ResultSetCache:
+    """
+    Holds recent search results so later pages don't re-run the search.
+
+    Only the match metadata is stored, never note contents, so a result set
+    is small no matter how large the matched notes are. Sets expire after
+    ttl seconds, and the least recently used ones are dropped beyond
+    max_entries.
+
+    Args:
+        ttl (float): Seconds a result set stays available.
+        max_entries (int): Maximum number of result sets to keep.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 64):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._sets: "OrderedDict[str, ResultSet]" = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self._sets)
+
+    def put(self, query: str, matches: List[Dict]) -> str:
+        """
+        Store the matches of a search.
+
+        Args:
+            query (str): The search that produced the matches.
+            matches (List[Dict]): The matches, best first.
+
+        Returns:
+            str: Id of the stored result set.
+        """
+        set_id = secrets.token_hex(8)
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            self._sets[set_id] = ResultSet(query, list(matches), now)
+            while len(self._sets) > self.max_entries:
+                self._sets.popitem(last=False)
+        return set_id
+
+    def get(self, set_id: str) -> Optional[ResultSet]:
+        """
+        Look up a stored result set.
+
+        Args:
+            set_id (str): Id returned by put.
+
+        Returns:
+            Optional[ResultSet]: The result set, or None if it expired or never existed.
+        """
+        with self._lock:
+            self._expire(time.monotonic())
+            result_set = self._sets.get(set_id)
+            if result_set is not None:
+                self._sets.move_to_end(set_id)
+            return result_set
+
+    def _expire(self, now: float):
+        for set_id in [set_id for set_id, result_set in self._sets.items()
+                       if now - result_set.created > self.ttl]:
+            del self._sets[set_id]
@@ -0,0 +1,402 @@
+"""
+Offline semantic search over heading-level chunks of the vault's notes
+"""
+import json
+import logging
+import math
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from resume_mcp.utils.chunks import Chunk, read_chunk, split_chunks
+from resume_mcp.utils.content_index import tokenize
+from resume_mcp.utils.fuzzy import top_k
+from resume_mcp.utils.vault_index import REMOVE, RESET, UPSERT, VaultIndex
+
+logger = logging.getLogger(__name__)
+
+# Rows scored per block, so a query never materializes the whole matrix
+QUERY_BLOCK_ROWS = 8192
+INITIAL_CAPACITY = 256
+META_VERSION = 2
+# Seconds after the last change before the metadata is saved, so a burst of
+# watcher events is written out once
+SAVE_DELAY = 2.0
+
+
+def embed(text: str, dim: int) -> Tuple[np.ndarray, int]:
+    """
+    Embed text as a hashed, sublinear term-frequency vector.
+
+    Words and word pairs are hashed into dim buckets with a stable hash and a
+    random-looking sign, so collisions tend to cancel rather than pile up.
+
+    Args:
+        text (str): The text to embed.
+        dim (int): Number of hash buckets.
+
+    Returns:
+        Tuple[np.ndarray, int]: The L2-normalized float32 vector (all zeros for
+            text without words), and the number of tokens.
+    """
+    tokens = tokenize(text)
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    counts: Dict[int, int] = {}
+    for feature in features:
+        h = zlib.crc32(feature.encode("utf-8"))
+        bucket = (h >> 1) % dim
+        counts[bucket] = counts.get(bucket, 0) + (1 if h & 1 else -1)
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for bucket, count in counts.items():
+        if count:
+            vector[bucket] = math.copysign(1 + math.log(abs(count)), count)
+
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector /= norm
+    return vector, len(tokens)
+
+
+class SemanticIndex:
+    """
+    Hashing TF-IDF vectors of every heading-level chunk in the vault.
+
+    The vectors live in a float32 matrix memory-mapped from disk, next to a
+    JSON file mapping rows to chunks and recording each file's mtime and
+    size. On startup only files that changed since the last run are
+    re-embedded, and afterwards the index follows the vault index's events.
+    Queries are weighted by inverse document frequency and scored with
+    blocked matrix-vector products.
+
+    Changes are saved save_delay seconds after the last one. Rows freed
+    since the last save aren't reused before the next, so the saved rows
+    never hold another note's vector, and a run that stops without saving
+    leaves a marker file; the next load then recounts the document
+    frequencies from the live rows instead of trusting the saved ones.
+
+    Args:
+        index_dir (str): Directory holding the matrix and its metadata.
+        vault_path (str): Root of the vault the relative paths point into.
+        dim (int): Number of hash buckets per vector.
+        save_delay (float, optional): Seconds to wait for further changes
+            before saving. Defaults to SAVE_DELAY.
+    """
+
+    def __init__(self, index_dir: str, vault_path: str, dim: int = 2048,
+                 save_delay: float = SAVE_DELAY):
+        self.index_dir = Path(index_dir)
+        self.vault_path = Path(vault_path)
+        self.dim = dim
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = self.index_dir / "vectors.f32"
+        self._meta_path = self.index_dir / "meta.json"
+        self._df_path = self.index_dir / "df.npy"
+        # Exists while there are changes that haven't been saved
+        self._unsaved_path = self.index_dir / "unsaved"
+        self.save_delay = save_delay
+        self._save_timer: Optional[threading.Timer] = None
+
+        self._lock = threading.RLock()
+        # Row -> (relative path, heading, start byte, end byte), None for free rows
+        self._chunks: List[Optional[Tuple[str, str, int, int]]] = []
+        self._free: List[int] = []
+        # Rows freed since the last save, reusable once it is saved
+        self._freed: List[int] = []
+        # Relative path -> (mtime_ns, size, rows)
+        self._files: Dict[str, Tuple[int, int, List[int]]] = {}
+        # Number of live chunks each bucket is set in
+        self._df = np.zeros(dim, dtype=np.int64)
+        self._dirty = False
+
+        if not self._load():
+            self._vectors = self._open_vectors(INITIAL_CAPACITY, fresh=True)
+
+    def __len__(self) -> int:
+        return len(self._chunks) - len(self._free) - len(self._freed)
+
+    def _open_vectors(self, capacity: int, fresh: bool = False) -> np.memmap:
+        mode = "wb" if fresh else "r+b"
+        with open(self._vectors_path, mode) as f:
+            f.truncate(capacity * self.dim * 4)
+        return np.memmap(self._vectors_path, dtype=np.float32, mode="r+",
+                         shape=(capacity, self.dim))
+
+    def _load(self) -> bool:
+        """Reopen a previously saved index; False if there is none to reuse"""
+        try:
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("version") != META_VERSION or meta.get("dim") != self.dim:
+                return False
+            chunks = [tuple(chunk) if chunk is not None else None
+                      for chunk in meta["chunks"]]
+            df = np.load(self._df_path)
+            capacity = os.path.getsize(self._vectors_path) // (self.dim * 4)
+            if capacity < len(chunks) or df.shape != (self.dim,):
+                return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.info(f"Starting a new semantic index in {self.index_dir}: {e}")
+            return False
+
+        self._chunks = chunks
+        self._free = [row for row, chunk in enumerate(chunks) if chunk is None]
+        rows: Dict[str, List[int]] = {}
+        for row, chunk in enumerate(chunks):
+            if chunk is not None:
+                rows.setdefault(chunk[0], []).append(row)
+        self._files = {path: (mtime_ns, size, rows.get(path, []))
+                       for path, (mtime_ns, size) in meta["files"].items()}
+        self._df = df.astype(np.int64)
+        self._vectors = self._open_vectors(max(capacity, INITIAL_CAPACITY))
+        if self._unsaved_path.exists():
+            logger.info("Semantic index wasn't saved on exit, recounting document frequencies")
+            self._df = self._count_df()
+            self._dirty = True
+        return True
+
+    def _count_df(self) -> np.ndarray:
+        """Count the live chunks each bucket is set in, from the vectors themselves"""
+        df = np.zeros(self.dim, dtype=np.int64)
+        live = np.array([chunk is not None for chunk in self._chunks], dtype=bool)
+        for start in range(0, len(self._chunks), QUERY_BLOCK_ROWS):
+            end = min(start + QUERY_BLOCK_ROWS, len(self._chunks))
+            df += (self._vectors[start:end][live[start:end]] != 0).sum(axis=0)
+        return df
+
+    def _changed(self):
+        """Note an unsaved change, and save once changes stop coming"""
+        if not self._dirty:
+            self._dirty = True
+            self._unsaved_path.touch()
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_delay, self._save_later)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save_later(self):
+        with self._lock:
+            self._save_timer = None
+        try:
+            self.save()
+        except Exception as e:
+            logger.error(f"Cannot save semantic index: {e}")
+
+    def save(self):
+        """Flush the vectors and write the metadata if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._vectors.flush()
+            np.save(self._df_path, self._df)
+            meta = {
+                "version": META_VERSION,
+                "dim": self.dim,
+                "chunks": self._chunks,
+                "files": {path: [mtime_ns, size]
+                          for path, (mtime_ns, size, _) in self._files.items()}
+            }
+            tmp_path = self._meta_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, self._meta_path)
+            self._unsaved_path.unlink(missing_ok=True)
+            self._free.extend(self._freed)
+            self._freed.clear()
+            self._dirty = False
+
+    def close(self):
+        """Save the index and release the memory map"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self.save()
+            del self._vectors
+
+    def build(self, vault_index: VaultIndex) -> "SemanticIndex":
+        """
+        Bring the index in line with a vault index and follow its changes.
+
+        Args:
+            vault_index (VaultIndex): The filename index of the vault.
+
+        Returns:
+            SemanticIndex: The index itself, for chaining.
+        """
+        self.sync(vault_index.relative_paths())
+        vault_index.subscribe(
+            lambda event, relative_path: self.on_vault_event(vault_index, event, relative_path))
+        return self
+
+    def on_vault_event(self, vault_index: VaultIndex, event: str, relative_path: Optional[str]):
+        """Apply a change reported by the vault index"""
+        if event == UPSERT:
+            self.update(relative_path)
+        elif event == REMOVE:
+            self.remove(relative_path)
+        elif event == RESET:
+            self.sync(vault_index.relative_paths())
+
+    def sync(self, relative_paths: List[str]) -> Dict[str, int]:
+        """
+        Re-embed the notes that changed since they were last indexed.
+
+        Args:
+            relative_paths (List[str]): Every note currently in the vault.
+
+        Returns:
+            Dict[str, int]: Counts of "unchanged", "updated" and "removed" notes.
+        """
+        stats = {"unchanged": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            stale = set(self._files)
+            for relative_path in relative_paths:
+                stale.discard(relative_path)
+                try:
+                    stat = os.stat(self.vault_path / relative_path)
+                except OSError:
+                    continue
+                known = self._files.get(relative_path)
+                if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                    stats["unchanged"] += 1
+                elif self.update(relative_path):
+                    stats["updated"] += 1
+
+            for relative_path in stale:
+                self.remove(relative_path)
+                stats["removed"] += 1
+            self.save()
+
+        logger.info(
+            f"Semantic index synced: {stats['updated']} updated, "
+            f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+        return stats
+
+    def update(self, relative_path: str) -> bool:
+        """
+        (Re)embed the chunks of a note from disk.
+
+        Returns:
+            bool: True if the note was indexed.
+        """
+        try:
+            with open(self.vault_path / relative_path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                data = f.read()
+            data.decode("utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Cannot embed contents of {relative_path}: {e}")
+            self.remove(relative_path)
+            return False
+
+        embedded = []
+        for chunk in split_chunks(data):
+            vector, n_tokens = embed(data[chunk.start:chunk.end].decode("utf-8"), self.dim)
+            if n_tokens:
+                embedded.append(((relative_path, chunk.heading, chunk.start, chunk.end), vector))
+
+        with self._lock:
+            self.remove(relative_path)
+            rows = []
+            for chunk, vector in embedded:
+                row = self._allocate()
+                self._vectors[row] = vector
+                self._chunks[row] = chunk
+                self._df += vector != 0
+                rows.append(row)
+            self._files[relative_path] = (stat.st_mtime_ns, stat.st_size, rows)
+            self._changed()
+        return True
+
+    def remove(self, relative_path: str) -> bool:
+        """
+        Drop a note's chunks from the index.
+
+        Returns:
+            bool: True if the note was indexed.
+        """
+        with self._lock:
+            entry = self._files.pop(relative_path, None)
+            if entry is None:
+                return False
+            for row in entry[2]:
+                self._df -= self._vectors[row] != 0
+                self._vectors[row] = 0
+                self._chunks[row] = None
+                self._freed.append(row)
+            # Never below zero, which would turn the idf into nan
+            np.maximum(self._df, 0, out=self._df)
+            self._changed()
+        return True
+
+    def _allocate(self) -> int:
+        """Get a free row, growing the memory-mapped matrix if needed"""
+        if self._free:
+            return self._free.pop()
+        row = len(self._chunks)
+        if row >= self._vectors.shape[0]:
+            self._vectors.flush()
+            capacity = self._vectors.shape[0] * 2
+            del self._vectors
+            self._vectors = self._open_vectors(capacity)
+        self._chunks.append(None)
+        return row
+
+    def search(self, query: str, limit: int = 5) -> List[Dict]:
+        """
+        Find the chunks most similar to a piece of text.
+
+        Args:
+            query (str): Free text, e.g. a pasted job description.
+            limit (int, optional): Maximum number of chunks to return. Defaults to 5.
+
+        Returns:
+            List[Dict]: Hits with "score", "path", "filename", "relative_path",
+                "heading" and "text", best first.
+        """
+        vector, n_tokens = embed(query, self.dim)
+        if not n_tokens or limit <= 0:
+            return []
+
+        with self._lock:
+            n_rows = len(self._chunks)
+            n_live = len(self)
+            if n_live == 0:
+                return []
+
+            # Rare buckets say more about a chunk than common ones
+            idf = np.log((1 + n_live) / (1 + self._df)).astype(np.float32) + 1
+            weighted = vector * idf
+
+            scores = np.empty(n_rows, dtype=np.float32)
+            for start in range(0, n_rows, QUERY_BLOCK_ROWS):
+                end = min(start + QUERY_BLOCK_ROWS, n_rows)
+                scores[start:end] = self._vectors[start:end] @ weighted
+
+            best = [int(row) for row in top_k(scores, limit)
+                    if scores[row] > 0 and self._chunks[row] is not None]
+            hits = [(float(scores[row]), self._chunks[row]) for row in best]
+
+        results = []
+        for score, (relative_path, heading, start, end) in hits:
+            try:
+                text = read_chunk(self.vault_path / relative_path,
+                                  Chunk(heading, 0, start, end)).strip()
+            except OSError as e:
+                logger.warning(f"Cannot read chunk of {relative_path}: {e}")
+                continue
+            results.append({
+                "score": round(score, 3),
+                "path": str(self.vault_path / relative_path),
+                "filename": Path(relative_path).stem,
+                "relative_path": relative_path,
+                "heading": heading,
+                "text": text
+            })
+        return results
@@ -1,40 +1,71 @@
+import asyncio
+import glob
+import itertools
 import logging
 import os
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
-from fuzzywuzzy import fuzz
-import numpy as np
-from resume_mcp.config import OBSIDIAN_VAULT
+from typing import Optional, List, Dict, Set, Tuple
+from resume_mcp.config import OBSIDIAN_VAULT, VAULT_IGNORE
+from resume_mcp.utils.file_cache import ContentCache, read_preview
+from resume_mcp.utils.fuzzy import rank_filenames
+from resume_mcp.utils.io_pool import run_blocking
+from resume_mcp.utils.query_cache import QueryCache
+from resume_mcp.utils.vault_index import VaultIndex
+from resume_mcp.utils.vault_walk import VaultWalker, compile_glob
+from resume_mcp.utils.vault_writer import VaultWriter, atomic_write
 
 logger = logging.getLogger(__name__)
 
 
-def save_file_to_vault(content: str, rel_dest: str) -> Optional[str]:
+def save_file_to_vault(
+        content: str,
+        rel_dest: str,
+        index: Optional[VaultIndex] = None,
+        writer: Optional[VaultWriter] = None) -> Optional[str]:
     """
     Save content to a file within the Obsidian vault, or to a folder in the file system specified by the user through the OBSIDIAN_VAULT environment variable.
 
+    The file is replaced atomically, so a crash never leaves it half written.
+
     Args:
         content (str): The content to write to the file.
         rel_dest (str): The name of the destination file to create or overwrite, relative to the OBSIDIAN_VAULT path.
+        index (VaultIndex, optional): Vault index to add the saved file to, so it is searchable right away.
+            Only used without a writer; the server's writer indexes what it writes itself.
+        writer (VaultWriter, optional): Background writer to queue the file on instead of writing it now.
 
     Returns:
-        Optional[str]: The full path to the created file if successful, None otherwise.
+        Optional[str]: The full path to the created (or queued) file if successful, None otherwise.
 
     Raises:
         No exceptions are raised directly; exceptions during file writing are caught
         and result in a None return value.
     """
     full_path = os.path.join(OBSIDIAN_VAULT, rel_dest)
+    if writer is not None:
+        try:
+            writer.write(full_path, content)
+        except RuntimeError:
+            return None
+        return full_path
+
     try:
-        with open(full_path, mode="w", encoding='utf-8') as f:
-            f.write(content)
+        atomic_write(full_path, content.encode("utf-8"))
     except:
         return None
 
+    if index is not None:
+        index.add_file(full_path)
+
     return full_path
 
 
-def read_vault_file(filename: str, min_score=70) -> str:
+def read_vault_file(
+        filename: str,
+        min_score=70,
+        index: Optional[VaultIndex] = None,
+        cache: Optional[ContentCache] = None) -> str:
     """
     Reads the contents of a file in the vault based on fuzzy matching of the filename.
 
@@ -43,6 +74,8 @@ def read_vault_file(filename: str, min_score=70) -> str:
 
     Args:
         filename (str): The name of the file to search for in the vault.
+        index (VaultIndex, optional): Vault index to search instead of walking the vault.
+        cache (ContentCache, optional): Cache to read the matched file through.
 
     Returns:
         str: The contents of the matched file.
@@ -55,13 +88,17 @@ def read_vault_file(filename: str, min_score=70) -> str:
     """
 
     root, _ = os.path.splitext(filename)
-    match = fuzzy_search_vault_files(filename, min_score=min_score, limit=1)
+    match = fuzzy_search_vault_files(
+        filename, min_score=min_score, limit=1, index=index)
 
     if not match:
         raise Exception(f"No files matched '{root}' in Obsidian vault")
 
     match = match[0]["path"]
 
+    if cache is not None:
+        return cache.read(match)
+
     with open(match, mode='r', encoding='utf-8') as f:
         content = f.read()
 
@@ -72,7 +109,11 @@ def fuzzy_search_vault_files(
         search_term: str,
         min_score: int = 60,
         subdir: Optional[str] = None,
-        limit: int = 10) -> List[Dict[str, str]]:
+        limit: int = 10,
+        index: Optional[VaultIndex] = None,
+        cache: Optional[QueryCache] = None,
+        only: Optional[Set[str]] = None,
+        walker: Optional[VaultWalker] = None) -> List[Dict[str, str]]:
     """
     Search for files in the Obsidian vault using fuzzy string matching on filenames.
 
@@ -80,41 +121,219 @@ def fuzzy_search_vault_files(
         search_term (str): The term to search for
         min_score (int, optional): Minimum fuzzy match score (0-100). Defaults to 60.
         limit (int, optional): Maximum number of results to return. Defaults to 10.
+        index (VaultIndex, optional): Prebuilt vault index to query. When omitted
+            the vault is walked and every filename is scored.
+        cache (QueryCache, optional): Cache of earlier searches of the index to
+            answer from. Only used together with index.
+        only (Set[str], optional): Vault-relative paths of the only files that
+            may match, e.g. the notes passing a tag or property filter.
+        walker (VaultWalker, optional): Walker to list the vault with when there
+            is no index. Defaults to walking it serially in this thread.
 
     Returns:
         List[Dict[str, str]]: List of matching files with score and path
     """
+    if index is not None:
+        if cache is not None:
+            matches = cache.search(
+                index, search_term, min_score=min_score, subdir=subdir, limit=limit, only=only)
+        else:
+            matches = index.search(
+                search_term, min_score=min_score, subdir=subdir, limit=limit, only=only)
+        logger.info(
+            f"Found {len(matches)} matching files for search term '{search_term}'")
+        return matches
+
     path = Path(OBSIDIAN_VAULT)
 
     if subdir:
         path /= subdir
 
-    # Get all markdown files in the vault
-    all_md_files = list(path.rglob("*.md"))
+    # Get all markdown files in the vault, skipping ignored directories. A
+    # one-worker walker scans in this thread, so no pool is set up per call
+    if walker is None:
+        walker = VaultWalker(OBSIDIAN_VAULT, VAULT_IGNORE, workers=1)
+    relative_paths = walker.walk(subdir)
+    if only is not None:
+        relative_paths = [p for p in relative_paths if p in only]
+    all_md_files = [Path(OBSIDIAN_VAULT) / p for p in relative_paths]
 
     logger.info(f"Found {len(all_md_files)} markdown files")
 
-    # Calculate fuzzy match scores
-    scores = np.array([
-        max(
-            fuzz.ratio(search_term.lower(), str(filename.stem).lower()),
-            fuzz.partial_ratio(search_term.lower(), str(filename.stem).lower())
-        )
-        for filename in all_md_files
-    ])
-
-    matched_files = zip(all_md_files, scores)
+    # Score all filenames in one batch and keep the best matches
+    ranked = rank_filenames(
+        search_term.lower(),
+        [str(filename.stem).lower() for filename in all_md_files],
+        min_score=min_score,
+        limit=limit)
 
     matches = [{
         "score": score,
-        "path": str(match),
-        "filename": match.stem,
-        "relative_path": str(match.relative_to(path))
-    } for match, score in matched_files if score > min_score]
+        "path": str(all_md_files[i]),
+        "filename": all_md_files[i].stem,
+        "relative_path": str(all_md_files[i].relative_to(path))
+    } for i, score in ranked]
     logger.info(
         f"Found {len(matches)} matching files for search term '{search_term}'")
-    # Sort by score descending
-    matches.sort(key=lambda x: x["score"], reverse=True)
 
-    # Return limited number of results
-    return matches[:limit]
+    return matches
+
+
+def resolve_vault_paths(
+        patterns: List[str],
+        vault_path: str = OBSIDIAN_VAULT,
+        max_files: int = 50,
+        index: Optional[VaultIndex] = None) -> List[Dict]:
+    """
+    Turn vault-relative paths and glob patterns into a list of files to read.
+
+    Plain paths get a .md extension if they have none, like read_vault_file.
+    Glob patterns ("Experience/*.md", "**/Acme*") expand to the matching files
+    in sorted order. They are matched against the vault index's notes (or a
+    walk of the vault), so ignored directories like .obsidian never match.
+    Paths that resolve outside the vault, symlinks included, are rejected,
+    and duplicates are dropped.
+
+    Args:
+        patterns (List[str]): Paths or glob patterns relative to the vault.
+        vault_path (str, optional): The vault root. Defaults to OBSIDIAN_VAULT.
+        max_files (int, optional): Maximum number of files to return. Defaults to 50.
+        index (VaultIndex, optional): Index of the vault to expand globs from.
+            Defaults to walking the vault, honouring VAULT_IGNORE.
+
+    Returns:
+        List[Dict]: Entries with "relative_path", "path" and "error" (None when
+            the file can be read), in request order.
+    """
+    root = os.path.abspath(vault_path)
+    real_root = os.path.realpath(root)
+    entries: List[Dict] = []
+    seen: Set[str] = set()
+    walker = None
+
+    def inside(path: str) -> bool:
+        return os.path.realpath(path).startswith(real_root + os.sep)
+
+    def expand(pattern: str) -> List[str]:
+        nonlocal walker
+        # Only list the files below the pattern's literal leading directories
+        parts = pattern.split("/")
+        prefix = "/".join(itertools.takewhile(lambda part: not glob.has_magic(part), parts[:-1]))
+        if index is not None:
+            candidates = index.relative_paths(prefix)
+        else:
+            walker = walker or VaultWalker(root, VAULT_IGNORE, workers=1)
+            candidates = walker.walk(prefix, suffix="")
+        regex = compile_glob(pattern)
+        return [p for p in candidates if regex.match(p)]
+
+    def add(relative_path: str, error: Optional[str] = None):
+        if relative_path in seen or len(entries) >= max_files:
+            return
+        seen.add(relative_path)
+        entries.append({
+            "relative_path": relative_path,
+            "path": os.path.join(root, relative_path),
+            "error": error
+        })
+
+    for pattern in patterns:
+        pattern = pattern.strip().lstrip("/")
+        if not pattern:
+            continue
+        if glob.has_magic(pattern):
+            files = [m for m in expand(pattern) if inside(os.path.join(root, m))]
+            if not files:
+                add(pattern, "No files match this pattern")
+            for match in files:
+                add(match)
+            continue
+
+        if not os.path.splitext(pattern)[1]:
+            pattern += ".md"
+        full_path = os.path.abspath(os.path.join(root, pattern))
+        relative_path = Path(os.path.relpath(full_path, root)).as_posix()
+        if not full_path.startswith(root + os.sep) or not inside(full_path):
+            add(pattern, "Path is outside the vault")
+        elif not os.path.isfile(full_path):
+            add(relative_path, "File not found")
+        else:
+            add(relative_path)
+    return entries
+
+
+async def read_vault_files(
+        patterns: List[str],
+        max_bytes: int = 500_000,
+        max_files: int = 50,
+        vault_path: str = OBSIDIAN_VAULT,
+        executor: Optional[Executor] = None,
+        cache: Optional[ContentCache] = None,
+        index: Optional[VaultIndex] = None) -> List[Dict]:
+    """
+    Read many vault files at once, concurrently, within a total byte budget.
+
+    The budget is handed out in request order: every file gets what is left
+    of it, so the files asked for first are read in full and later ones may
+    be truncated or skipped. The reads then all run concurrently on the
+    executor.
+
+    Args:
+        patterns (List[str]): Paths or glob patterns relative to the vault.
+        max_bytes (int, optional): Total number of bytes to read. Defaults to 500000.
+        max_files (int, optional): Maximum number of files to read. Defaults to 50.
+        vault_path (str, optional): The vault root. Defaults to OBSIDIAN_VAULT.
+        executor (Executor, optional): Thread pool to read on. Defaults to the
+            event loop's default executor.
+        cache (ContentCache, optional): Cache to read files that fit entirely through.
+        index (VaultIndex, optional): Index of the vault to expand globs from.
+
+    Returns:
+        List[Dict]: One entry per file, in request order, with "relative_path",
+            "path", "content", "size", "truncated" and "error" (None on success).
+    """
+    entries = await run_blocking(
+        executor, resolve_vault_paths, patterns, vault_path, max_files, index)
+    readable = [entry for entry in entries if entry["error"] is None]
+
+    sizes = await asyncio.gather(
+        *(run_blocking(executor, os.path.getsize, entry["path"]) for entry in readable),
+        return_exceptions=True)
+
+    remaining = max_bytes
+    for entry, size in zip(readable, sizes):
+        if isinstance(size, Exception):
+            entry["error"] = str(size)
+            continue
+        entry["size"] = size
+        entry["allotted"] = min(size, max(remaining, 0))
+        remaining -= entry["allotted"]
+
+    def read(entry: Dict):
+        if entry["allotted"] == entry["size"] and cache is not None:
+            return cache.read(entry["path"]), False
+        return read_preview(entry["path"], entry["allotted"])
+
+    to_read = [entry for entry in readable
+               if entry["error"] is None and (entry["allotted"] > 0 or entry["size"] == 0)]
+    contents = await asyncio.gather(
+        *(run_blocking(executor, read, entry) for entry in to_read),
+        return_exceptions=True)
+
+    for entry, result in zip(to_read, contents):
+        if isinstance(result, Exception):
+            entry["error"] = str(result)
+        else:
+            entry["content"], entry["truncated"] = result
+
+    for entry in entries:
+        entry.setdefault("size", 0)
+        entry.pop("allotted", None)
+        if entry["error"] is None and "content" not in entry:
+            entry["error"] = "Skipped: byte budget used up"
+        entry.setdefault("content", "")
+        entry.setdefault("truncated", False)
+
+    logger.info(
+        f"Read {sum(1 for e in entries if e['error'] is None)} of {len(entries)} requested vault files")
+    return entries
@@ -0,0 +1,547 @@
+"""
+In-memory index of the markdown files in the Obsidian vault
+"""
+import bisect
+import logging
+import os
+import threading
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from resume_mcp.utils.file_cache import read_preview
+from resume_mcp.utils.fuzzy import rank_filenames, rank_filenames_parallel
+from resume_mcp.utils.vault_walk import VaultWalker
+
+logger = logging.getLogger(__name__)
+
+TRIGRAM_SIZE = 3
+
+# Terms with fewer trigrams are scored against every note. One typo changes
+# at most three trigrams, so a longer term with a single typo still shares
+# one with the note it was meant to match
+MIN_PRUNE_TRIGRAMS = 4
+
+# When fewer notes than this (or than the requested limit) share a trigram
+# with the term, every note is scored instead, so near misses without a
+# shared trigram still fill the results
+MIN_CANDIDATES = 64
+
+# Listener events: a file was added or modified, a file was removed, or the
+# whole index was rebuilt (relative path is None)
+UPSERT = "upsert"
+REMOVE = "remove"
+RESET = "reset"
+
+VaultListener = Callable[[str, Optional[str]], None]
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Split a (lowercased) string into its set of character trigrams.
+
+    Args:
+        text (str): The string to split.
+
+    Returns:
+        Set[str]: All contiguous substrings of length 3. Empty when the string
+            is shorter than that.
+    """
+    return {text[i:i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+
+def normalize_subdir(subdir: Optional[Union[str, Path]]) -> str:
+    """Get a vault subdirectory as a relative POSIX path, "" for the whole vault"""
+    relative_dir = Path(subdir).as_posix().strip("/") if subdir else ""
+    return "" if relative_dir == "." else relative_dir
+
+
+def subdir_prefix(subdir: Optional[Union[str, Path]]) -> str:
+    """Get the prefix shared by the vault-relative paths below a subdirectory"""
+    relative_dir = normalize_subdir(subdir)
+    return f"{relative_dir}/" if relative_dir else ""
+
+
+class VaultIndex:
+    """
+    Filename index of the markdown notes in the vault.
+
+    The vault is walked once and every note's stem is lowercased up front and
+    split into character trigrams. A query of at least MIN_PRUNE_TRIGRAMS
+    trigrams then only scores the notes sharing at least one with the search
+    term instead of the whole vault, unless too few notes do.
+
+    Args:
+        vault_path (str): Root of the vault.
+        executor (Executor, optional): Process pool to shard large candidate
+            sets across. Candidates are scored in-process when omitted.
+        shard_size (int, optional): Candidates per worker task.
+        walker (VaultWalker, optional): Lists the vault's files and decides
+            which are ignored. Defaults to a single-threaded walker with the
+            default ignore list.
+    """
+
+    def __init__(
+            self,
+            vault_path: str,
+            executor: Optional[Executor] = None,
+            shard_size: int = 25_000,
+            walker: Optional[VaultWalker] = None):
+        self.vault_path = Path(vault_path)
+        self.executor = executor
+        self.shard_size = shard_size
+        self.walker = walker if walker is not None else VaultWalker(vault_path, workers=1)
+        self._root = Path(os.path.abspath(vault_path))
+        self._lock = threading.RLock()
+        # Parallel per-file slots; removed files leave a None hole that is
+        # reused by the next added file
+        self._paths: List[Optional[str]] = []
+        self._relative_paths: List[Optional[str]] = []
+        self._stems: List[Optional[str]] = []
+        self._stems_lower: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._trigrams: Dict[str, Set[int]] = {}
+        # Stems too short to produce a trigram are always scored
+        self._short: Set[int] = set()
+        # Every relative path in sorted order, so the files below a directory
+        # form one contiguous range
+        self._sorted: List[str] = []
+        # Slot -> (max_bytes, preview text, truncated)
+        self._previews: Dict[int, Tuple[int, str, bool]] = {}
+        self._generation = 0
+        self._listeners: List[VaultListener] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter bumped on every change to the index.
+
+        Results computed at one generation are stale once it has moved on.
+        """
+        return self._generation
+
+    def subscribe(self, listener: VaultListener):
+        """
+        Register a callback for changes to the index.
+
+        The listener is called with the event (UPSERT, REMOVE or RESET) and the
+        vault-relative path of the file, after the index has been updated.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, event: str, relative_paths: Iterable[Optional[str]]):
+        for relative_path in relative_paths:
+            for listener in self._listeners:
+                try:
+                    listener(event, relative_path)
+                except Exception as e:
+                    logger.error(
+                        f"Vault index listener failed on {event} {relative_path}: {e}")
+
+    def build(self) -> "VaultIndex":
+        """
+        (Re)build the index by walking the vault for markdown files, leaving
+        out ignored directories.
+
+        Returns:
+            VaultIndex: The index itself, for chaining.
+        """
+        with self._lock:
+            self._paths.clear()
+            self._relative_paths.clear()
+            self._stems.clear()
+            self._stems_lower.clear()
+            self._slots.clear()
+            self._free.clear()
+            self._trigrams.clear()
+            self._short.clear()
+            self._previews.clear()
+
+            for relative_path in self.walker.walk():
+                self._add(relative_path, keep_sorted=False)
+            self._sorted = sorted(self._slots)
+            self._generation += 1
+
+        logger.info(
+            f"Indexed {len(self)} markdown files in vault {self.vault_path}")
+        self._notify(RESET, [None])
+        return self
+
+    def _relative(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Get the vault-relative posix path of a file, None if outside the vault"""
+        try:
+            return Path(os.path.abspath(file_path)).relative_to(self._root).as_posix()
+        except ValueError:
+            return None
+
+    def _add(self, relative_path: str, keep_sorted: bool = True) -> int:
+        """
+        Put a file into a free slot and return the slot.
+
+        Bulk additions pass keep_sorted=False and sort the paths once afterwards.
+        """
+        file_path = self.vault_path / relative_path
+        stem_lower = file_path.stem.lower()
+
+        if self._free:
+            slot = self._free.pop()
+            self._paths[slot] = str(file_path)
+            self._relative_paths[slot] = relative_path
+            self._stems[slot] = file_path.stem
+            self._stems_lower[slot] = stem_lower
+        else:
+            slot = len(self._paths)
+            self._paths.append(str(file_path))
+            self._relative_paths.append(relative_path)
+            self._stems.append(file_path.stem)
+            self._stems_lower.append(stem_lower)
+        self._slots[relative_path] = slot
+        if keep_sorted:
+            bisect.insort(self._sorted, relative_path)
+
+        grams = trigrams(stem_lower)
+        if not grams:
+            self._short.add(slot)
+        for gram in grams:
+            self._trigrams.setdefault(gram, set()).add(slot)
+
+        return slot
+
+    def _remove(self, relative_path: str) -> bool:
+        """Free the slot of a file, returning whether it was indexed"""
+        slot = self._slots.pop(relative_path, None)
+        if slot is None:
+            return False
+
+        for gram in trigrams(self._stems_lower[slot]):
+            postings = self._trigrams.get(gram)
+            if postings is not None:
+                postings.discard(slot)
+                if not postings:
+                    del self._trigrams[gram]
+        self._short.discard(slot)
+        self._previews.pop(slot, None)
+        position = bisect.bisect_left(self._sorted, relative_path)
+        if position < len(self._sorted) and self._sorted[position] == relative_path:
+            del self._sorted[position]
+
+        self._paths[slot] = None
+        self._relative_paths[slot] = None
+        self._stems[slot] = None
+        self._stems_lower[slot] = None
+        self._free.append(slot)
+        return True
+
+    def add_file(self, file_path: Union[str, Path]) -> bool:
+        """
+        Add a markdown file to the index, or mark an indexed one as modified.
+
+        Args:
+            file_path (str | Path): Path of the file, e.g. as joined onto OBSIDIAN_VAULT.
+
+        Returns:
+            bool: True if the file is a markdown file inside the vault.
+        """
+        relative_path = self._relative(file_path)
+        if relative_path is None or not relative_path.endswith(".md") or \
+                self.walker.ignored(relative_path):
+            return False
+
+        with self._lock:
+            slot = self._slots.get(relative_path)
+            if slot is None:
+                self._add(relative_path)
+            else:
+                self._previews.pop(slot, None)
+            self._generation += 1
+        self._notify(UPSERT, [relative_path])
+        return True
+
+    def remove_file(self, file_path: Union[str, Path]) -> bool:
+        """
+        Remove a file from the index.
+
+        Returns:
+            bool: True if the file was indexed.
+        """
+        relative_path = self._relative(file_path)
+        if relative_path is None:
+            return False
+
+        with self._lock:
+            removed = self._remove(relative_path)
+            if removed:
+                self._generation += 1
+        if removed:
+            self._notify(REMOVE, [relative_path])
+        return removed
+
+    def move_file(self, src: Union[str, Path], dest: Union[str, Path]) -> bool:
+        """
+        Apply a rename of a file within (or into/out of) the vault.
+
+        Returns:
+            bool: True if the index changed.
+        """
+        removed = self.remove_file(src)
+        added = self.add_file(dest)
+        return removed or added
+
+    def add_tree(self, dir_path: Union[str, Path]) -> int:
+        """
+        Add every markdown file below a directory, e.g. one moved into the vault.
+
+        Returns:
+            int: Number of files newly added.
+        """
+        relative_dir = self._relative(dir_path)
+        if relative_dir is None:
+            return 0
+        added = []
+        with self._lock:
+            for relative_path in self.walker.walk(relative_dir):
+                if relative_path not in self._slots:
+                    self._add(relative_path, keep_sorted=False)
+                    added.append(relative_path)
+            if added:
+                self._sorted = sorted(self._slots)
+                self._generation += 1
+        self._notify(UPSERT, added)
+        return len(added)
+
+    def remove_tree(self, dir_path: Union[str, Path]) -> int:
+        """
+        Remove every indexed file below a directory.
+
+        Returns:
+            int: Number of files removed.
+        """
+        relative_dir = self._relative(dir_path)
+        if relative_dir is None:
+            return 0
+        with self._lock:
+            start, end = self._range(relative_dir)
+            doomed = self._sorted[start:end]
+            for relative_path in doomed:
+                self._remove(relative_path)
+            if doomed:
+                self._generation += 1
+        self._notify(REMOVE, doomed)
+        return len(doomed)
+
+    def _range(self, subdir: Optional[Union[str, Path]]) -> Tuple[int, int]:
+        """Get the bounds of the sorted paths below a directory"""
+        relative_dir = normalize_subdir(subdir)
+        if not relative_dir:
+            return 0, len(self._sorted)
+        # "/" sorts right before "0", so "dir/" <= path < "dir0" holds for
+        # exactly the paths below dir
+        return (bisect.bisect_left(self._sorted, f"{relative_dir}/"),
+                bisect.bisect_left(self._sorted, f"{relative_dir}0"))
+
+    def relative_paths(self, subdir: Optional[Union[str, Path]] = None) -> List[str]:
+        """
+        Get the vault-relative paths of the indexed files, in sorted order.
+
+        Args:
+            subdir (str | PathLike, optional): Only list the files below this
+                vault subdirectory. Found by binary search, so this costs in
+                proportion to the number of files listed.
+
+        Returns:
+            List[str]: The paths.
+        """
+        with self._lock:
+            start, end = self._range(subdir)
+            return self._sorted[start:end]
+
+    def __contains__(self, file_path: Union[str, Path]) -> bool:
+        return self._relative(file_path) in self._slots
+
+    def preview(self, file_path: Union[str, Path], max_bytes: int = 1000) -> Tuple[str, bool]:
+        """
+        Get the beginning of an indexed note.
+
+        Previews are read with a bounded read and cached until the note changes,
+        so showing the same note again does no file I/O.
+
+        Args:
+            file_path (str | Path): Path of the note.
+            max_bytes (int, optional): Maximum number of bytes to read. Defaults to 1000.
+
+        Returns:
+            Tuple[str, bool]: The preview text, and whether the note is longer.
+
+        Raises:
+            OSError: If the note cannot be read.
+        """
+        with self._lock:
+            slot = self._slots.get(self._relative(file_path))
+            generation = self._generation
+            cached = self._previews.get(slot) if slot is not None else None
+        if cached is not None and cached[0] == max_bytes:
+            return cached[1], cached[2]
+
+        text, truncated = read_preview(file_path, max_bytes)
+
+        with self._lock:
+            # Only cache if nothing in the vault changed while we were reading
+            if slot is not None and self._generation == generation:
+                self._previews[slot] = (max_bytes, text, truncated)
+        return text, truncated
+
+    def _candidates(self, term_lower: str, min_candidates: int = 0) -> Iterable[int]:
+        """Get the slots worth scoring for a lowercased search term"""
+        grams = trigrams(term_lower)
+        if len(grams) < MIN_PRUNE_TRIGRAMS:
+            return list(self._slots.values())
+
+        candidates = set(self._short)
+        for gram in grams:
+            candidates.update(self._trigrams.get(gram, ()))
+        if len(candidates) < min_candidates:
+            return list(self._slots.values())
+        return candidates
+
+    def _scoped_candidates(self, term_lower: str, subdir: Optional[str],
+                           min_candidates: int = 0) -> Iterable[int]:
+        """
+        Get the slots worth scoring below a directory.
+
+        Whichever is smaller is walked: the directory's range of sorted paths,
+        checking each for a shared trigram, or the trigram postings, checking
+        each for the directory prefix.
+        """
+        if not subdir:
+            return self._candidates(term_lower, min_candidates)
+        start, end = self._range(subdir)
+        if start == end:
+            return []
+        in_range = [self._slots[path] for path in self._sorted[start:end]]
+        grams = trigrams(term_lower)
+        if len(grams) < MIN_PRUNE_TRIGRAMS:
+            return in_range
+
+        postings = [self._trigrams.get(gram, ()) for gram in grams]
+        if end - start <= sum(map(len, postings)) + len(self._short):
+            candidates = [slot for slot in in_range
+                          if slot in self._short or any(slot in posting for posting in postings)]
+        else:
+            first, last = self._sorted[start], self._sorted[end - 1]
+            candidates = [slot for slot in self._candidates(term_lower)
+                          if first <= self._relative_paths[slot] <= last]
+        if len(candidates) < min_candidates:
+            return in_range
+        return candidates
+
+    def search(
+            self,
+            search_term: str,
+            min_score: int = 60,
+            subdir: Optional[str] = None,
+            limit: Optional[int] = 10,
+            only: Optional[Set[str]] = None) -> List[Dict]:
+        """
+        Fuzzy search the indexed filenames.
+
+        Args:
+            search_term (str): The term to search for
+            min_score (int, optional): Minimum fuzzy match score (0-100). Defaults to 60.
+            subdir (str, optional): Only search below this vault subdirectory.
+            limit (int, optional): Maximum number of results to return, or None
+                for every match. Defaults to 10.
+            only (Set[str], optional): Vault-relative paths of the only notes
+                that may match, e.g. from a metadata filter.
+
+        Returns:
+            List[Dict]: Matches with "score", "path", "filename" and
+                "relative_path" (relative to the searched directory), best first.
+        """
+        with self._lock:
+            return self.resolve(*self.rank(
+                search_term, min_score=min_score, subdir=subdir, limit=limit, only=only),
+                subdir=subdir)
+
+    def rank(
+            self,
+            search_term: str,
+            min_score: int = 60,
+            subdir: Optional[str] = None,
+            limit: Optional[int] = 10,
+            only: Optional[Set[str]] = None) -> Tuple[int, List[Tuple[int, int]]]:
+        """
+        Fuzzy search the indexed filenames, returning slots instead of matches.
+
+        Takes the same arguments as search(). The slots are only meaningful at
+        the returned generation; pass both to resolve() to get the matches.
+
+        Returns:
+            Tuple[int, List[Tuple[int, int]]]: The index generation, and
+                (slot, score) pairs, best first.
+        """
+        term_lower = search_term.lower()
+
+        with self._lock:
+            min_candidates = max(limit or 0, MIN_CANDIDATES)
+            slots = [slot for slot in self._scoped_candidates(term_lower, subdir, min_candidates)
+                     if only is None or self._relative_paths[slot] in only]
+            # Sorted slots keep the order of tied matches stable
+            slots.sort()
+            stems_lower = [self._stems_lower[slot] for slot in slots]
+            if limit is None:
+                limit = len(slots)
+            if self.executor is not None:
+                ranked = rank_filenames_parallel(
+                    self.executor, term_lower, stems_lower,
+                    min_score=min_score, limit=limit, shard_size=self.shard_size)
+            else:
+                ranked = rank_filenames(
+                    term_lower, stems_lower, min_score=min_score, limit=limit)
+            return self._generation, [(slots[i], score) for i, score in ranked]
+
+    def resolve(
+            self,
+            generation: int,
+            ranked: Iterable[Tuple[int, int]],
+            subdir: Optional[str] = None,
+            limit: Optional[int] = None,
+            only: Optional[Set[str]] = None) -> Optional[List[Dict]]:
+        """
+        Turn (slot, score) pairs from rank() into search() matches.
+
+        Args:
+            generation (int): The generation rank() returned.
+            ranked (Iterable[Tuple[int, int]]): The pairs rank() returned.
+            subdir (str, optional): The subdir rank() searched.
+            limit (int, optional): Maximum number of matches to return, or None
+                for every pair.
+            only (Set[str], optional): Vault-relative paths of the only notes
+                that may match.
+
+        Returns:
+            Optional[List[Dict]]: The matches, or None if the index has changed
+                since rank() and the slots may point at other notes.
+        """
+        prefix = subdir_prefix(subdir)
+
+        with self._lock:
+            if generation != self._generation:
+                return None
+            results = []
+            for slot, score in ranked:
+                if limit is not None and len(results) >= limit:
+                    break
+                relative_path = self._relative_paths[slot]
+                if only is not None and relative_path not in only:
+                    continue
+                results.append({
+                    "score": score,
+                    "path": self._paths[slot],
+                    "filename": self._stems[slot],
+                    "relative_path": relative_path[len(prefix):]
+                })
+            return results
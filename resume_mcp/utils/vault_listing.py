@@ -0,0 +1,228 @@
+"""
+Directory-grouped listing of the vault's notes, rendered as markdown
+"""
+import bisect
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from resume_mcp.utils.vault_index import REMOVE, RESET, UPSERT, VaultIndex
+
+logger = logging.getLogger(__name__)
+
+ROOT_GROUP = "Root"
+PAGE_SIZE = 500
+
+
+def _split(relative_path: str) -> Tuple[str, str]:
+    """Split a vault-relative path into its directory group and file name"""
+    directory, _, name = relative_path.rpartition("/")
+    return directory or ROOT_GROUP, name
+
+
+class VaultListing:
+    """
+    The vault's markdown files grouped by directory, kept ready to render.
+
+    Each directory's sorted file names are patched in place on the vault
+    index's events, and each directory's rendered markdown block is cached
+    until a file in it is added or removed. The full listing and its pages
+    are cached until the next such change (edits to a note's contents don't
+    count), so reading them again does no work at all, and re-rendering
+    after a change only joins the cached blocks.
+
+    Args:
+        vault_path (str): Root of the vault, shown in the listing header.
+        page_size (int, optional): Files per page. Defaults to PAGE_SIZE.
+    """
+
+    def __init__(self, vault_path: str, page_size: int = PAGE_SIZE):
+        self.vault_path = Path(vault_path)
+        self.page_size = page_size
+        self._lock = threading.RLock()
+        self._groups: Dict[str, List[str]] = {}
+        # Group names in the order they are rendered
+        self._order: List[str] = []
+        self._blocks: Dict[str, str] = {}
+        self._count = 0
+        # Page -> rendered text, page 0 being the whole listing
+        self._rendered: Dict[int, str] = {}
+        # Start of every page as (group position, offset into the group)
+        self._pages: Optional[List[Tuple[int, int]]] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def build(self, vault_index: VaultIndex) -> "VaultListing":
+        """
+        Group the files of a vault index and follow its changes.
+
+        Args:
+            vault_index (VaultIndex): The filename index of the vault.
+
+        Returns:
+            VaultListing: The listing itself, for chaining.
+        """
+        self._reset(vault_index.relative_paths())
+        vault_index.subscribe(
+            lambda event, relative_path: self.on_vault_event(vault_index, event, relative_path))
+        return self
+
+    def on_vault_event(self, vault_index: VaultIndex, event: str, relative_path: Optional[str]):
+        """Apply a change reported by the vault index"""
+        if event == UPSERT:
+            self.add(relative_path)
+        elif event == REMOVE:
+            self.remove(relative_path)
+        elif event == RESET:
+            self._reset(vault_index.relative_paths())
+
+    def _reset(self, relative_paths: List[str]):
+        with self._lock:
+            self._groups.clear()
+            self._blocks.clear()
+            for relative_path in relative_paths:
+                group, name = _split(relative_path)
+                self._groups.setdefault(group, []).append(name)
+            for names in self._groups.values():
+                names.sort()
+            self._order = sorted(self._groups)
+            self._count = len(relative_paths)
+            self._changed()
+
+    def add(self, relative_path: str) -> bool:
+        """
+        Add a file to its directory group.
+
+        Returns:
+            bool: False if the file was already listed.
+        """
+        group, name = _split(relative_path)
+        with self._lock:
+            names = self._groups.get(group)
+            if names is None:
+                names = self._groups[group] = []
+                bisect.insort(self._order, group)
+            position = bisect.bisect_left(names, name)
+            if position < len(names) and names[position] == name:
+                return False
+            names.insert(position, name)
+            self._count += 1
+            self._blocks.pop(group, None)
+            self._changed()
+        return True
+
+    def remove(self, relative_path: str) -> bool:
+        """
+        Drop a file from its directory group.
+
+        Returns:
+            bool: True if the file was listed.
+        """
+        group, name = _split(relative_path)
+        with self._lock:
+            names = self._groups.get(group, [])
+            position = bisect.bisect_left(names, name)
+            if position == len(names) or names[position] != name:
+                return False
+            del names[position]
+            if not names:
+                del self._groups[group]
+                del self._order[bisect.bisect_left(self._order, group)]
+            self._count -= 1
+            self._blocks.pop(group, None)
+            self._changed()
+        return True
+
+    def _changed(self):
+        self._rendered.clear()
+        self._pages = None
+
+    def _block(self, group: str) -> str:
+        block = self._blocks.get(group)
+        if block is None:
+            block = self._blocks[group] = self._render_group(group, self._groups[group])
+        return block
+
+    @staticmethod
+    def _render_group(group: str, names: List[str], continued: bool = False) -> str:
+        heading = f"{group} (continued)" if continued else group
+        return f"\n## {heading}\n" + "".join(f"- {name}\n" for name in names)
+
+    def _header(self) -> str:
+        return f"""# Obsidian Vault File List
+
+**Vault Path:** {self.vault_path}
+**Total Files:** {self._count}
+
+"""
+
+    def render(self) -> str:
+        """
+        Render the whole listing.
+
+        Returns:
+            str: Markdown with one section per directory, "Root" for the vault root.
+        """
+        with self._lock:
+            text = self._rendered.get(0)
+            if text is None:
+                text = self._rendered[0] = self._header() + "".join(
+                    self._block(group) for group in self._order)
+            return text
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages of the listing (at least 1)"""
+        return max(1, -(-self._count // self.page_size))
+
+    def _page_starts(self) -> List[Tuple[int, int]]:
+        if self._pages is None:
+            starts, filled = [(0, 0)], 0
+            for position, group in enumerate(self._order):
+                offset = 0
+                remaining = len(self._groups[group])
+                while filled + remaining > self.page_size:
+                    offset += self.page_size - filled
+                    remaining -= self.page_size - filled
+                    starts.append((position, offset))
+                    filled = 0
+                filled += remaining
+            self._pages = starts
+        return self._pages
+
+    def render_page(self, page: int) -> Optional[str]:
+        """
+        Render one page of page_size files.
+
+        Every page but the last is full, so a directory can be split across
+        pages; its remainder is continued under a "(continued)" heading.
+
+        Args:
+            page (int): The page number, starting at 1.
+
+        Returns:
+            Optional[str]: The page, or None if there is no such page.
+        """
+        with self._lock:
+            if page < 1 or page > self.page_count:
+                return None
+            text = self._rendered.get(page)
+            if text is not None:
+                return text
+
+            position, offset = self._page_starts()[page - 1]
+            parts = [self._header(), f"**Page:** {page} of {self.page_count}\n"]
+            left = self.page_size
+            while left > 0 and position < len(self._order):
+                group = self._order[position]
+                names = self._groups[group]
+                if offset == 0 and len(names) <= left:
+                    parts.append(self._block(group))
+                else:
+                    parts.append(self._render_group(group, names[offset:offset + left], offset > 0))
+                left -= min(len(names) - offset, left)
+                position, offset = position + 1, 0
+            text = self._rendered[page] = "".join(parts)
+            return text
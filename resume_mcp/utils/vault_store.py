@@ -0,0 +1,315 @@
+"""
+On-disk SQLite FTS5 index of the vault that survives server restarts
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from resume_mcp.utils.chunks import split_chunks
+from resume_mcp.utils.content_index import tokenize
+from resume_mcp.utils.note_metadata import dump_metadata, parse_note
+from resume_mcp.utils.vault_index import REMOVE, RESET, UPSERT, VaultIndex
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS notes USING fts5(
+    body,
+    tokenize = 'unicode61'
+);
+CREATE TABLE IF NOT EXISTS metadata (
+    id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+def fts5_available() -> bool:
+    """Check whether the sqlite3 module was built with FTS5"""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(body)")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
+def content_hash(data: bytes) -> str:
+    """Hash file contents to tell real edits from mere touches"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class VaultStore:
+    """
+    Persistent full-text index of the vault's notes.
+
+    Notes are indexed into an FTS5 table, next to a table of file metadata
+    (path, mtime, size, content hash) and one of each note's parsed
+    properties, tags, links and heading chunks, for MetadataIndex to load.
+    On startup only files whose mtime or size changed since the last run are
+    read again. Searches use FTS5's
+    built-in BM25 ranking and snippets and return the same dicts as
+    ContentIndex.search, so the two are interchangeable.
+
+    Args:
+        db_path (str): Location of the SQLite database file.
+        vault_path (str): Root of the vault the relative paths point into.
+    """
+
+    def __init__(self, db_path: str, vault_path: str):
+        self.db_path = Path(db_path)
+        self.vault_path = Path(vault_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def build(self, vault_index: VaultIndex) -> "VaultStore":
+        """
+        Bring the store in line with a vault index and follow its changes.
+
+        Args:
+            vault_index (VaultIndex): The filename index of the vault.
+
+        Returns:
+            VaultStore: The store itself, for chaining.
+        """
+        self.sync(vault_index.relative_paths())
+        vault_index.subscribe(
+            lambda event, relative_path: self.on_vault_event(vault_index, event, relative_path))
+        return self
+
+    def on_vault_event(self, vault_index: VaultIndex, event: str, relative_path: Optional[str]):
+        """Apply a change reported by the vault index"""
+        if event == UPSERT:
+            self.update(relative_path)
+        elif event == REMOVE:
+            self.remove(relative_path)
+        elif event == RESET:
+            self.sync(vault_index.relative_paths())
+
+    def sync(self, relative_paths: List[str]) -> Dict[str, int]:
+        """
+        Re-index the notes that changed since they were last stored.
+
+        Args:
+            relative_paths (List[str]): Every note currently in the vault.
+
+        Returns:
+            Dict[str, int]: Counts of "unchanged", "updated" and "removed" notes.
+        """
+        stats = {"unchanged": 0, "updated": 0, "removed": 0}
+        with self._transaction():
+            # Notes stored without their metadata, by older versions, are read again
+            known = {path: (mtime_ns, size) if parsed else None
+                     for path, mtime_ns, size, parsed in self._conn.execute(
+                         """
+                         SELECT files.path, files.mtime_ns, files.size, metadata.id IS NOT NULL
+                         FROM files LEFT JOIN metadata ON metadata.id = files.id
+                         """)}
+
+            for relative_path in relative_paths:
+                try:
+                    stat = os.stat(self.vault_path / relative_path)
+                except OSError:
+                    continue
+                if known.pop(relative_path, None) == (stat.st_mtime_ns, stat.st_size):
+                    stats["unchanged"] += 1
+                elif self._update(relative_path):
+                    stats["updated"] += 1
+
+            for relative_path in known:
+                self._remove(relative_path)
+                stats["removed"] += 1
+
+        logger.info(
+            f"Vault store synced: {stats['updated']} updated, "
+            f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+        return stats
+
+    def update(self, relative_path: str) -> bool:
+        """
+        (Re)index a note from disk.
+
+        Returns:
+            bool: True if the note was indexed.
+        """
+        with self._transaction():
+            return self._update(relative_path)
+
+    def remove(self, relative_path: str) -> bool:
+        """
+        Drop a note from the store.
+
+        Returns:
+            bool: True if the note was stored.
+        """
+        with self._transaction():
+            return self._remove(relative_path)
+
+    def _update(self, relative_path: str) -> bool:
+        try:
+            with open(self.vault_path / relative_path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                data = f.read()
+            text = data.decode('utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Cannot index contents of {relative_path}: {e}")
+            self._remove(relative_path)
+            return False
+
+        digest = content_hash(data)
+        row = self._conn.execute(
+            """
+            SELECT files.id, files.hash, metadata.id IS NOT NULL
+            FROM files LEFT JOIN metadata ON metadata.id = files.id
+            WHERE files.path = ?
+            """, (relative_path,)).fetchone()
+
+        if row is None:
+            cursor = self._conn.execute(
+                "INSERT INTO files (path, mtime_ns, size, hash) VALUES (?, ?, ?, ?)",
+                (relative_path, stat.st_mtime_ns, stat.st_size, digest))
+            self._conn.execute(
+                "INSERT INTO notes (rowid, body) VALUES (?, ?)", (cursor.lastrowid, text))
+            self._store_metadata(cursor.lastrowid, data, text)
+            return True
+
+        file_id, old_digest, parsed = row
+        self._conn.execute(
+            "UPDATE files SET mtime_ns = ?, size = ?, hash = ? WHERE id = ?",
+            (stat.st_mtime_ns, stat.st_size, digest, file_id))
+        # A touched but unedited note keeps its full-text entry and metadata
+        if digest != old_digest:
+            self._conn.execute("DELETE FROM notes WHERE rowid = ?", (file_id,))
+            self._conn.execute(
+                "INSERT INTO notes (rowid, body) VALUES (?, ?)", (file_id, text))
+        if digest != old_digest or not parsed:
+            self._store_metadata(file_id, data, text)
+        return True
+
+    def _store_metadata(self, file_id: int, data: bytes, text: str):
+        metadata = parse_note(text)
+        metadata.chunks = split_chunks(data)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO metadata (id, data) VALUES (?, ?)",
+            (file_id, dump_metadata(metadata)))
+
+    def _remove(self, relative_path: str) -> bool:
+        row = self._conn.execute(
+            "SELECT id FROM files WHERE path = ?", (relative_path,)).fetchone()
+        if row is None:
+            return False
+        self._conn.execute("DELETE FROM notes WHERE rowid = ?", row)
+        self._conn.execute("DELETE FROM metadata WHERE id = ?", row)
+        self._conn.execute("DELETE FROM files WHERE id = ?", row)
+        return True
+
+    def load_metadata(self) -> Dict[str, Tuple[Tuple[int, int], str]]:
+        """
+        Get the stored metadata of every note.
+
+        Returns:
+            Dict[str, Tuple[Tuple[int, int], str]]: Vault-relative paths mapped
+                to the (mtime_ns, size) the note was parsed at and its metadata
+                serialized by dump_metadata().
+        """
+        with self._lock:
+            return {path: ((mtime_ns, size), data) for path, mtime_ns, size, data in
+                    self._conn.execute(
+                        """
+                        SELECT files.path, files.mtime_ns, files.size, metadata.data
+                        FROM files JOIN metadata ON metadata.id = files.id
+                        """)}
+
+    def note_metadata(self, relative_path: str) -> Optional[Tuple[Tuple[int, int], str]]:
+        """
+        Get the stored metadata of a note.
+
+        Returns:
+            Optional[Tuple[Tuple[int, int], str]]: The (mtime_ns, size) the note
+                was parsed at and its serialized metadata, or None if not stored.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT files.mtime_ns, files.size, metadata.data
+                FROM files JOIN metadata ON metadata.id = files.id
+                WHERE files.path = ?
+                """, (relative_path,)).fetchone()
+        return ((row[0], row[1]), row[2]) if row is not None else None
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Rank notes against a free-text query with FTS5's BM25.
+
+        Args:
+            query (str): The words to search for.
+            limit (int, optional): Maximum number of results. Defaults to 10.
+
+        Returns:
+            List[Dict]: Hits with "score", "path", "filename", "relative_path"
+                and "snippet", best first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+
+        # Quote every term so user input can't inject FTS5 query syntax
+        match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT files.path, bm25(notes), snippet(notes, 0, '', '', '...', 32)
+                FROM notes JOIN files ON files.id = notes.rowid
+                WHERE notes MATCH ?
+                ORDER BY bm25(notes)
+                LIMIT ?
+                """, (match, limit)).fetchall()
+
+        return [{
+            "score": round(-rank, 3),
+            "path": str(self.vault_path / relative_path),
+            "filename": Path(relative_path).stem,
+            "relative_path": relative_path,
+            "snippet": " ".join(snippet.split())
+        } for relative_path, rank, snippet in rows]
@@ -0,0 +1,264 @@
+"""
+Background watcher that keeps the vault index in sync with the file system
+"""
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from resume_mcp.utils.vault_index import VaultIndex
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) event flags
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal ctypes binding to the Linux inotify API"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c")
+                           or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p,
+                                    ctypes.c_uint32]
+
+        self.fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def add_watch(self, path: str, mask: int) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        return wd
+
+    def read_events(self, timeout: float):
+        """Yield (wd, mask, cookie, name) tuples, waiting up to timeout seconds"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            yield wd, mask, cookie, name
+
+    def close(self):
+        os.close(self.fd)
+
+
+def inotify_available() -> bool:
+    """Check whether the inotify API can be used on this system"""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        _Inotify().close()
+    except (OSError, AttributeError):
+        return False
+    return True
+
+
+class VaultWatcher:
+    """
+    Applies file system changes in the vault to a VaultIndex as they happen.
+
+    Uses inotify where available and falls back to periodically polling the
+    modification times of the vault's markdown files.
+
+    Args:
+        index (VaultIndex): The index to keep up to date.
+        mode (str): "auto", "inotify" or "poll".
+        poll_interval (float): Seconds between polls (and between stop checks).
+    """
+
+    def __init__(self, index: VaultIndex, mode: str = "auto", poll_interval: float = 2.0):
+        self.index = index
+        self.poll_interval = poll_interval
+        if mode == "auto":
+            mode = "inotify" if inotify_available() else "poll"
+        if mode not in ("inotify", "poll"):
+            raise ValueError(f"Unknown vault watch mode: {mode}")
+        self.mode = mode
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify: Optional[_Inotify] = None
+        self._watches: Dict[int, str] = {}
+        self._snapshot_before: Dict[str, Tuple[int, int]] = {}
+
+    def start(self) -> "VaultWatcher":
+        """Start watching in a daemon thread"""
+        # Set up before returning so no change made after start() is missed
+        if self.mode == "inotify":
+            self._inotify = _Inotify()
+            self._watch_tree(self._inotify, self._watches,
+                             str(self.index.vault_path))
+            target = self._run_inotify
+        else:
+            self._snapshot_before = self._snapshot()
+            target = self._run_poll
+
+        self._thread = threading.Thread(
+            target=target, name="vault-watcher", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Watching vault {self.index.vault_path} for changes ({self.mode})")
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop watching and wait for the thread to exit"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout if timeout is not None
+                              else self.poll_interval + 1)
+            self._thread = None
+
+    # inotify backend
+
+    def _run_inotify(self):
+        inotify = self._inotify
+        watches = self._watches
+        try:
+            while not self._stop.is_set():
+                moved_from: Dict[int, Tuple[str, bool]] = {}
+                for wd, mask, cookie, name in inotify.read_events(self.poll_interval):
+                    if mask & IN_Q_OVERFLOW:
+                        logger.warning(
+                            "inotify queue overflowed, rebuilding vault index")
+                        self.index.build()
+                        self._watch_tree(inotify, watches,
+                                         str(self.index.vault_path))
+                        continue
+
+                    parent = watches.get(wd)
+                    if parent is None:
+                        continue
+                    if mask & IN_IGNORED:
+                        watches.pop(wd, None)
+                        continue
+                    if mask & IN_DELETE_SELF:
+                        continue
+
+                    path = os.path.join(parent, name)
+                    is_dir = bool(mask & IN_ISDIR)
+
+                    if mask & IN_MOVED_FROM:
+                        moved_from[cookie] = (path, is_dir)
+                    elif mask & IN_MOVED_TO:
+                        src = moved_from.pop(cookie, None)
+                        if is_dir:
+                            if src is not None:
+                                self.index.remove_tree(src[0])
+                                self._rename_watches(watches, src[0], path)
+                            self._watch_tree(inotify, watches, path)
+                            self.index.add_tree(path)
+                        elif src is not None:
+                            self.index.move_file(src[0], path)
+                        else:
+                            self.index.add_file(path)
+                    elif mask & IN_CREATE:
+                        if is_dir:
+                            # Files may land before the watch is in place
+                            self._watch_tree(inotify, watches, path)
+                            self.index.add_tree(path)
+                        else:
+                            self.index.add_file(path)
+                    elif mask & IN_CLOSE_WRITE:
+                        self.index.add_file(path)
+                    elif mask & IN_DELETE:
+                        if is_dir:
+                            self.index.remove_tree(path)
+                        else:
+                            self.index.remove_file(path)
+
+                # Anything moved out of the vault has no matching IN_MOVED_TO
+                for path, is_dir in moved_from.values():
+                    if is_dir:
+                        self.index.remove_tree(path)
+                    else:
+                        self.index.remove_file(path)
+        except Exception as e:
+            logger.error(f"Vault watcher stopped: {e}")
+        finally:
+            inotify.close()
+
+    def _watch_tree(self, inotify: _Inotify, watches: Dict[int, str], root: str):
+        """Add a watch for a directory and all directories below it"""
+        walker = self.index.walker
+        for dir_path, dir_names, _ in os.walk(root):
+            # Nothing in ignored directories is indexed, so don't watch them
+            relative_dir = Path(os.path.relpath(dir_path, self.index.vault_path))
+            dir_names[:] = [name for name in dir_names
+                            if not walker.ignored((relative_dir / name).as_posix(), is_dir=True)]
+            try:
+                watches[inotify.add_watch(dir_path, WATCH_MASK)] = dir_path
+            except OSError as e:
+                logger.warning(f"Cannot watch {dir_path}: {e}")
+
+    @staticmethod
+    def _rename_watches(watches: Dict[int, str], src: str, dest: str):
+        """Point the watches of a moved directory tree at its new location"""
+        for wd, dir_path in list(watches.items()):
+            if dir_path == src or dir_path.startswith(src + os.sep):
+                watches[wd] = dest + dir_path[len(src):]
+
+    # Polling backend
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Map every markdown file in the vault to its (mtime, size)"""
+        snapshot = {}
+        for relative_path in self.index.walker.walk():
+            file_path = self.index.vault_path / relative_path
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            snapshot[str(file_path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _run_poll(self):
+        previous = self._snapshot_before
+        while not self._stop.wait(self.poll_interval):
+            try:
+                current = self._snapshot()
+            except Exception as e:
+                logger.error(f"Error polling vault for changes: {e}")
+                continue
+
+            for path in previous.keys() - current.keys():
+                self.index.remove_file(path)
+            for path, signature in current.items():
+                if previous.get(path) != signature:
+                    self.index.add_file(path)
+            previous = current
@@ -0,0 +1,221 @@
+"""
+Atomic, write-behind file saves off the request path
+"""
+import logging
+import os
+import stat
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write(path: Union[str, os.PathLike], data: bytes, fsync: bool = True):
+    """
+    Replace a file's contents so readers see either the old or the new file.
+
+    The data is written to a temporary file next to the destination, flushed
+    to disk and renamed over it. A crash part-way leaves at most a stray
+    temporary file, never a truncated destination. An existing file keeps its
+    permission bits.
+
+    Args:
+        path (str | PathLike): The file to create or overwrite.
+        data (bytes): The new contents.
+        fsync (bool, optional): Flush the data to disk before renaming. Defaults to True.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path = os.fspath(path)
+    directory, name = os.path.split(path)
+    # Not .md, so the vault index never picks the temporary file up
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            pass
+        else:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@dataclass
+class _PendingWrite:
+    data: bytes
+    future: Future
+
+
+class VaultWriter:
+    """
+    Background writer that saves files atomically, in the order they were queued.
+
+    write() returns at once with a Future resolving to the written path.
+    Writing the same path again before the first write started replaces the
+    queued contents, so only the last version is written and both callers
+    share one Future. Callers that need the file on disk wait on the Future
+    (or `await asyncio.wrap_future(future)`), everyone else moves on.
+
+    Args:
+        on_written (Callable[[str], Any], optional): Called with every path
+            once it is written, e.g. to add it to the vault index.
+        fsync (bool, optional): Flush every file to disk before renaming it
+            into place. Defaults to True.
+    """
+
+    def __init__(self, on_written: Optional[Callable[[str], object]] = None, fsync: bool = True):
+        self.on_written = on_written
+        self.fsync = fsync
+        self._cond = threading.Condition()
+        self._queue: Deque[str] = deque()
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._active: Optional[str] = None
+        self._closed = False
+        self._stats = {"queued": 0, "coalesced": 0, "written": 0, "failed": 0}
+        self._thread = threading.Thread(target=self._run, name="vault-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, path: Union[str, os.PathLike], content: Union[str, bytes]) -> Future:
+        """
+        Queue a file to be written.
+
+        Args:
+            path (str | PathLike): The file to create or overwrite.
+            content (str | bytes): The new contents; text is encoded as UTF-8.
+
+        Returns:
+            Future: Resolves to the path once the file is written, or raises
+                the OSError that stopped it.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        path = os.path.abspath(os.fspath(path))
+        data = content.encode("utf-8") if isinstance(content, str) else bytes(content)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Vault writer is closed")
+            self._stats["queued"] += 1
+            pending = self._pending.get(path)
+            if pending is not None:
+                pending.data = data
+                self._stats["coalesced"] += 1
+                return pending.future
+            future: Future = Future()
+            self._pending[path] = _PendingWrite(data, future)
+            self._queue.append(path)
+            self._cond.notify_all()
+            return future
+
+    def is_pending(self, path: Union[str, os.PathLike]) -> bool:
+        """Check whether a file is queued or being written"""
+        path = os.path.abspath(os.fspath(path))
+        with self._cond:
+            return path in self._pending or path == self._active
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                path = self._queue.popleft()
+                pending = self._pending.pop(path)
+                self._active = path
+
+            if pending.future.set_running_or_notify_cancel():
+                try:
+                    atomic_write(path, pending.data, fsync=self.fsync)
+                except OSError as e:
+                    logger.error(f"Cannot write {path}: {e}")
+                    self._count("failed")
+                    pending.future.set_exception(e)
+                else:
+                    self._count("written")
+                    if self.on_written is not None:
+                        try:
+                            self.on_written(path)
+                        except Exception as e:
+                            logger.warning(f"Post-write hook failed for {path}: {e}")
+                    pending.future.set_result(path)
+
+            with self._cond:
+                self._active = None
+                self._cond.notify_all()
+
+    def _count(self, key: str):
+        with self._cond:
+            self._stats[key] += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued write has finished.
+
+        Args:
+            timeout (float, optional): Seconds to wait at most. Defaults to no limit.
+
+        Returns:
+            bool: True if nothing is left to write.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and self._active is None, timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """Write everything still queued, then stop the writer thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Vault writer did not finish its queue before shutdown")
+
+    def stats(self) -> Dict[str, int]:
+        """Get counts of queued, coalesced, written and failed writes"""
+        with self._cond:
+            return dict(self._stats, pending=len(self._queue))
+
+
+def write_file(
+        path: Union[str, os.PathLike],
+        content: Union[str, bytes],
+        writer: Optional[VaultWriter] = None) -> Future:
+    """
+    Write a file through a background writer, or atomically right now without one.
+
+    Args:
+        path (str | PathLike): The file to create or overwrite.
+        content (str | bytes): The new contents; text is encoded as UTF-8.
+        writer (VaultWriter, optional): The writer to queue the file on.
+
+    Returns:
+        Future: Resolves to the written path, or raises the error that stopped it.
+            Without a writer it is already done.
+    """
+    if writer is not None:
+        return writer.write(path, content)
+    future: Future = Future()
+    try:
+        atomic_write(path, content.encode("utf-8") if isinstance(content, str) else content)
+    except OSError as e:
+        future.set_exception(e)
+    else:
+        future.set_result(os.path.abspath(os.fspath(path)))
+    return future
@@ -0,0 +1,63 @@
+"""
+Unit tests for heading chunks and budgeted chunk ranking
+"""
+
+from resume_mcp.utils.chunks import Chunk, rank_chunks, read_chunk, split_chunks
+
+
+NOTE = (
+    "intro line\n"
+    "# Experience\n"
+    "Built Python pipelines for machine learning.\n"
+    "```bash\n# not a heading\n```\n"
+    "## Frontend ##\n"
+    "React and TypeScript dashboards. Café UI.\n"
+    "## Empty\n\n"
+    "# Education\n"
+    "MSc Computer Science.\n"
+)
+
+
+def test_split_chunks_byte_offsets(tmp_path):
+    """Test splitting by heading, skipping code fences, with byte offsets"""
+    data = NOTE.encode("utf-8")
+    chunks = split_chunks(data)
+
+    assert [(c.heading, c.level) for c in chunks] == [
+        ("", 0), ("Experience", 1), ("Frontend", 2), ("Empty", 2), ("Education", 1)]
+    assert data[chunks[1].start:chunks[1].end].decode().endswith("```\n")
+
+    path = tmp_path / "note.md"
+    path.write_bytes(data)
+    assert read_chunk(path, chunks[2]) == "## Frontend ##\nReact and TypeScript dashboards. Café UI.\n"
+    assert split_chunks(b"") == []
+
+
+def test_rank_chunks_budget(tmp_path):
+    """Test that the best chunks are returned within the character budget"""
+    path = tmp_path / "note.md"
+    path.write_text(NOTE, encoding="utf-8")
+    chunks = split_chunks(path.read_bytes())
+    notes = [("note.md", path, chunks)]
+
+    results = rank_chunks(notes, "python machine learning", max_chars=1000)
+    assert results[0]["heading"] == "Experience"
+    assert all(r["score"] > 0 for r in results)
+
+    results = rank_chunks(notes, "react python", max_chars=80)
+    assert sum(len(r["text"]) for r in results) <= 80
+    assert len(results) == 1
+
+    results = rank_chunks(notes, "python", max_chars=10)
+    assert results[0]["truncated"] and len(results[0]["text"]) == 10
+
+
+def test_rank_chunks_without_matches(tmp_path):
+    """Test falling back to note order when nothing matches the query"""
+    path = tmp_path / "note.md"
+    path.write_text(NOTE, encoding="utf-8")
+
+    results = rank_chunks([("note.md", path, split_chunks(path.read_bytes()))],
+                          "kubernetes", max_chars=25)
+    assert results[0]["heading"] == "" and results[0]["text"] == "intro line"
+    assert rank_chunks([("note.md", path, [Chunk("x", 1, 0, 5)])], "intro", 0) == []
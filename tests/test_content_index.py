@@ -0,0 +1,102 @@
+"""
+Unit tests for the full-text content index
+"""
+
+import pytest
+
+from resume_mcp.utils.content_index import ContentIndex, make_snippet, tokenize
+from resume_mcp.utils.vault_index import VaultIndex
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a vault whose note names don't give away their contents"""
+    notes = {
+        "Jobs/Posting 1.md": "# Role\nWe are hiring a machine learning engineer to build Python pipelines.",
+        "Jobs/Posting 2.md": "# Role\nFrontend developer, React and TypeScript.",
+        "Experience/Acme.md": "Built Python data pipelines and machine learning models at Acme. Python everywhere.",
+        "Misc/Groceries.md": "Milk, eggs, bread.",
+    }
+    for name, text in notes.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def indexes(vault):
+    """Build the filename and content indexes for the vault"""
+    vault_index = VaultIndex(str(vault)).build()
+    content_index = ContentIndex(str(vault)).build(vault_index)
+    return vault_index, content_index
+
+
+def test_tokenize():
+    """Test tokenizing text into lowercased words"""
+    assert tokenize("Machine-Learning, in Python 3!") == [
+        "machine", "learning", "in", "python"]
+
+
+def test_make_snippet():
+    """Test that snippets are cut around the first matching term"""
+    text = "intro " * 100 + "the Python part" + " outro" * 100
+    snippet = make_snippet(text, ["python"], width=60)
+
+    assert "Python" in snippet
+    assert snippet.startswith("...") and snippet.endswith("...")
+    assert make_snippet("short note", ["missing"]) == "short note"
+
+
+def test_search_ranks_by_bm25(indexes):
+    """Test that notes are ranked by content relevance"""
+    _, content_index = indexes
+
+    results = content_index.search("python machine learning")
+
+    assert [r["relative_path"] for r in results] == [
+        "Experience/Acme.md", "Jobs/Posting 1.md"]
+    assert results[0]["score"] > results[1]["score"]
+    assert results[0]["filename"] == "Acme"
+    assert "Python" in results[0]["snippet"]
+
+
+def test_search_limit_and_no_match(indexes):
+    """Test result limits and queries without hits"""
+    _, content_index = indexes
+
+    assert len(content_index.search("python", limit=1)) == 1
+    assert content_index.search("kubernetes") == []
+    assert content_index.search("   ") == []
+
+
+def test_follows_vault_index_changes(vault, indexes):
+    """Test that adds, edits and removals reach the content index"""
+    vault_index, content_index = indexes
+
+    note = vault / "Jobs" / "Posting 3.md"
+    note.write_text("Kubernetes platform engineer", encoding="utf-8")
+    vault_index.add_file(str(note))
+    assert content_index.search("kubernetes")[0]["filename"] == "Posting 3"
+
+    note.write_text("Rust systems engineer", encoding="utf-8")
+    vault_index.add_file(str(note))
+    assert content_index.search("kubernetes") == []
+    assert content_index.search("rust")[0]["filename"] == "Posting 3"
+
+    vault_index.remove_file(str(note))
+    assert content_index.search("rust") == []
+    assert len(content_index) == 4
+
+
+def test_compaction_keeps_results(tmp_path):
+    """Test that purging replaced documents keeps the index consistent"""
+    content_index = ContentIndex(str(tmp_path))
+    for i in range(200):
+        content_index.update("note.md", f"revision {i} python")
+    content_index.update("other.md", "python java")
+
+    results = content_index.search("python revision")
+    assert [r["relative_path"] for r in results] == ["note.md", "other.md"]
+    assert "revision 199" in results[0]["snippet"]
+    assert len(content_index._doc_paths) < 200
@@ -187,7 +187,7 @@ class TestAutogenerateCv:
 
     @pytest.mark.asyncio
     @patch("resume_mcp.utils.cv.call_anthropic", new_callable=AsyncMock)
-    @patch("resume_mcp.utils.cv.compile_latex")
+    @patch("resume_mcp.utils.cv.compile_latex_async", new_callable=AsyncMock)
     @patch("resume_mcp.utils.cv.save_obsidian_file")
     async def test_autogenerate_cv_success(self, mock_save_obsidian, mock_compile_latex,
                                            mock_call_anthropic, mock_app_context,
@@ -244,7 +244,7 @@ class TestAutogenerateCv:
 
     @pytest.mark.asyncio
     @patch("resume_mcp.utils.cv.call_anthropic", new_callable=AsyncMock)
-    @patch("resume_mcp.utils.cv.compile_latex")
+    @patch("resume_mcp.utils.cv.compile_latex_async", new_callable=AsyncMock)
     @patch("resume_mcp.utils.cv.save_obsidian_file")
     async def test_autogenerate_cv_latex_failure(self, mock_save_obsidian, mock_compile_latex,
                                                  mock_call_anthropic, mock_app_context,
@@ -0,0 +1,89 @@
+"""
+Unit tests for the shared note content cache
+"""
+
+import os
+
+import pytest
+
+from resume_mcp.utils.file_cache import ContentCache, read_preview, utf8_safe_prefix
+
+
+@pytest.fixture
+def notes(tmp_path):
+    """Create three 100-byte notes"""
+    paths = []
+    for name in ["a.md", "b.md", "c.md"]:
+        path = tmp_path / name
+        path.write_text(name[0] * 100, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_hits_and_misses(notes):
+    """Test that repeated reads are served from memory"""
+    cache = ContentCache()
+
+    assert cache.read(notes[0]) == "a" * 100
+    assert cache.read(str(notes[0])) == "a" * 100
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["hit_ratio"] == 0.5
+    assert stats["bytes"] == 100
+
+
+def test_changed_file_is_reread(notes):
+    """Test that a changed mtime or size invalidates the entry"""
+    cache = ContentCache()
+    cache.read(notes[0])
+
+    notes[0].write_text("edited", encoding="utf-8")
+    assert cache.read(notes[0]) == "edited"
+
+    stat = notes[0].stat()
+    os.utime(notes[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.read(notes[0])
+    assert cache.stats()["misses"] == 3
+
+
+def test_lru_eviction_by_bytes(notes):
+    """Test that the least recently used files are evicted over budget"""
+    cache = ContentCache(max_bytes=250)
+    cache.read(notes[0])
+    cache.read(notes[1])
+    cache.read(notes[0])
+    cache.read(notes[2])
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 200
+
+    cache.read(notes[0])
+    assert cache.stats()["hits"] == 2
+    cache.read(notes[1])
+    assert cache.stats()["misses"] == 4
+
+
+def test_missing_file_raises(tmp_path):
+    """Test that read errors propagate like open() does"""
+    with pytest.raises(FileNotFoundError):
+        ContentCache().read(tmp_path / "missing.md")
+
+
+def test_utf8_safe_prefix():
+    """Test that a character cut off at the end is dropped"""
+    data = "caf\u00e9 \u20ac\U0001f600".encode("utf-8")
+    assert utf8_safe_prefix(data) == data
+    assert utf8_safe_prefix(data[:-1]) == "caf\u00e9 \u20ac".encode("utf-8")
+    assert utf8_safe_prefix(data[:-5]) == "caf\u00e9 ".encode("utf-8")
+    assert utf8_safe_prefix(data[:4]) == b"caf"
+
+
+def test_read_preview(tmp_path):
+    """Test bounded previews of short and long files"""
+    note = tmp_path / "note.md"
+    note.write_text("\u00e9" * 10, encoding="utf-8")
+
+    assert read_preview(note, max_bytes=100) == ("\u00e9" * 10, False)
+    assert read_preview(note, max_bytes=5) == ("\u00e9" * 2, True)
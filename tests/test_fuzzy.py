@@ -0,0 +1,72 @@
+"""
+Unit tests for batch fuzzy scoring
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from resume_mcp.utils.fuzzy import (
+    rank_filenames,
+    rank_filenames_parallel,
+    score_batch,
+    top_k
+)
+
+
+def test_score_batch():
+    """Test batch scores and the min_score cutoff"""
+    scores = score_batch("resume", ["resume", "resume-template", "projects"])
+
+    assert scores[0] == 100
+    assert scores[1] == 100
+    assert scores[2] < 60
+
+    cut = score_batch("resume", ["resume", "projects"], min_score=60)
+    assert list(cut) == [100, 0]
+    assert len(score_batch("resume", [])) == 0
+
+
+def test_scores_differ_from_fuzzywuzzy():
+    """Pin the scores and tie order that changed with the move off fuzzywuzzy"""
+    # fuzzywuzzy scored these 50, 33 and 62; the first two now pass min_score=60
+    assert list(score_batch("acme", ["resume"])) == [67]
+    assert list(score_batch("ml eng", ["engine notes"])) == [67]
+    assert list(score_batch("data sci", ["data engineer - globex"])) == [77]
+
+    # Both stems score 100; fuzzywuzzy-era results listed them in vault order
+    assert rank_filenames("resume", ["resume notes", "resume cv"]) == [(1, 100), (0, 100)]
+
+
+def test_top_k():
+    """Test partial selection of the largest keys"""
+    keys = np.array([5, 1, 9, 3, 8, 7])
+
+    assert list(top_k(keys, 3)) == [2, 4, 5]
+    assert list(top_k(keys, 10)) == [2, 4, 5, 0, 3, 1]
+    assert list(top_k(keys, 0)) == []
+
+
+def test_rank_filenames():
+    """Test ranking, limits and the shorter-stem tie break"""
+    stems = ["work-history", "resume-template", "projects", "resume"]
+
+    ranked = rank_filenames("resume", stems, min_score=55)
+    assert ranked[:2] == [(3, 100), (1, 100)]
+    assert all(score > 55 for _, score in ranked)
+
+    assert rank_filenames("resume", stems, min_score=55, limit=1) == [(3, 100)]
+    assert rank_filenames("zzzz", stems, min_score=55) == []
+
+
+def test_rank_filenames_parallel_matches_serial():
+    """Test that sharded ranking merges to the same result as serial ranking"""
+    stems = [f"resume {i}" for i in range(50)] + ["resume"] + \
+        [f"notes {i}" for i in range(50)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = rank_filenames_parallel(
+            executor, "resume", stems, min_score=50, limit=5, shard_size=7)
+
+    assert parallel == rank_filenames("resume", stems, min_score=50, limit=5)
+    assert parallel[0] == (50, 100)
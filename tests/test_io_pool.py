@@ -0,0 +1,76 @@
+"""
+Unit tests for running blocking vault work off the event loop
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from resume_mcp.utils.io_pool import OperationCancelled, check_cancelled, offload, run_blocking
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_calls_overlap_and_keep_context():
+    """Test that concurrent calls run in parallel and see the caller's context"""
+    def blocking(delay):
+        time.sleep(delay)
+        return request_id.get(), threading.current_thread().name
+
+    async def call(i, pool):
+        request_id.set(i)
+        return await run_blocking(pool, blocking, 0.2)
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="vault-io") as pool:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(call(i, pool) for i in range(4)))
+            return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(main())
+
+    assert [r[0] for r in results] == [0, 1, 2, 3]
+    assert all(r[1].startswith("vault-io") for r in results)
+    assert elapsed < 0.6
+
+
+def test_cancellation_reaches_worker():
+    """Test that cancelling the caller stops the worker at its next check"""
+    started, stopped = threading.Event(), threading.Event()
+
+    def long_loop():
+        started.set()
+        try:
+            for _ in range(500):
+                check_cancelled()
+                time.sleep(0.01)
+        except OperationCancelled:
+            stopped.set()
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            task = asyncio.create_task(run_blocking(pool, long_loop))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(main())
+    assert stopped.wait(1)
+    check_cancelled()
+
+
+def test_offload_keeps_signature():
+    """Test that offloaded functions stay introspectable as tools"""
+    @offload(lambda: None)
+    def tool(term: str, limit: int = 10) -> str:
+        """Docs"""
+        return f"{term}:{limit}"
+
+    assert asyncio.iscoroutinefunction(tool)
+    assert tool.__name__ == "tool" and tool.__doc__ == "Docs"
+    assert asyncio.run(tool("x", limit=3)) == "x:3"
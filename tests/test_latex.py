@@ -143,14 +143,14 @@ def test_check_latex_server_response_handling(status_code, expected_available):
     if status_code == 200:
         mock_response.json.return_value = {"pdflatex_available": True}
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         server_status = check_latex_server()
         assert server_status["available"] == expected_available
 
 
 def test_check_latex_server_connection_error():
     """Test that check_latex_server correctly handles connection errors."""
-    with patch("requests.get", side_effect=requests.exceptions.ConnectionError("Connection error")):
+    with patch("requests.Session.get", side_effect=requests.exceptions.ConnectionError("Connection error")):
         server_status = check_latex_server()
         assert not server_status["available"]
         assert "LaTeX server is not running" in server_status["message"]
@@ -182,7 +182,7 @@ def test_compile_latex_http_response_handling(server_response, expected_result_k
                      "details": {"pdflatex_available": True}}
 
     with patch("resume_mcp.utils.latex.check_latex_server", return_value=server_status), \
-            patch("requests.post", return_value=mock_response), \
+            patch("requests.Session.post", return_value=mock_response), \
             patch("builtins.open", MagicMock()), \
             patch("os.path.exists", return_value=True):
 
@@ -218,7 +218,7 @@ def test_compile_latex_http_request_exception():
                      "details": {"pdflatex_available": True}}
 
     with patch("resume_mcp.utils.latex.check_latex_server", return_value=server_status), \
-            patch("requests.post", side_effect=requests.exceptions.RequestException("Network error")):
+            patch("requests.Session.post", side_effect=requests.exceptions.RequestException("Network error")):
 
         result = compile_latex_http("mock latex content", "/tmp/output.pdf")
         assert "error" in result
@@ -231,7 +231,7 @@ def test_compile_latex_http_timeout():
                      "details": {"pdflatex_available": True}}
 
     with patch("resume_mcp.utils.latex.check_latex_server", return_value=server_status), \
-            patch("requests.post", side_effect=requests.exceptions.Timeout("Timeout")):
+            patch("requests.Session.post", side_effect=requests.exceptions.Timeout("Timeout")):
 
         result = compile_latex_http("mock latex content", "/tmp/output.pdf")
         assert "error" in result
@@ -0,0 +1,285 @@
+"""
+Unit tests for the LaTeX server client against a local fake server
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from resume_mcp.utils.latex import (
+    AsyncLatexClient,
+    LatexClient,
+    check_latex_server,
+    check_latex_server_async,
+    compile_latex,
+    compile_latex_async,
+    compile_latex_batch
+)
+from resume_mcp.utils.latex_health import CLOSED, HALF_OPEN, OPEN, LatexHealthMonitor
+from resume_mcp.utils.pdf_cache import PdfCache
+
+
+class FakeLatexServer(ThreadingHTTPServer):
+    """Answers /health and /compile like the dockerized LaTeX server"""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeLatexHandler)
+        self.connections = set()
+        self.requests = []
+        self.healthy = True
+        self.compile_delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeLatexHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.connections.add(self.client_address)
+            self.server.requests.append("GET " + self.path)
+        if self.path == "/health" and self.server.healthy:
+            body = json.dumps({"status": "healthy", "pdflatex_available": True}).encode()
+            self._send(200, body, "application/json")
+        else:
+            self._send(503, b'{"detail": "down"}', "application/json")
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.connections.add(self.client_address)
+            self.server.requests.append("POST " + self.path)
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        if self.server.compile_delay:
+            threading.Event().wait(self.server.compile_delay)
+        with self.server.lock:
+            self.server.in_flight -= 1
+        if "\\undefined" in payload["content"]:
+            self._send(400, b'{"detail": "Undefined control sequence"}', "application/json")
+        else:
+            self._send(200, b"%PDF-" + payload["content"].encode(), "application/pdf")
+
+
+@pytest.fixture
+def latex_server():
+    """Run a fake LaTeX server on a free local port"""
+    server = FakeLatexServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_reuses_connections(latex_server, tmp_path):
+    """Test that repeated checks and compiles go over one kept-alive connection"""
+    with LatexClient(latex_server.url) as client:
+        for i in range(3):
+            assert check_latex_server(client)["available"]
+            result = compile_latex(f"doc {i}", str(tmp_path / f"cv{i}.pdf"), client=client)
+            assert result == {"success": {"dest": str(tmp_path / f"cv{i}.pdf")}}
+
+    assert (tmp_path / "cv2.pdf").read_bytes() == b"%PDF-doc 2"
+    assert len(latex_server.connections) == 1
+
+
+def test_client_reports_errors(latex_server, tmp_path):
+    """Test the error contract for compile failures and an unreachable server"""
+    with LatexClient(latex_server.url) as client:
+        result = compile_latex("\\undefined", str(tmp_path / "bad.pdf"), client=client)
+        assert result == {"error": "LaTeX compilation failed: Undefined control sequence"}
+        assert not (tmp_path / "bad.pdf").exists()
+
+    with LatexClient("http://127.0.0.1:9", connect_timeout=0.5) as client:
+        status = check_latex_server(client)
+        assert not status["available"]
+        assert "error" in compile_latex("doc", str(tmp_path / "cv.pdf"), client=client)
+
+
+def test_compiles_use_cached_health(latex_server, tmp_path):
+    """Test that compiles consult the cached status instead of probing /health"""
+    with LatexClient(latex_server.url) as client:
+        monitor = LatexHealthMonitor(client, ttl=60)
+        for i in range(3):
+            assert "success" in compile_latex(f"doc {i}", str(tmp_path / f"cv{i}.pdf"),
+                                              client=client, monitor=monitor)
+        snapshot = monitor.snapshot()
+
+    assert latex_server.requests == ["GET /health"] + ["POST /compile"] * 3
+    assert snapshot["available"]
+    assert snapshot["circuit"] == CLOSED
+    assert snapshot["latency_ms"] is not None and snapshot["age_seconds"] >= 0
+
+
+def test_circuit_breaker(latex_server, tmp_path):
+    """Test that failures open the circuit, and a trial request closes it again"""
+    with LatexClient(latex_server.url) as client:
+        monitor = LatexHealthMonitor(client, ttl=0, failure_threshold=2, reset_timeout=0.2)
+        latex_server.healthy = False
+        for _ in range(2):
+            assert not monitor.probe()["available"]
+        assert monitor.snapshot()["circuit"] == OPEN
+
+        # Fails fast: no request reaches the server while the circuit is open
+        sent = len(latex_server.requests)
+        result = compile_latex("doc", str(tmp_path / "cv.pdf"), client=client, monitor=monitor)
+        assert "not retrying" in result["error"]
+        assert len(latex_server.requests) == sent
+
+        time.sleep(0.25)
+        latex_server.healthy = True
+        assert monitor._circuit() == HALF_OPEN
+        result = compile_latex("doc", str(tmp_path / "cv.pdf"), client=client, monitor=monitor)
+        assert "success" in result
+        assert monitor.snapshot()["circuit"] == CLOSED
+
+
+def test_closed_circuit_lets_compiles_through(latex_server, tmp_path):
+    """Test that a failed probe below the threshold doesn't block compiles"""
+    with LatexClient(latex_server.url) as client:
+        monitor = LatexHealthMonitor(client, ttl=60, failure_threshold=2)
+        latex_server.healthy = False
+        assert not monitor.probe()["available"]
+        assert monitor.snapshot()["circuit"] == CLOSED
+
+        result = compile_latex("doc", str(tmp_path / "cv.pdf"), client=client, monitor=monitor)
+        assert "success" in result
+        assert monitor.snapshot()["consecutive_failures"] == 0
+
+
+def test_background_probes(latex_server):
+    """Test that the monitor refreshes the status on its own, and readers never probe"""
+    with LatexClient(latex_server.url) as client:
+        monitor = LatexHealthMonitor(client, ttl=0.1).start()
+        time.sleep(0.3)
+        monitor.stop(timeout=1)
+        assert latex_server.requests.count("GET /health") >= 4
+
+        latex_server.requests.clear()
+        monitor = LatexHealthMonitor(client, ttl=60).start()
+        time.sleep(0.1)
+        # Even an out-of-date result is served from the cache while the thread runs
+        monitor._checked_at -= 120
+        assert monitor.snapshot()["available"]
+        monitor.stop(timeout=1)
+
+    assert latex_server.requests == ["GET /health"]
+
+
+@pytest.mark.asyncio
+async def test_async_compiles_run_concurrently(latex_server, tmp_path):
+    """Test that async compiles overlap instead of queueing behind each other"""
+    latex_server.compile_delay = 0.3
+    async with AsyncLatexClient(latex_server.url) as client:
+        assert (await check_latex_server_async(client))["available"]
+        start = time.perf_counter()
+        results = await asyncio.gather(*(
+            compile_latex_async(f"doc {i}", str(tmp_path / f"cv{i}.pdf"), client)
+            for i in range(4)))
+        elapsed = time.perf_counter() - start
+
+    assert results == [{"success": {"dest": str(tmp_path / f"cv{i}.pdf")}} for i in range(4)]
+    assert (tmp_path / "cv3.pdf").read_bytes() == b"%PDF-doc 3"
+    assert elapsed < 4 * 0.3
+
+
+@pytest.mark.asyncio
+async def test_async_client_reports_errors(latex_server, tmp_path):
+    """Test that the async client keeps the error contract of compile_latex"""
+    async with AsyncLatexClient(latex_server.url) as client:
+        result = await compile_latex_async("\\undefined", str(tmp_path / "bad.pdf"), client)
+        assert result == {"error": "LaTeX compilation failed: Undefined control sequence"}
+
+        with LatexClient(latex_server.url) as sync_client:
+            monitor = LatexHealthMonitor(sync_client, failure_threshold=1)
+            latex_server.healthy = False
+            monitor.probe()
+            result = await compile_latex_async("doc", str(tmp_path / "cv.pdf"), client, monitor)
+            assert "not retrying" in result["error"]
+
+    async with AsyncLatexClient("http://127.0.0.1:9", connect_timeout=0.5) as client:
+        assert not (await check_latex_server_async(client))["available"]
+        result = await compile_latex_async("doc", str(tmp_path / "cv.pdf"), client)
+        assert "LaTeX server is not running" in result["error"]
+    assert not (tmp_path / "cv.pdf").exists()
+
+
+@pytest.mark.asyncio
+async def test_compile_cache(latex_server, tmp_path):
+    """Test that identical source is compiled once, and served while the server is down"""
+    cache = PdfCache(tmp_path / "cache")
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    with LatexClient(latex_server.url) as client:
+        assert "success" in compile_latex("doc", str(tmp_path / "a" / "cv.pdf"), client=client, cache=cache)
+        latex_server.healthy = False
+        assert "success" in compile_latex("doc", str(tmp_path / "b" / "cv.pdf"), client=client, cache=cache)
+    async with AsyncLatexClient(latex_server.url) as client:
+        result = await compile_latex_async("doc", str(tmp_path / "cv.pdf"), client, cache=cache)
+        assert result == {"success": {"dest": str(tmp_path / "cv.pdf")}}
+
+    assert latex_server.requests.count("POST /compile") == 1
+    assert (tmp_path / "b" / "cv.pdf").read_bytes() == b"%PDF-doc"
+    assert (tmp_path / "cv.pdf").read_bytes() == b"%PDF-doc"
+    assert cache.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_compiles_with_concurrency_cap(latex_server, tmp_path):
+    """Test that a batch overlaps compiles up to the cap and reports each as it finishes"""
+    latex_server.compile_delay = 0.2
+    items = [(f"doc {i}", str(tmp_path / f"cv{i}.pdf")) for i in range(6)]
+    items[2] = ("\\undefined", str(tmp_path / "bad.pdf"))
+    async with AsyncLatexClient(latex_server.url) as client:
+        start = time.perf_counter()
+        results = [result async for result in compile_latex_batch(items, client, max_concurrency=3)]
+        elapsed = time.perf_counter() - start
+
+    assert sorted(index for index, _ in results) == list(range(6))
+    for index, result in results:
+        if index == 2:
+            assert result == {"error": "LaTeX compilation failed: Undefined control sequence"}
+        else:
+            assert result == {"success": {"dest": items[index][1]}}
+    assert latex_server.max_in_flight == 3
+    # Two rounds of three, not six compiles one after another
+    assert elapsed < 6 * 0.2
+
+
+@pytest.mark.asyncio
+async def test_batch_cancels_on_early_exit(latex_server, tmp_path):
+    """Test that leaving the loop early stops the compiles not yet sent"""
+    latex_server.compile_delay = 0.1
+    items = [(f"doc {i}", str(tmp_path / f"cv{i}.pdf")) for i in range(8)]
+    async with AsyncLatexClient(latex_server.url) as client:
+        batch = compile_latex_batch(items, client, max_concurrency=2)
+        async for index, result in batch:
+            assert "success" in result
+            break
+        await batch.aclose()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        assert tasks == []
+
+    assert latex_server.requests.count("POST /compile") < len(items)
@@ -0,0 +1,86 @@
+"""
+Unit tests for the wikilink graph
+"""
+
+import numpy as np
+import pytest
+
+from resume_mcp.utils.link_graph import LinkGraph, build_csr
+from resume_mcp.utils.note_metadata import MetadataIndex
+from resume_mcp.utils.vault_index import VaultIndex
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a job note linked to experience notes, which link onwards"""
+    notes = {
+        "Jobs/Acme ML.md": "Role needing [[Globex]] and [[Experience/Initech.md|Initech]] work",
+        "Experience/Globex.md": "Kubernetes. See [[Projects/Platform]]",
+        "Experience/Initech.md": "Backend work" + " filler" * 200,
+        "Projects/Platform.md": "Platform project",
+        "Notes/Review.md": "Review of [[Acme ML]]",
+        "Notes/Unrelated.md": "Links to [[Missing note]]",
+    }
+    for name, text in notes.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def graph(vault):
+    vault_index = VaultIndex(str(vault)).build()
+    metadata_index = MetadataIndex(str(vault)).build(vault_index)
+    return vault_index, LinkGraph(str(vault), metadata_index).build(vault_index)
+
+
+def test_build_csr():
+    """Test packing edges into sorted CSR rows"""
+    indptr, indices = build_csr(np.array([2, 0, 0]), np.array([1, 2, 1]), 3)
+
+    assert indptr.tolist() == [0, 2, 2, 3]
+    assert indices.tolist() == [1, 2, 1]
+
+
+def test_neighbors_resolve_names_and_paths(graph):
+    """Test forward links and backlinks with name and path resolution"""
+    _, link_graph = graph
+
+    assert link_graph.neighbors("Jobs/Acme ML.md", direction="forward") == [
+        "Experience/Globex.md", "Experience/Initech.md"]
+    assert link_graph.neighbors("Jobs/Acme ML.md", direction="backward") == ["Notes/Review.md"]
+    assert link_graph.neighbors("Notes/Unrelated.md") == []
+
+
+def test_expand_hops_and_budget(graph):
+    """Test breadth-first expansion under a byte budget"""
+    _, link_graph = graph
+
+    related, skipped = link_graph.expand(["Jobs/Acme ML.md"], hops=1)
+    assert [(r["relative_path"], r["hops"]) for r in related] == [
+        ("Experience/Globex.md", 1), ("Experience/Initech.md", 1), ("Notes/Review.md", 1)]
+    assert related[0]["via"] == "Jobs/Acme ML.md"
+    assert skipped == 0
+
+    related, _ = link_graph.expand(["Jobs/Acme ML.md"], hops=2, direction="forward")
+    assert ("Projects/Platform.md", 2) in [(r["relative_path"], r["hops"]) for r in related]
+
+    related, skipped = link_graph.expand(["Jobs/Acme ML.md"], hops=2, max_bytes=200)
+    assert "Experience/Initech.md" not in [r["relative_path"] for r in related]
+    assert skipped == 1
+    assert sum(r["size"] for r in related) <= 200
+
+
+def test_follows_vault_changes(vault, graph):
+    """Test that new notes resolve dangling links and removals drop edges"""
+    vault_index, link_graph = graph
+
+    note = vault / "Missing note.md"
+    note.write_text("Now it exists", encoding="utf-8")
+    vault_index.add_file(str(note))
+    assert link_graph.neighbors("Notes/Unrelated.md") == ["Missing note.md"]
+
+    vault_index.remove_file(str(vault / "Experience" / "Globex.md"))
+    assert link_graph.neighbors("Jobs/Acme ML.md", direction="forward") == [
+        "Experience/Initech.md"]
@@ -0,0 +1,107 @@
+"""
+Unit tests for the frontmatter, tag and wikilink index
+"""
+
+import pytest
+
+from resume_mcp.utils.note_metadata import (
+    MetadataIndex,
+    parse_filter_list,
+    parse_frontmatter,
+    parse_note
+)
+from resume_mcp.utils.vault_index import VaultIndex
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create job notes with properties, tags and links"""
+    notes = {
+        "Jobs/Acme ML.md": (
+            "---\ncompany: Acme\nstatus: applied\ndate: 2026-03-01\n"
+            "tags: [job, remote]\n---\n# ML Engineer\nSee [[Experience/Globex|Globex]] #jobs/applied\n"),
+        "Jobs/Initech Backend.md": (
+            "---\nstatus: Applied\ndate: 2025-11-20\ntags:\n  - job\n---\n"
+            "Backend role. #jobs/rejected [[Globex]]\n"),
+        "Jobs/Hooli Data.md": "---\nstatus: draft\ndate: 2026-01-10\n---\n#job\n",
+        "Experience/Globex.md": "Kubernetes work. `#notatag` and issue #42\n",
+    }
+    for name, text in notes.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def indexes(vault):
+    vault_index = VaultIndex(str(vault)).build()
+    return vault_index, MetadataIndex(str(vault)).build(vault_index)
+
+
+def test_parse_frontmatter():
+    """Test scalar, inline list and block list properties"""
+    text = "---\nTitle: \"Hello: world\"\ntags: [a, 'b']\naliases:\n  - x\n  - y\nempty:\n---\nbody"
+
+    assert parse_frontmatter(text) == {
+        "title": ["Hello: world"], "tags": ["a", "b"], "aliases": ["x", "y"], "empty": []}
+    assert parse_frontmatter("no frontmatter\n---\n") == {}
+
+
+def test_parse_note_tags_and_links():
+    """Test that tags skip code and numbers and links drop aliases and headings"""
+    metadata = parse_note(
+        "---\ntags: remote, '#Job'\n---\n# Heading\n#Python and (#ml/ops) `#code` #123 "
+        "[[Notes/Plan.md#Goals|plan]] ![[image.png]]")
+
+    assert metadata.tags == {"remote", "job", "python", "ml/ops"}
+    assert metadata.links == {"notes/plan", "image.png"}
+
+
+def test_filter_by_tags_and_properties(indexes):
+    """Test that filters intersect tag and property lookups"""
+    _, metadata_index = indexes
+
+    assert metadata_index.filter(tags=["#job"]) == {
+        "Jobs/Acme ML.md", "Jobs/Initech Backend.md", "Jobs/Hooli Data.md"}
+    assert metadata_index.filter(tags=["jobs"]) == {"Jobs/Acme ML.md", "Jobs/Initech Backend.md"}
+    assert metadata_index.filter(properties=["status=applied"]) == {
+        "Jobs/Acme ML.md", "Jobs/Initech Backend.md"}
+    assert metadata_index.filter(tags=["job"], properties=["status=applied", "date=2026*"]) == {
+        "Jobs/Acme ML.md"}
+    assert metadata_index.filter(properties=["company"]) == {"Jobs/Acme ML.md"}
+    assert metadata_index.filter(tags=["missing"]) == set()
+    assert len(metadata_index.filter()) == 4
+
+
+def test_linked_from(indexes):
+    """Test finding the notes that link to a note by path or by name"""
+    _, metadata_index = indexes
+
+    assert metadata_index.linked_from("Experience/Globex.md") == [
+        "Jobs/Acme ML.md", "Jobs/Initech Backend.md"]
+
+
+def test_follows_changes_and_skips_unchanged(vault, indexes, monkeypatch):
+    """Test live updates and that unchanged notes aren't parsed again"""
+    vault_index, metadata_index = indexes
+
+    note = vault / "Jobs" / "Hooli Data.md"
+    note.write_text("---\nstatus: applied\n---\n#job #onsite\n", encoding="utf-8")
+    vault_index.add_file(str(note))
+    assert metadata_index.filter(tags=["onsite"], properties=["status=applied"]) == {
+        "Jobs/Hooli Data.md"}
+
+    vault_index.remove_file(str(note))
+    assert metadata_index.filter(tags=["onsite"]) == set()
+
+    parsed = []
+    monkeypatch.setattr("resume_mcp.utils.note_metadata.parse_note",
+                        lambda text: parsed.append(text))
+    metadata_index.sync(vault_index.relative_paths())
+    assert parsed == []
+
+
+def test_parse_filter_list():
+    assert parse_filter_list(" job, remote ,,") == ["job", "remote"]
+    assert parse_filter_list(None) == []
@@ -0,0 +1,85 @@
+"""
+Unit tests for the content-addressed PDF cache
+"""
+
+import os
+
+from resume_mcp.utils.pdf_cache import PdfCache, cache_key
+
+
+def test_cache_key():
+    """Test that the key depends on the source and the settings only"""
+    assert cache_key("doc") == cache_key("doc")
+    assert cache_key("doc") != cache_key("doc ")
+    assert cache_key("doc", {"server": "a"}) != cache_key("doc", {"server": "b"})
+    assert cache_key("doc", {"a": "1", "b": "2"}) == cache_key("doc", {"b": "2", "a": "1"})
+
+
+def test_hits_materialize_dest(tmp_path):
+    """Test that a hit puts the cached PDF at dest and counts the bytes saved"""
+    cache = PdfCache(tmp_path / "cache", max_bytes=1024)
+    key = cache_key("doc")
+    dest = tmp_path / "Jobs" / "cv.pdf"
+    dest.parent.mkdir()
+
+    assert not cache.get(key, dest)
+    cache.put(key, b"%PDF-doc")
+    dest.write_bytes(b"old")
+    assert cache.get(key, dest)
+    assert dest.read_bytes() == b"%PDF-doc"
+    assert cache.get(key, tmp_path / "copy.pdf")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["bytes_saved"]) == (2, 1, 16)
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_lru_eviction_and_reload(tmp_path):
+    """Test that the least recently used PDFs go first, and entries survive restarts"""
+    cache = PdfCache(tmp_path / "cache", max_bytes=30)
+    keys = [cache_key(f"doc {i}") for i in range(3)]
+    for key in keys:
+        cache.put(key, b"x" * 10)
+        # Distinct modification times, which order the entries on reload
+        os.utime(cache._path(key), ns=(keys.index(key), keys.index(key)))
+
+    assert cache.get(keys[0], tmp_path / "cv.pdf")
+    cache.put(cache_key("doc 3"), b"x" * 10)
+    assert keys[1] not in cache
+    assert keys[0] in cache and keys[2] in cache
+    assert cache.stats()["evictions"] == 1
+    assert not cache._path(keys[1]).exists()
+
+    reloaded = PdfCache(tmp_path / "cache", max_bytes=20)
+    assert len(reloaded) == 2
+    assert keys[2] not in reloaded
+
+
+def test_unreadable_entries_are_misses(tmp_path):
+    """Test that a cached PDF gone or modified behind the cache's back is a miss"""
+    cache = PdfCache(tmp_path / "cache")
+    key = cache_key("doc")
+    cache.put(key, b"%PDF-doc")
+    dest = tmp_path / "cv.pdf"
+    assert cache.get(key, dest)
+
+    # Destinations are copies: editing one in place leaves the cache alone
+    with open(dest, "r+b") as f:
+        f.write(b"%PDF-new")
+    assert cache.get(key, tmp_path / "again.pdf")
+    assert (tmp_path / "again.pdf").read_bytes() == b"%PDF-doc"
+
+    # A destination that can't be written is a miss, and the entry stays
+    assert not cache.get(key, tmp_path / "missing" / "cv.pdf")
+    assert key in cache
+
+    with open(cache._path(key), "ab") as f:
+        f.write(b" annotated")
+    assert not cache.get(key, tmp_path / "other.pdf")
+    assert key not in cache
+
+    # Evicted by another compile between the lookup and the copy
+    cache.put(key, b"%PDF-doc")
+    os.unlink(cache._path(key))
+    assert not cache.get(key, tmp_path / "other.pdf")
+    assert cache.stats()["misses"] == 3
@@ -0,0 +1,105 @@
+"""
+Unit tests for the memoized fuzzy search cache
+"""
+
+import pytest
+
+from resume_mcp.utils import query_cache
+from resume_mcp.utils.query_cache import QueryCache, normalize_term
+from resume_mcp.utils.vault_index import VaultIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Build an index over a vault of similarly named notes"""
+    for name in ["engineer", "ml engineer", "data engineer", "engine notes",
+                 "Jobs/backend engineer", "groceries"]:
+        path = tmp_path / f"{name}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name, encoding="utf-8")
+    return VaultIndex(str(tmp_path)).build()
+
+
+def test_normalize_term():
+    """Test that case and whitespace don't change the key"""
+    assert normalize_term("  ML   Engineer ") == "ml engineer"
+
+
+def test_slices_match_direct_search(index):
+    """Test that cached answers equal uncached searches for any limit and min_score"""
+    cache = QueryCache()
+    cache.search(index, "engineer", min_score=0, limit=1)
+
+    for min_score in (0, 50, 70, 90):
+        for limit in (1, 3, 10):
+            assert cache.search(index, "Engineer ", min_score=min_score, limit=limit) == \
+                index.search("engineer", min_score=min_score, limit=limit)
+
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 12
+
+
+def test_lower_min_score_and_subdir_miss(index):
+    """Test that a looser min_score or another subdir runs a new search"""
+    cache = QueryCache()
+    cache.search(index, "engineer", min_score=80)
+    cache.search(index, "engineer", min_score=40)
+    cache.search(index, "engineer", min_score=40, subdir="Jobs")
+
+    assert cache.stats()["misses"] == 3
+
+
+def test_index_change_invalidates(index, tmp_path):
+    """Test that a new index generation is not served stale results"""
+    cache = QueryCache()
+    before = cache.search(index, "engineer")
+
+    note = tmp_path / "platform engineer.md"
+    note.write_text("", encoding="utf-8")
+    index.add_file(str(note))
+    after = cache.search(index, "engineer")
+
+    assert len(after) == len(before) + 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_ttl_and_lru(index, monkeypatch):
+    """Test that entries expire and the least recently used are evicted"""
+    now = [100.0]
+    monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+    cache = QueryCache(ttl=10, max_entries=2)
+
+    cache.search(index, "engineer")
+    cache.search(index, "data")
+    cache.search(index, "engineer")
+    cache.search(index, "notes")
+    assert cache.stats()["evictions"] == 1
+
+    cache.search(index, "engineer")
+    assert cache.stats()["hits"] == 2
+
+    now[0] += 11
+    cache.search(index, "engineer")
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["hit_ratio"] == pytest.approx(2 / 6)
+
+
+def test_window_holds_top_matches_only(index):
+    """Test that entries keep a window of slots, and deeper pages search again"""
+    cache = QueryCache(window=2)
+    assert cache.search(index, "engineer", min_score=0, limit=1) == \
+        index.search("engineer", min_score=0, limit=1)
+    _, _, complete, slots, _ = next(iter(cache._entries.values()))
+    assert (complete, len(slots)) == (False, 2)
+
+    assert cache.search(index, "engineer", min_score=0, limit=2) == \
+        index.search("engineer", min_score=0, limit=2)
+    assert cache.search(index, "engineer", min_score=0, limit=4) == \
+        index.search("engineer", min_score=0, limit=4)
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 2)
+
+    only = {"groceries.md", "engine notes.md"}
+    assert cache.search(index, "engineer", min_score=0, limit=2, only=only) == \
+        index.search("engineer", min_score=0, limit=2, only=only)
@@ -0,0 +1,49 @@
+"""
+Unit tests for the paginated search result set cache
+"""
+
+from resume_mcp.utils import result_sets
+from resume_mcp.utils.result_sets import ResultSetCache, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Test that cursors decode back to their set id and offset"""
+    cursor = encode_cursor("abc123", 15)
+
+    assert "abc123" not in cursor
+    assert decode_cursor(cursor) == ("abc123", 15)
+    assert decode_cursor("not a cursor!") is None
+    assert decode_cursor(encode_cursor("abc123", -1)) is None
+
+
+def test_put_and_get():
+    """Test storing and fetching result sets"""
+    cache = ResultSetCache()
+    matches = [{"filename": f"note {i}"} for i in range(3)]
+
+    set_id = cache.put("note", matches)
+    result_set = cache.get(set_id)
+
+    assert result_set.query == "note"
+    assert result_set.matches == matches
+    assert cache.get("unknown") is None
+
+
+def test_expiry_and_eviction(monkeypatch):
+    """Test that result sets expire after the TTL and beyond max_entries"""
+    now = [1000.0]
+    monkeypatch.setattr(result_sets.time, "monotonic", lambda: now[0])
+    cache = ResultSetCache(ttl=60, max_entries=2)
+
+    first = cache.put("a", [])
+    second = cache.put("b", [])
+    cache.get(first)
+    third = cache.put("c", [])
+
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+
+    now[0] += 61
+    assert cache.get(first) is None
+    assert cache.get(third) is None
+    assert len(cache) == 0
@@ -0,0 +1,139 @@
+"""
+Unit tests for the semantic chunk index
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from resume_mcp.utils.semantic import SemanticIndex, embed
+from resume_mcp.utils.vault_index import VaultIndex
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a vault of notes with several sections each"""
+    notes = {
+        "Experience/Acme.md": (
+            "# Acme\nSoftware engineer, 2021-2024.\n"
+            "## Data platform\nBuilt Python data pipelines and trained machine learning models.\n"
+            "## Frontend\nMaintained the React dashboard in TypeScript.\n"),
+        "Experience/Globex.md": (
+            "# Globex\n## Infrastructure\nRan Kubernetes clusters and Terraform modules on AWS.\n"),
+        "Misc/Groceries.md": "Milk, eggs, bread.\n",
+    }
+    vault_path = tmp_path / "vault"
+    for name, text in notes.items():
+        path = vault_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return vault_path
+
+
+@pytest.fixture
+def index_dir(tmp_path):
+    return str(tmp_path / "semantic")
+
+
+def test_embed_is_normalized_and_stable():
+    """Test that embeddings are unit length and deterministic"""
+    vector, n_tokens = embed("python data pipelines", 256)
+
+    assert n_tokens == 3
+    assert np.isclose(np.linalg.norm(vector), 1.0)
+    assert np.array_equal(vector, embed("Python data pipelines", 256)[0])
+    assert not embed("!", 256)[0].any()
+
+
+def test_search_returns_relevant_chunks(vault, index_dir):
+    """Test that the most similar sections rank first"""
+    vault_index = VaultIndex(str(vault)).build()
+    index = SemanticIndex(index_dir, str(vault), dim=1024).build(vault_index)
+
+    results = index.search("Looking for an ML engineer with Python and machine learning pipelines")
+
+    assert results[0]["relative_path"] == "Experience/Acme.md"
+    assert results[0]["heading"] == "Data platform"
+    assert results[0]["text"].startswith("## Data platform")
+    assert index.search("kubernetes terraform")[0]["filename"] == "Globex"
+    assert index.search("   ") == []
+
+
+def test_incremental_sync_across_restarts(vault, index_dir):
+    """Test that a reopened index only re-embeds changed notes"""
+    vault_index = VaultIndex(str(vault)).build()
+    index = SemanticIndex(index_dir, str(vault), dim=1024)
+    assert index.sync(vault_index.relative_paths())["updated"] == 3
+    index.close()
+
+    (vault / "Misc" / "Groceries.md").write_text("# Rust\nSystems programming in Rust.\n",
+                                                 encoding="utf-8")
+    (vault / "Experience" / "Globex.md").unlink()
+    vault_index.build()
+
+    index = SemanticIndex(index_dir, str(vault), dim=1024)
+    stats = index.sync(vault_index.relative_paths())
+
+    assert stats == {"unchanged": 1, "updated": 1, "removed": 1}
+    assert index.search("rust systems")[0]["filename"] == "Groceries"
+    assert index.search("kubernetes terraform") == []
+
+
+def test_follows_vault_index_and_grows(vault, index_dir):
+    """Test live updates, row reuse and growing past the initial capacity"""
+    vault_index = VaultIndex(str(vault)).build()
+    index = SemanticIndex(index_dir, str(vault), dim=1024).build(vault_index)
+
+    for i in range(300):
+        note = vault / "Bulk" / f"note {i}.md"
+        note.parent.mkdir(exist_ok=True)
+        note.write_text(f"# Note {i}\nbulk text number{i}\n", encoding="utf-8")
+        vault_index.add_file(str(note))
+
+    assert len(index) == 306
+    assert index.search("number299")[0]["filename"] == "note 299"
+
+    vault_index.remove_file(str(vault / "Bulk" / "note 299.md"))
+    assert len(index) == 305
+    assert all(r["filename"] != "note 299" for r in index.search("number299"))
+
+
+def test_recovers_from_unsaved_changes(vault, index_dir):
+    """Test that a run ending without a save leaves a consistent index behind"""
+    vault_index = VaultIndex(str(vault)).build()
+    index = SemanticIndex(index_dir, str(vault), dim=1024, save_delay=60)
+    index.sync(vault_index.relative_paths())
+    index.close()
+
+    # Changes the next run never saves, as if it were killed
+    index = SemanticIndex(index_dir, str(vault), dim=1024, save_delay=60)
+    (vault / "Misc" / "Groceries.md").write_text("# Rust\nSystems programming in Rust.\n",
+                                                 encoding="utf-8")
+    index.remove("Experience/Globex.md")
+    index.update("Misc/Groceries.md")
+    index._save_timer.cancel()
+    index._vectors.flush()
+    (vault / "Experience" / "Globex.md").unlink()
+    vault_index.build()
+
+    index = SemanticIndex(index_dir, str(vault), dim=1024)
+    index.sync(vault_index.relative_paths())
+
+    assert np.array_equal(index._df, index._count_df())
+    assert index.search("rust systems")[0]["filename"] == "Groceries"
+    assert index.search("kubernetes terraform") == []
+    assert index.search("react dashboard typescript")[0]["heading"] == "Frontend"
+    index.close()
+
+
+def test_saves_after_changes_settle(vault, index_dir):
+    """Test that live changes are saved without waiting for close()"""
+    vault_index = VaultIndex(str(vault)).build()
+    index = SemanticIndex(index_dir, str(vault), dim=1024, save_delay=0.05).build(vault_index)
+    index.remove("Misc/Groceries.md")
+    assert index._unsaved_path.exists()
+
+    time.sleep(0.3)
+    assert not index._unsaved_path.exists()
+    assert len(SemanticIndex(index_dir, str(vault), dim=1024)) == len(index)
@@ -2,16 +2,21 @@
 Unit tests for Obsidian utility functions
 """
 
+import asyncio
 import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from resume_mcp.utils.file_cache import ContentCache
 from resume_mcp.utils.vault import (
     save_file_to_vault,
     read_vault_file,
-    fuzzy_search_vault_files
+    fuzzy_search_vault_files,
+    read_vault_files,
+    resolve_vault_paths
 )
+from resume_mcp.utils.vault_index import VaultIndex
 
 
 class TestObsidianUtils:
@@ -144,5 +149,75 @@ class TestObsidianUtils:
         assert len(results) == 3
 
 
+@pytest.fixture
+def batch_vault(tmp_path):
+    """Create a vault with a few experience notes of known sizes"""
+    vault = tmp_path / "vault"
+    for name, size in [("Experience/Acme.md", 100), ("Experience/Globex.md", 100),
+                       ("Experience/Initech.md", 100), ("Jobs/ML Engineer.md", 50)]:
+        path = vault / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x" * size, encoding="utf-8")
+    (tmp_path / "secret.md").write_text("outside", encoding="utf-8")
+    return vault
+
+
+def test_resolve_vault_paths(batch_vault):
+    """Test expanding globs, adding .md, deduplicating and rejecting escapes"""
+    entries = resolve_vault_paths(
+        ["Jobs/ML Engineer", "Experience/*.md", "Experience/Acme.md",
+         "../secret.md", "Missing", "Nothing/*"], str(batch_vault))
+
+    assert [(e["relative_path"], e["error"]) for e in entries] == [
+        ("Jobs/ML Engineer.md", None),
+        ("Experience/Acme.md", None),
+        ("Experience/Globex.md", None),
+        ("Experience/Initech.md", None),
+        ("../secret.md", "Path is outside the vault"),
+        ("Missing.md", "File not found"),
+        ("Nothing/*", "No files match this pattern"),
+    ]
+    assert len(resolve_vault_paths(["**/*.md"], str(batch_vault), max_files=2)) == 2
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_resolve_vault_paths_stays_in_vault(batch_vault, use_index):
+    """Test that globs skip ignored directories and nothing resolves outside the vault"""
+    for name in [".obsidian/workspace.md", ".trash/Old.md", ".resume_mcp/notes.md"]:
+        (batch_vault / name).parent.mkdir()
+        (batch_vault / name).write_text("hidden", encoding="utf-8")
+    (batch_vault / "Experience" / "Leak.md").symlink_to(batch_vault.parent / "secret.md")
+    index = VaultIndex(str(batch_vault)).build() if use_index else None
+
+    entries = resolve_vault_paths(
+        ["**/*.md", "*/*.md", "Experience/Leak", ".obsidian/*"], str(batch_vault), index=index)
+
+    assert [(e["relative_path"], e["error"]) for e in entries] == [
+        ("Experience/Acme.md", None),
+        ("Experience/Globex.md", None),
+        ("Experience/Initech.md", None),
+        ("Jobs/ML Engineer.md", None),
+        ("Experience/Leak.md", "Path is outside the vault"),
+        (".obsidian/*", "No files match this pattern"),
+    ]
+
+
+def test_read_vault_files_budget(batch_vault):
+    """Test that the byte budget is handed out in request order"""
+    entries = asyncio.run(read_vault_files(
+        ["Jobs/ML Engineer", "Experience/*", "Missing"], max_bytes=220,
+        vault_path=str(batch_vault), cache=ContentCache()))
+
+    assert [(e["relative_path"], len(e["content"]), e["truncated"]) for e in entries] == [
+        ("Jobs/ML Engineer.md", 50, False),
+        ("Experience/Acme.md", 100, False),
+        ("Experience/Globex.md", 70, True),
+        ("Experience/Initech.md", 0, False),
+        ("Missing.md", 0, False),
+    ]
+    assert entries[3]["error"] == "Skipped: byte budget used up"
+    assert entries[4]["error"] == "File not found"
+
+
 if __name__ == "__main__":
     pytest.main(["-v", "test_obsidian.py"])
@@ -0,0 +1,235 @@
+"""
+Unit tests for the in-memory vault index
+"""
+
+import pytest
+
+from resume_mcp.utils.fuzzy import rank_filenames
+from resume_mcp.utils.vault_index import MIN_CANDIDATES, VaultIndex, subdir_prefix, trigrams
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a small vault with notes in nested folders"""
+    notes = [
+        "resume.md",
+        "resume-template.md",
+        "work-history.md",
+        "Jobs/2026/ML Engineer - Acme.md",
+        "Jobs/2026/Data Engineer - Globex.md",
+        "Jobs/2025/Backend Engineer - Initech.md",
+        "cv.md",
+    ]
+    for note in notes:
+        path = tmp_path / note
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {path.stem}\n", encoding="utf-8")
+    (tmp_path / "image.png").write_bytes(b"not a note")
+    return tmp_path
+
+
+def test_trigrams():
+    """Test splitting strings into trigrams"""
+    assert trigrams("resume") == {"res", "esu", "sum", "ume"}
+    assert trigrams("cv") == set()
+
+
+def test_build_indexes_markdown_only(vault):
+    """Test that only markdown files are indexed"""
+    index = VaultIndex(str(vault)).build()
+
+    assert len(index) == 7
+    assert "Jobs/2026/ML Engineer - Acme.md" in index.relative_paths()
+
+
+def test_build_missing_vault(tmp_path):
+    """Test that a missing vault yields an empty index"""
+    index = VaultIndex(str(tmp_path / "missing")).build()
+
+    assert len(index) == 0
+    assert index.search("resume") == []
+
+
+def test_search_result_shape(vault):
+    """Test that search results keep the fuzzy search dict shape"""
+    index = VaultIndex(str(vault)).build()
+
+    results = index.search("resume", min_score=55)
+
+    assert results[0] == {
+        "score": 100,
+        "path": str(vault / "resume.md"),
+        "filename": "resume",
+        "relative_path": "resume.md",
+    }
+    assert "resume-template" in [r["filename"] for r in results]
+    assert all(results[i]["score"] >= results[i + 1]["score"]
+               for i in range(len(results) - 1))
+
+
+def test_search_min_score_and_limit(vault):
+    """Test min_score filtering and result limits"""
+    index = VaultIndex(str(vault)).build()
+
+    results = index.search("resume", min_score=90)
+    assert {r["filename"] for r in results} == {"resume", "resume-template"}
+    assert len(index.search("engineer", min_score=50, limit=2)) == 2
+
+
+def test_search_subdir(vault):
+    """Test that subdir scopes results and relative paths"""
+    index = VaultIndex(str(vault)).build()
+
+    results = index.search("engineer", min_score=50, subdir="Jobs/2026")
+
+    assert {r["relative_path"] for r in results} == {
+        "ML Engineer - Acme.md", "Data Engineer - Globex.md"}
+
+
+@pytest.mark.parametrize("subdir", [".", "./", "/"])
+def test_search_vault_root_subdir(vault, subdir):
+    """Test that a subdir naming the vault root keeps whole relative paths"""
+    index = VaultIndex(str(vault)).build()
+
+    assert subdir_prefix(subdir) == ""
+    assert index.search("engineer", min_score=50, subdir=subdir) == \
+        index.search("engineer", min_score=50)
+    assert {r["relative_path"] for r in index.search("resume", subdir=subdir)} >= {
+        "resume.md", "resume-template.md"}
+
+
+def test_search_short_terms(vault):
+    """Test that terms and stems shorter than a trigram still match"""
+    index = VaultIndex(str(vault)).build()
+
+    assert index.search("cv", min_score=90)[0]["filename"] == "cv"
+
+
+def test_add_and_remove_file(vault):
+    """Test incremental updates and the generation counter"""
+    index = VaultIndex(str(vault)).build()
+    generation = index.generation
+
+    note = vault / "Jobs" / "Platform Engineer - Hooli.md"
+    note.write_text("# Hooli\n", encoding="utf-8")
+    assert index.add_file(str(note))
+    assert index.generation > generation
+    assert index.search("hooli", min_score=80)[0]["filename"] == note.stem
+
+    assert index.remove_file(str(note))
+    assert index.search("hooli", min_score=80) == []
+    assert len(index) == 7
+
+    # Non-markdown files and files outside the vault are ignored
+    assert not index.add_file(str(vault / "image.png"))
+    assert not index.add_file("/elsewhere/note.md")
+
+
+def test_move_file_reuses_slots(vault):
+    """Test that renames and freed slots keep the index consistent"""
+    index = VaultIndex(str(vault)).build()
+
+    src = vault / "work-history.md"
+    dest = vault / "Archive" / "career-history.md"
+    dest.parent.mkdir()
+    src.rename(dest)
+    assert index.move_file(str(src), str(dest))
+
+    assert str(dest) in index
+    assert str(src) not in index
+    assert index.search("career history", min_score=80)[
+        0]["relative_path"] == "Archive/career-history.md"
+    assert index.search("work-history", min_score=90) == []
+
+
+def test_add_and_remove_tree(vault):
+    """Test adding and removing whole directories"""
+    index = VaultIndex(str(vault)).build()
+
+    assert index.remove_tree(str(vault / "Jobs")) == 3
+    assert index.search("engineer", min_score=60) == []
+
+    assert index.add_tree(str(vault / "Jobs")) == 3
+    assert len(index.search("engineer", min_score=60)) == 3
+
+
+def test_preview_cached_until_changed(vault):
+    """Test that previews are served from the index until the note changes"""
+    index = VaultIndex(str(vault)).build()
+    note = vault / "resume.md"
+    note.write_text("# Resume\n" + "x" * 50, encoding="utf-8")
+
+    text, truncated = index.preview(note, max_bytes=10)
+    assert (text, truncated) == ("# Resume\nx", True)
+
+    note.write_text("edited", encoding="utf-8")
+    assert index.preview(note, max_bytes=10) == ("# Resume\nx", True)
+
+    index.add_file(str(note))
+    assert index.preview(note, max_bytes=10) == ("edited", False)
+
+
+def test_subdir_ranges(vault):
+    """Test that scoped listings and searches only see their directory"""
+    (vault / "Jobs" / "2026-old").mkdir()
+    (vault / "Jobs" / "2026-old" / "ML Engineer - Hooli.md").write_text("old", encoding="utf-8")
+    index = VaultIndex(str(vault)).build()
+    assert index.relative_paths("Jobs/2026") == [
+        "Jobs/2026/Data Engineer - Globex.md",
+        "Jobs/2026/ML Engineer - Acme.md",
+    ]
+
+    # Enough notes that rare terms scan postings and common ones the range
+    for i in range(10):
+        (vault / "Jobs" / "2026" / f"Role {i} Engineer.md").write_text("role", encoding="utf-8")
+    index.add_tree(vault / "Jobs" / "2026")
+
+    assert index.relative_paths("/Jobs/2026/") == index.relative_paths("Jobs/2026")
+    assert index.relative_paths("Missing") == []
+    assert index.relative_paths() == sorted(index.relative_paths())
+
+    # Both the range scan and the postings scan give the full-vault answer
+    for term in ["engineer", "ml", "zz", "acme", "globex"]:
+        expected = [r for r in index.search(term, min_score=0, limit=None)
+                    if r["path"].startswith(str(vault / "Jobs" / "2026") + "/")]
+        scoped = index.search(term, min_score=0, subdir="Jobs/2026", limit=None)
+        assert [r["path"] for r in scoped] == [r["path"] for r in expected]
+        assert all(not r["relative_path"].startswith("Jobs") for r in scoped)
+
+    index.add_file(vault / "Jobs" / "2026" / "AI Engineer - Umbrella.md")
+    index.remove_file(vault / "Jobs" / "2026" / "ML Engineer - Acme.md")
+    assert index.relative_paths("Jobs/2026")[:2] == [
+        "Jobs/2026/AI Engineer - Umbrella.md",
+        "Jobs/2026/Data Engineer - Globex.md",
+    ]
+    assert index.remove_tree(vault / "Jobs" / "2026") == 12
+    assert index.relative_paths("Jobs") == [
+        "Jobs/2025/Backend Engineer - Initech.md",
+        "Jobs/2026-old/ML Engineer - Hooli.md",
+    ]
+
+
+def test_pruned_search_matches_full_scan_on_typos(tmp_path):
+    """Test that trigram pruning returns what scoring every note would on typo queries"""
+    words = ["engineer", "resume", "backend", "platform", "interview", "template",
+             "recruiter", "portfolio", "manager", "analytics", "research", "startup"]
+    for i in range(4):
+        for word in words:
+            for other in words:
+                (tmp_path / f"{word} {other} {i}.md").write_text("", encoding="utf-8")
+    (tmp_path / "jobs.md").write_text("", encoding="utf-8")
+    index = VaultIndex(str(tmp_path)).build()
+    slots = sorted(index._slots.values())
+    stems_lower = [index._stems_lower[slot] for slot in slots]
+
+    # Pruning is in effect for a long term, and skipped for a short one
+    assert len(index._candidates("enginer", MIN_CANDIDATES)) < len(index)
+    assert len(index._candidates("jbos", MIN_CANDIDATES)) == len(index)
+
+    for term in ["enginer", "resmue", "platfrom", "intervew", "portfollio",
+                 "recruter", "analitics", "jbos", "reserch startup"]:
+        for limit in (5, 20):
+            expected = [(score, index._stems[slots[i]])
+                        for i, score in rank_filenames(term, stems_lower, min_score=60, limit=limit)]
+            assert [(match["score"], match["filename"])
+                    for match in index.search(term, min_score=60, limit=limit)] == expected
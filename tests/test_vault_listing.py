@@ -0,0 +1,74 @@
+"""
+Unit tests for the directory-grouped vault listing
+"""
+
+import pytest
+
+from resume_mcp.utils.vault_index import VaultIndex
+from resume_mcp.utils.vault_listing import VaultListing
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a vault with notes at the root and in nested folders"""
+    for name in ["Home.md", "cv.md", "Jobs/2026/ML Engineer.md",
+                 "Jobs/2026/Data Engineer.md", "Experience/Acme.md"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name, encoding="utf-8")
+    return tmp_path
+
+
+def test_render_groups_by_directory(vault):
+    """Test the listing layout and that it is cached until files come or go"""
+    index = VaultIndex(str(vault)).build()
+    listing = VaultListing(str(vault)).build(index)
+
+    text = listing.render()
+    assert text == f"""# Obsidian Vault File List
+
+**Vault Path:** {vault}
+**Total Files:** 5
+
+
+## Experience
+- Acme.md
+
+## Jobs/2026
+- Data Engineer.md
+- ML Engineer.md
+
+## Root
+- Home.md
+- cv.md
+"""
+    assert listing.render() is text
+    index.add_file(vault / "cv.md")
+    assert listing.render() is text
+
+    index.add_file(vault / "Jobs" / "2026" / "AI Engineer.md")
+    index.remove_file(vault / "Experience" / "Acme.md")
+    text = listing.render()
+    assert "## Experience" not in text
+    assert "**Total Files:** 5" in text
+    assert "## Jobs/2026\n- AI Engineer.md\n- Data Engineer.md\n" in text
+
+    index.build()
+    assert "## Experience\n- Acme.md\n" in listing.render()
+
+
+def test_pages_cover_every_file_once(vault):
+    """Test that pages split directories and hold page_size files each"""
+    index = VaultIndex(str(vault)).build()
+    listing = VaultListing(str(vault), page_size=2).build(index)
+
+    assert listing.page_count == 3
+    pages = [listing.render_page(page) for page in range(1, 4)]
+    assert "**Page:** 1 of 3" in pages[0]
+    assert "## Jobs/2026\n- Data Engineer.md\n" in pages[0]
+    assert "## Jobs/2026 (continued)\n- ML Engineer.md\n\n## Root\n- Home.md\n" in pages[1]
+    assert pages[2].endswith("## Root (continued)\n- cv.md\n")
+    assert sum(page.count("\n- ") for page in pages) == 5
+    assert listing.render_page(0) is None
+    assert listing.render_page(4) is None
+    assert listing.render_page(2) is pages[1]
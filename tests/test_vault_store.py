@@ -0,0 +1,126 @@
+"""
+Unit tests for the persistent SQLite vault store
+"""
+
+import os
+
+import pytest
+
+from resume_mcp.utils import note_metadata
+from resume_mcp.utils.note_metadata import MetadataIndex, NoteMetadata
+from resume_mcp.utils.vault_index import VaultIndex
+from resume_mcp.utils.vault_store import VaultStore, fts5_available
+
+pytestmark = pytest.mark.skipif(
+    not fts5_available(), reason="sqlite3 built without FTS5")
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a small vault with a separate database location"""
+    vault_path = tmp_path / "vault"
+    notes = {
+        "Jobs/Posting 1.md": "We are hiring a machine learning engineer to build Python pipelines.",
+        "Experience/Acme.md": "Built Python data pipelines and machine learning models at Acme.",
+        "Misc/Groceries.md": "Milk, eggs, bread.",
+    }
+    for name, text in notes.items():
+        path = vault_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return vault_path
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "index" / "vault_index.db")
+
+
+def test_search_result_shape(vault, db_path):
+    """Test that hits match the in-memory content index format"""
+    store = VaultStore(db_path, str(vault)).build(
+        VaultIndex(str(vault)).build())
+
+    results = store.search("python machine learning")
+
+    assert {r["relative_path"] for r in results} == {
+        "Jobs/Posting 1.md", "Experience/Acme.md"}
+    assert results[0]["score"] >= results[1]["score"]
+    assert results[0]["path"] == str(vault / results[0]["relative_path"])
+    assert "Python" in results[0]["snippet"]
+    assert store.search("kubernetes") == []
+    # FTS5 query syntax in user input is neutralised
+    assert store.search('python" OR NEAR(') != []
+    store.close()
+
+
+def test_restart_only_reindexes_changed_files(vault, db_path):
+    """Test that a reopened store only re-reads changed notes"""
+    vault_index = VaultIndex(str(vault)).build()
+    store = VaultStore(db_path, str(vault))
+    assert store.sync(vault_index.relative_paths()) == {
+        "unchanged": 0, "updated": 3, "removed": 0}
+    store.close()
+
+    # Edit one note, touch another without changing it, delete a third
+    (vault / "Jobs" / "Posting 1.md").write_text("Rust engineer", encoding="utf-8")
+    acme = vault / "Experience" / "Acme.md"
+    stat = acme.stat()
+    os.utime(acme, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (vault / "Misc" / "Groceries.md").unlink()
+    vault_index.build()
+
+    store = VaultStore(db_path, str(vault))
+    assert store.sync(vault_index.relative_paths()) == {
+        "unchanged": 0, "updated": 2, "removed": 1}
+    assert store.sync(vault_index.relative_paths()) == {
+        "unchanged": 2, "updated": 0, "removed": 0}
+
+    assert len(store) == 2
+    assert store.search("rust")[0]["filename"] == "Posting 1"
+    assert store.search("acme")[0]["filename"] == "Acme"
+    assert store.search("milk") == []
+    store.close()
+
+
+def test_follows_vault_index_changes(vault, db_path):
+    """Test that adds and removals reach the store"""
+    vault_index = VaultIndex(str(vault)).build()
+    store = VaultStore(db_path, str(vault)).build(vault_index)
+
+    note = vault / "Jobs" / "Posting 2.md"
+    note.write_text("Kubernetes platform engineer", encoding="utf-8")
+    vault_index.add_file(str(note))
+    assert store.search("kubernetes")[0]["filename"] == "Posting 2"
+
+    vault_index.remove_file(str(note))
+    assert store.search("kubernetes") == []
+    store.close()
+
+
+def test_metadata_index_loads_from_store(vault, db_path, monkeypatch):
+    """Test that a restarted metadata index only parses the notes that changed"""
+    (vault / "Jobs" / "Posting 1.md").write_text(
+        "---\nstatus: applied\n---\n# Role\nPython #job [[Acme]]\n", encoding="utf-8")
+    vault_index = VaultIndex(str(vault)).build()
+    store = VaultStore(db_path, str(vault)).build(vault_index)
+    before = MetadataIndex(str(vault), store=store).build(vault_index)
+    store.close()
+
+    parsed = []
+    monkeypatch.setattr(note_metadata, "parse_note",
+                        lambda text: parsed.append(text) or NoteMetadata())
+    (vault / "Misc" / "Groceries.md").write_text("Milk #errand", encoding="utf-8")
+    vault_index = VaultIndex(str(vault)).build()
+    store = VaultStore(db_path, str(vault)).build(vault_index)
+    after = MetadataIndex(str(vault), store=store).build(vault_index)
+
+    # Only the edited note was parsed, by the store rather than the index
+    assert parsed == []
+    assert after.filter(tags=["errand"]) == {"Misc/Groceries.md"}
+    for relative_path in ("Jobs/Posting 1.md", "Experience/Acme.md"):
+        assert after.metadata(relative_path) == before.metadata(relative_path)
+    assert after.filter(tags=["job"], properties=["status=applied"]) == {"Jobs/Posting 1.md"}
+    assert after.linked_from("Experience/Acme.md") == ["Jobs/Posting 1.md"]
+    assert after.chunks("Jobs/Posting 1.md")[-1].heading == "Role"
+    store.close()
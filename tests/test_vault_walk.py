@@ -0,0 +1,89 @@
+"""
+Unit tests for walking the vault with ignore rules
+"""
+
+import pytest
+
+from resume_mcp.utils.vault_index import VaultIndex
+from resume_mcp.utils.vault_walk import VaultWalker, compile_ignore_rule
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a vault with notes next to Obsidian's and git's own folders"""
+    for name in [
+        "Home.md",
+        "Experience/Acme.md",
+        "Experience/Drafts/Old.md",
+        "Jobs/2026/ML Engineer.md",
+        "Attachments/diagram.excalidraw.md",
+        "Attachments/photo.png",
+        ".obsidian/plugins/dataview/README.md",
+        ".trash/Deleted.md",
+        ".git/info/notes.md",
+        "Archive/.obsidian/Nested.md",
+    ]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("pattern,path,is_dir,expected", [
+    (".obsidian", "Archive/.obsidian", True, True),
+    ("Attachments/", "Attachments", True, True),
+    ("Attachments/", "Attachments", False, False),
+    ("/Drafts", "Experience/Drafts", True, False),
+    ("Experience/Drafts", "Experience/Drafts", True, True),
+    ("*.excalidraw.md", "Attachments/diagram.excalidraw.md", False, True),
+    ("Jobs/**/ML*", "Jobs/2026/ML Engineer.md", False, True),
+    ("**/Old.md", "Old.md", False, True),
+    ("[A-C]*", "Archive", True, True),
+    ("[!A-C]*", "Archive", True, False),
+])
+def test_ignore_patterns(pattern, path, is_dir, expected):
+    """Test .gitignore pattern semantics"""
+    regex, negated, dir_only = compile_ignore_rule(pattern)
+    assert (bool(regex.match(path)) and (is_dir or not dir_only)) == expected
+    assert compile_ignore_rule("# comment") is None
+    assert compile_ignore_rule("  ") is None
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_walk_skips_ignored_directories(vault, workers):
+    """Test that default ignores and the vault's .gitignore are honoured"""
+    (vault / ".gitignore").write_text(
+        "# drafts stay out\nDrafts/\n*.excalidraw.md\n!Keep.excalidraw.md\n", encoding="utf-8")
+    (vault / "Attachments" / "Keep.excalidraw.md").write_text("keep", encoding="utf-8")
+
+    with VaultWalker(str(vault), workers=workers) as walker:
+        assert walker.walk() == [
+            "Attachments/Keep.excalidraw.md",
+            "Experience/Acme.md",
+            "Home.md",
+            "Jobs/2026/ML Engineer.md",
+        ]
+        assert walker.walk("Jobs") == ["Jobs/2026/ML Engineer.md"]
+        assert walker.walk(vault / "Experience") == ["Experience/Acme.md"]
+        assert walker.walk(".obsidian") == []
+        assert walker.walk("Missing") == []
+        assert walker.walk(suffix=".png") == ["Attachments/photo.png"]
+        assert walker.ignored("Experience/Drafts/Old.md")
+        assert not walker.ignored("Experience/Acme.md")
+
+        # Rules follow edits to the .gitignore
+        (vault / ".gitignore").write_text("Jobs/\n", encoding="utf-8")
+        assert "Experience/Drafts/Old.md" in walker.walk()
+        assert "Jobs/2026/ML Engineer.md" not in walker.walk()
+
+
+def test_index_ignores_files(vault):
+    """Test that the vault index never picks up files in ignored directories"""
+    walker = VaultWalker(str(vault), ignore=[".obsidian", ".trash", ".git", "Drafts/"], workers=1)
+    index = VaultIndex(str(vault), walker=walker).build()
+
+    assert len(index) == 4
+    assert not index.add_file(vault / ".obsidian" / "workspace.md")
+    assert not index.add_file(vault / "Experience" / "Drafts" / "New.md")
+    assert index.add_file(vault / "Experience" / "Acme.md")
+    assert index.add_tree(vault / ".trash") == 0
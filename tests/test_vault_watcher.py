@@ -0,0 +1,75 @@
+"""
+Unit tests for the vault watcher
+"""
+
+import time
+
+import pytest
+
+from resume_mcp.utils.vault_index import VaultIndex
+from resume_mcp.utils.vault_watcher import VaultWatcher, inotify_available
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture(params=[
+    "poll",
+    pytest.param("inotify", marks=pytest.mark.skipif(
+        not inotify_available(), reason="inotify not available")),
+])
+def watched_vault(request, tmp_path):
+    """Create a vault, index it and watch it with each backend"""
+    (tmp_path / "Jobs").mkdir()
+    (tmp_path / "Jobs" / "ML Engineer.md").write_text("# ML\n")
+    index = VaultIndex(str(tmp_path)).build()
+    watcher = VaultWatcher(index, mode=request.param,
+                           poll_interval=0.05).start()
+    yield tmp_path, index
+    watcher.stop()
+
+
+def test_watcher_applies_add_rename_delete(watched_vault):
+    """Test that file events reach the index"""
+    vault, index = watched_vault
+
+    note = vault / "Jobs" / "Data Scientist.md"
+    note.write_text("# Data\n")
+    assert wait_for(lambda: str(note) in index)
+
+    renamed = vault / "Data Analyst.md"
+    note.rename(renamed)
+    assert wait_for(lambda: str(renamed) in index and str(note) not in index)
+
+    renamed.unlink()
+    assert wait_for(lambda: str(renamed) not in index)
+    assert index.relative_paths() == ["Jobs/ML Engineer.md"]
+
+
+def test_watcher_follows_new_directories(watched_vault):
+    """Test that notes in newly created directories are indexed"""
+    vault, index = watched_vault
+
+    folder = vault / "Experience"
+    folder.mkdir()
+    note = folder / "Acme.md"
+    note.write_text("# Acme\n")
+    assert wait_for(lambda: str(note) in index)
+
+    moved = vault / "Past Experience"
+    folder.rename(moved)
+    assert wait_for(lambda: str(moved / "Acme.md") in index
+                    and str(note) not in index)
+
+
+def test_unknown_mode(tmp_path):
+    """Test that an unknown watch mode is rejected"""
+    with pytest.raises(ValueError):
+        VaultWatcher(VaultIndex(str(tmp_path)), mode="fsevents")
@@ -0,0 +1,102 @@
+"""
+Unit tests for atomic, write-behind vault saves
+"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from resume_mcp.utils.vault_writer import VaultWriter, atomic_write, write_file
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    """Test that a write replaces the file and leaves no temporary file behind"""
+    path = tmp_path / "note.md"
+    path.write_text("old", encoding="utf-8")
+
+    atomic_write(path, "néw".encode("utf-8"))
+
+    assert path.read_text(encoding="utf-8") == "néw"
+    assert os.listdir(tmp_path) == ["note.md"]
+
+    with pytest.raises(OSError):
+        atomic_write(tmp_path / "missing" / "note.md", b"x")
+    assert os.listdir(tmp_path) == ["note.md"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_atomic_write_keeps_permissions(tmp_path):
+    """Test that overwriting a note keeps its mode, and new files get the umask default"""
+    path = tmp_path / "note.md"
+    path.write_text("old", encoding="utf-8")
+    os.chmod(path, 0o640)
+
+    atomic_write(path, b"new")
+    assert path.stat().st_mode & 0o777 == 0o640
+
+    umask = os.umask(0o022)
+    try:
+        atomic_write(tmp_path / "new.md", b"new")
+    finally:
+        os.umask(umask)
+    assert (tmp_path / "new.md").stat().st_mode & 0o777 == 0o644
+
+
+def test_writes_are_coalesced_and_indexed(tmp_path):
+    """Test that queued writes to one path collapse into the last version"""
+    written = []
+    gate = threading.Event()
+    writer = VaultWriter(on_written=lambda path: (gate.wait(5), written.append(path)), fsync=False)
+    # Hold the writer thread busy so the next writes stay queued
+    blocker = writer.write(tmp_path / "first.md", "first")
+
+    path = tmp_path / "note.md"
+    futures = [writer.write(path, f"version {i}") for i in range(5)]
+    assert writer.is_pending(path)
+    gate.set()
+
+    assert all(f is futures[0] for f in futures)
+    assert futures[0].result(timeout=5) == str(path)
+    assert blocker.result(timeout=5) == str(tmp_path / "first.md")
+    assert path.read_text(encoding="utf-8") == "version 4"
+    assert writer.flush(timeout=5)
+    assert not writer.is_pending(path)
+    assert written == [str(tmp_path / "first.md"), str(path)]
+
+    stats = writer.stats()
+    assert stats["written"] == 2
+    assert stats["coalesced"] == 4
+    writer.close()
+
+
+def test_failures_and_shutdown(tmp_path):
+    """Test that errors reach the caller and close() writes what is queued"""
+    writer = VaultWriter(fsync=False)
+    failed = writer.write(tmp_path / "missing" / "note.md", "x")
+    queued = [writer.write(tmp_path / f"{i}.md", str(i)) for i in range(20)]
+    writer.close()
+
+    with pytest.raises(OSError):
+        failed.result(timeout=5)
+    assert all(f.done() for f in queued)
+    assert (tmp_path / "19.md").read_text(encoding="utf-8") == "19"
+    assert writer.stats()["failed"] == 1
+    with pytest.raises(RuntimeError):
+        writer.write(tmp_path / "late.md", "x")
+
+
+def test_write_file_can_be_awaited(tmp_path):
+    """Test awaiting a write, with and without a background writer"""
+    writer = VaultWriter(fsync=False)
+
+    async def main():
+        queued = await asyncio.wrap_future(write_file(tmp_path / "a.md", "a", writer))
+        direct = await asyncio.wrap_future(write_file(tmp_path / "b.md", "b"))
+        return queued, direct
+
+    assert asyncio.run(main()) == (str(tmp_path / "a.md"), str(tmp_path / "b.md"))
+    assert (tmp_path / "a.md").read_text(encoding="utf-8") == "a"
+    assert write_file(tmp_path / "missing" / "c.md", "c").exception() is not None
+    writer.close()